@@ -1,11 +1,12 @@
 import os
 import re
+import hashlib
 import logging
-import requests
+import atexit
 import threading
 import unicodedata
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request, session, redirect, url_for, flash
+from flask import Flask, render_template, jsonify, request, session, redirect, url_for, flash, make_response, Response
 from werkzeug.security import generate_password_hash, check_password_hash
 from functools import wraps
 from flask_sqlalchemy import SQLAlchemy
@@ -39,72 +40,21 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     "pool_recycle": 300,
     "pool_pre_ping": True,
 }
+if app.config["SQLALCHEMY_DATABASE_URI"] and app.config["SQLALCHEMY_DATABASE_URI"].startswith("postgres"):
+    # Per process. Live streams hold no connection, so this covers page, API and scheduler work
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"].update({
+        "pool_size": int(os.environ.get('DB_POOL_SIZE', 20)),
+        "max_overflow": int(os.environ.get('DB_MAX_OVERFLOW', 40)),
+        "pool_timeout": 10,
+    })
 
 db.init_app(app)
 
-# Team flag URLs mapping using FlagCDN
-TEAM_FLAGS = {
-    'india': 'https://flagcdn.com/48x36/in.png',
-    'new zealand': 'https://flagcdn.com/48x36/nz.png',
-    'australia': 'https://flagcdn.com/48x36/au.png',
-    'england': 'https://flagcdn.com/48x36/gb-eng.png',
-    'pakistan': 'https://flagcdn.com/48x36/pk.png',
-    'south africa': 'https://flagcdn.com/48x36/za.png',
-    'west indies': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/WestIndiesCricketFlagPre1999.svg/48px-WestIndiesCricketFlagPre1999.svg.png',
-    'sri lanka': 'https://flagcdn.com/48x36/lk.png',
-    'bangladesh': 'https://flagcdn.com/48x36/bd.png',
-    'afghanistan': 'https://flagcdn.com/48x36/af.png',
-    'zimbabwe': 'https://flagcdn.com/48x36/zw.png',
-    'ireland': 'https://flagcdn.com/48x36/ie.png',
-    'scotland': 'https://flagcdn.com/48x36/gb-sct.png',
-    'netherlands': 'https://flagcdn.com/48x36/nl.png',
-    'nepal': 'https://flagcdn.com/48x36/np.png',
-    'uae': 'https://flagcdn.com/48x36/ae.png',
-    'usa': 'https://flagcdn.com/48x36/us.png',
-    'oman': 'https://flagcdn.com/48x36/om.png',
-    'ind': 'https://flagcdn.com/48x36/in.png',
-    'nz': 'https://flagcdn.com/48x36/nz.png',
-    'aus': 'https://flagcdn.com/48x36/au.png',
-    'eng': 'https://flagcdn.com/48x36/gb-eng.png',
-    'pak': 'https://flagcdn.com/48x36/pk.png',
-    'sa': 'https://flagcdn.com/48x36/za.png',
-    'wi': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/WestIndiesCricketFlagPre1999.svg/48px-WestIndiesCricketFlagPre1999.svg.png',
-    'sl': 'https://flagcdn.com/48x36/lk.png',
-    'ban': 'https://flagcdn.com/48x36/bd.png',
-    'afg': 'https://flagcdn.com/48x36/af.png',
-    'zim': 'https://flagcdn.com/48x36/zw.png',
-    'ire': 'https://flagcdn.com/48x36/ie.png',
-    'italy': 'https://flagcdn.com/48x36/it.png',
-    'ita': 'https://flagcdn.com/48x36/it.png',
-}
-
-def get_team_flag(team_name):
-    if not team_name:
-        return ''
-    team_lower = team_name.lower().strip()
-    # Direct match
-    if team_lower in TEAM_FLAGS:
-        return TEAM_FLAGS[team_lower]
-    # Partial match - check if any key is in the team name
-    for key in TEAM_FLAGS:
-        if key in team_lower or team_lower in key:
-            return TEAM_FLAGS[key]
-    # Try common abbreviations
-    abbrev_map = {
-        'in': 'india', 'ind-w': 'india', 'india women': 'india',
-        'au': 'australia', 'aus-w': 'australia', 'australia women': 'australia',
-        'en': 'england', 'eng-w': 'england', 'england women': 'england',
-        'pk': 'pakistan', 'pak-w': 'pakistan', 'pakistan women': 'pakistan',
-        'nz-w': 'new zealand', 'new zealand women': 'new zealand',
-        'sa-w': 'south africa', 'south africa women': 'south africa',
-        'wi-w': 'west indies', 'west indies women': 'west indies',
-        'sl-w': 'sri lanka', 'sri lanka women': 'sri lanka',
-        'ban-w': 'bangladesh', 'bangladesh women': 'bangladesh',
-        'afg-w': 'afghanistan', 'afghanistan women': 'afghanistan',
-    }
-    if team_lower in abbrev_map:
-        return TEAM_FLAGS.get(abbrev_map[team_lower], '')
-    return ''
+from team_flags import get_team_flag, init_team_flag_index, refresh_team_flag_index, resolve_team_flag
+from sitemaps import init_sitemaps, get_sitemap_file
+from page_state import PageState, series_schedule, series_match_rows, match_header, match_innings, innings_total, scorecard_players
+from progress import init_progress_store, start_progress, update_progress, finish_progress, get_progress
+from live_stream import init_live_stream, live_hub, ensure_listener
 
 def normalize_score(score):
     """Normalize score to use slash format: 123/4 (5.2 Ov)"""
@@ -124,14 +74,23 @@ def utility_processor():
     return dict(get_team_flag=get_team_flag, normalize_score=normalize_score)
 
 from models import init_models
-TeamCategory, Team, Player, ScrapeLog, ScrapeSetting, ProfileScrapeSetting, SeriesCategory, Series, SeriesScrapeSetting, Match, MatchScrapeSetting, LiveScoreScrapeSetting, PostCategory, Post, AdminUser, Page, Redirect, SiteSettings, PushSubscription, NotificationLog, AutoPostSetting, AutoPostLog = init_models(db)
+from migrations import run_migrations
+TeamCategory, Team, Player, ScrapeLog, ScrapeSetting, ProfileScrapeSetting, SeriesCategory, Series, SeriesScrapeSetting, Match, MatchScrapeSetting, LiveScoreScrapeSetting, PostCategory, Post, AdminUser, Page, Redirect, SiteSettings, PushSubscription, NotificationLog, AutoPostSetting, AutoPostLog, ScrapeJob, ScrapeProgress, ChangeCounter = init_models(db)
+init_team_flag_index(db, Team)
+init_sitemaps(db, PostCategory, Team, Player, Series, Match, Post, Page)
+init_progress_store(db, ScrapeProgress)
+init_live_stream(app, db, Match)
 
 import scraper
-from scheduler import init_scheduler, update_schedule, update_player_schedule, update_category_profile_schedule, update_category_series_schedule, update_category_matches_schedule
+from jobs import job_handler, JobCancelled, enqueue_job, cancel_job, job_to_dict, start_job_workers
+from scheduler import init_scheduler, ingest_matches, apply_live_order, run_roster_scrape, load_slug_index, bulk_upsert_teams, bulk_upsert_players, update_schedule, update_player_schedule, update_category_profile_schedule, update_category_series_schedule, update_category_matches_schedule, MATCH_CHANGE_COUNTER, track_match_changes
+track_match_changes(db, Match)
 
 with app.app_context():
     db.create_all()
     
+    run_migrations(db)
+    
     for slug, info in scraper.CATEGORIES.items():
         existing = TeamCategory.query.filter_by(slug=slug).first()
         if not existing:
@@ -142,6 +101,9 @@ with app.app_context():
         setting = ScrapeSetting(auto_scrape_enabled=False, scrape_time='02:00')
         db.session.add(setting)
     
+    if not ChangeCounter.query.get(MATCH_CHANGE_COUNTER):
+        db.session.add(ChangeCounter(name=MATCH_CHANGE_COUNTER, value=0))
+    
     for slug in ['international', 'domestic', 'league', 'women']:
         if not ProfileScrapeSetting.query.filter_by(category_slug=slug).first():
             ps = ProfileScrapeSetting(category_slug=slug, auto_scrape_enabled=False, scrape_time='03:00')
@@ -177,7 +139,7 @@ with app.app_context():
     
     # Generate slugs for teams/players/series without slugs
     # Get existing slugs first to avoid duplicates
-    existing_team_slugs = set(t.slug for t in Team.query.filter(Team.slug.isnot(None)).all())
+    existing_team_slugs = load_slug_index(db, Team)
     teams_updated = 0
     for team in Team.query.filter(Team.slug.is_(None)).all():
         if team.name:
@@ -186,7 +148,7 @@ with app.app_context():
                 existing_team_slugs.add(team.slug)
             teams_updated += 1
     
-    existing_player_slugs = set(p.slug for p in Player.query.filter(Player.slug.isnot(None)).all())
+    existing_player_slugs = load_slug_index(db, Player)
     players_updated = 0
     for player in Player.query.filter(Player.slug.is_(None)).all():
         if player.name:
@@ -195,7 +157,7 @@ with app.app_context():
                 existing_player_slugs.add(player.slug)
             players_updated += 1
     
-    existing_series_slugs = set(s.slug for s in Series.query.filter(Series.slug.isnot(None)).all())
+    existing_series_slugs = load_slug_index(db, Series)
     series_updated = 0
     for s in Series.query.filter(Series.slug.is_(None)).all():
         if s.name:
@@ -204,7 +166,7 @@ with app.app_context():
                 existing_series_slugs.add(s.slug)
             series_updated += 1
     
-    existing_match_slugs = set(m.slug for m in Match.query.filter(Match.slug.isnot(None)).all())
+    existing_match_slugs = load_slug_index(db, Match)
     matches_updated = 0
     for m in Match.query.filter(Match.slug.is_(None)).all():
         if m.team1_name and m.team2_name:
@@ -230,7 +192,7 @@ def admin_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
-init_scheduler(app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scraper, Player, Match, LiveScoreScrapeSetting, ProfileScrapeSetting, SeriesCategory, Series, SeriesScrapeSetting, MatchScrapeSetting)
+init_scheduler(app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scraper, Player, Match, LiveScoreScrapeSetting, ProfileScrapeSetting, SeriesCategory, Series, SeriesScrapeSetting, MatchScrapeSetting, Post, PostCategory, AutoPostSetting, AutoPostLog)
 
 def upsert_series(series_data, category_id):
     """Insert or update series by series_id"""
@@ -266,161 +228,8 @@ def upsert_match(match_data, db_series_id=None):
     """Insert or update match by match_id"""
     if not match_data.get('match_id'):
         return None
-    
-    existing = Match.query.filter_by(match_id=str(match_data['match_id'])).first()
-    if existing:
-        existing.cricbuzz_series_id = match_data.get('series_id', existing.cricbuzz_series_id)
-        existing.team1_id = match_data.get('team1_id', existing.team1_id)
-        existing.team2_id = match_data.get('team2_id', existing.team2_id)
-        existing.venue_id = match_data.get('venue_id', existing.venue_id)
-        existing.match_format = match_data.get('match_format', existing.match_format)
-        existing.format_type = match_data.get('format_type', existing.format_type)
-        existing.venue = match_data.get('venue', existing.venue)
-        existing.match_date = match_data.get('match_date', existing.match_date)
-        existing.state = match_data.get('status') or match_data.get('state', existing.state)
-        existing.team1_name = match_data.get('team1') or match_data.get('team1_name', existing.team1_name)
-        existing.team1_score = match_data.get('team1_score', existing.team1_score)
-        existing.team2_name = match_data.get('team2') or match_data.get('team2_name', existing.team2_name)
-        existing.team2_score = match_data.get('team2_score', existing.team2_score)
-        existing.result = match_data.get('result', existing.result)
-        existing.match_url = match_data.get('match_url', existing.match_url)
-        existing.series_name = match_data.get('series_name', existing.series_name)
-        if db_series_id:
-            existing.series_id = db_series_id
-        if match_data.get('batting'):
-            existing.batting_data = match_data.get('batting')
-        if match_data.get('bowling'):
-            existing.bowling_data = match_data.get('bowling')
-        if not existing.slug and existing.team1_name and existing.team2_name:
-            match_title = f"{existing.team1_name} vs {existing.team2_name}"
-            if existing.series_name:
-                match_title += f" {existing.series_name}"
-            match_title += f" {existing.match_id}"
-            existing.slug = generate_slug(match_title)
-        return existing
-    else:
-        team1 = match_data.get('team1') or match_data.get('team1_name', '')
-        team2 = match_data.get('team2') or match_data.get('team2_name', '')
-        series_name = match_data.get('series_name', '')
-        match_id_val = str(match_data['match_id'])
-        match_slug = None
-        if team1 and team2:
-            match_title = f"{team1} vs {team2}"
-            if series_name:
-                match_title += f" {series_name}"
-            match_title += f" {match_id_val}"
-            match_slug = generate_slug(match_title)
-        new_match = Match(
-            match_id=str(match_data['match_id']),
-            slug=match_slug,
-            cricbuzz_series_id=match_data.get('series_id', ''),
-            team1_id=match_data.get('team1_id', ''),
-            team2_id=match_data.get('team2_id', ''),
-            venue_id=match_data.get('venue_id', ''),
-            match_format=match_format,
-            format_type=match_data.get('format_type', ''),
-            venue=match_data.get('venue', ''),
-            match_date=match_data.get('match_date', ''),
-            match_time=match_data.get('match_time', ''),
-            start_date=match_data.get('start_date', ''),
-            end_date=match_data.get('end_date', ''),
-            state=match_data.get('status') or match_data.get('state', ''),
-            team1_name=team1,
-            team1_score=match_data.get('team1_score', ''),
-            team2_name=team2,
-            team2_score=match_data.get('team2_score', ''),
-            result=match_data.get('result', ''),
-            match_url=match_data.get('match_url', ''),
-            series_name=match_data.get('series_name', ''),
-            series_id=db_series_id,
-            batting_data=match_data.get('batting'),
-            bowling_data=match_data.get('bowling')
-        )
-        db.session.add(new_match)
-        return new_match
-
-def upsert_team(team_data, category_id):
-    """Insert or update team by team_id"""
-    if not team_data.get('team_id'):
-        return None
-    
-    existing_slugs = set(t.slug for t in Team.query.filter(Team.slug.isnot(None)).all())
-    
-    existing = Team.query.filter_by(team_id=team_data['team_id']).first()
-    if existing:
-        existing.name = team_data.get('name', existing.name)
-        existing.flag_url = team_data.get('flag_url', existing.flag_url)
-        existing.team_url = team_data.get('team_url', existing.team_url)
-        existing.category_id = category_id
-        if not existing.slug and existing.name:
-            existing.slug = generate_slug(existing.name, existing_slugs)
-        return existing
-    else:
-        team_name = team_data.get('name', '')
-        new_slug = generate_slug(team_name, existing_slugs) if team_name else None
-        new_team = Team(
-            team_id=team_data['team_id'],
-            name=team_name,
-            slug=new_slug,
-            flag_url=team_data.get('flag_url'),
-            team_url=team_data.get('team_url'),
-            category_id=category_id
-        )
-        db.session.add(new_team)
-        return new_team
-
-def upsert_player(player_data, db_team_id):
-    """Insert or update player by player_id"""
-    if not player_data.get('player_id'):
-        return None
-    
-    existing_slugs = set(p.slug for p in Player.query.filter(Player.slug.isnot(None)).all())
-    
-    existing = Player.query.filter_by(player_id=player_data['player_id']).first()
-    if existing:
-        existing.name = player_data.get('name', existing.name)
-        existing.role = player_data.get('role', existing.role)
-        existing.photo_url = player_data.get('photo_url', existing.photo_url)
-        existing.player_url = player_data.get('player_url', existing.player_url)
-        existing.team_id = db_team_id
-        if not existing.slug and existing.name:
-            existing.slug = generate_slug(existing.name, existing_slugs)
-        return existing
-    else:
-        player_name = player_data.get('name', '')
-        new_slug = generate_slug(player_name, existing_slugs) if player_name else None
-        new_player = Player(
-            player_id=player_data['player_id'],
-            name=player_name,
-            slug=new_slug,
-            role=player_data.get('role'),
-            photo_url=player_data.get('photo_url'),
-            player_url=player_data.get('player_url'),
-            team_id=db_team_id
-        )
-        db.session.add(new_player)
-        return new_player
-
-def get_team_flag_from_list(team_name, teams_list):
-    """Find team flag by partial name matching - fallback to get_team_flag if not found in DB"""
-    if not team_name:
-        return None
-    team_name_lower = team_name.lower().strip()
-    
-    for team in teams_list:
-        if not team.flag_url:
-            continue
-        db_name = team.name.lower() if team.name else ''
-        if db_name == team_name_lower:
-            return team.flag_url
-        if db_name and db_name in team_name_lower:
-            return team.flag_url
-        if team_name_lower.startswith(db_name.split()[0] if db_name else ''):
-            return team.flag_url
-    
-    # Fallback to get_team_flag dictionary lookup
-    flag = get_team_flag(team_name)
-    return flag if flag else None
+    ingest_matches(db, Match, [match_data], db_series_id)
+    return Match.query.filter_by(match_id=str(match_data['match_id'])).first()
 
 @app.route('/robots.txt')
 def robots_txt():
@@ -436,282 +245,253 @@ def ads_txt():
         content = ""
     return Response(content, mimetype='text/plain')
 
+def sitemap_response(name):
+    """Serve a cached sitemap: gzip as stored, or streamed inflated for clients without gzip"""
+    from flask import Response, send_file, abort
+    import gzip
+    path = get_sitemap_file(name)
+    if not path:
+        abort(404)
+    
+    if 'gzip' in request.accept_encodings:
+        response = send_file(path, mimetype='application/xml', conditional=True, max_age=3600)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        def generate():
+            with gzip.open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(64 * 1024), b''):
+                    yield chunk
+        response = Response(generate(), mimetype='application/xml')
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
 @app.route('/sitemap.xml')
 def sitemap_index():
-    """Sitemap index file that links to all category sitemaps"""
-    from flask import Response
-    from datetime import datetime
-    
-    base_url = "https://cricbuzz-score.com"
-    today = datetime.utcnow().strftime('%Y-%m-%d')
-    
-    sitemaps = [
-        {'loc': f"{base_url}/sitemap-main.xml", 'lastmod': today},
-        {'loc': f"{base_url}/sitemap-teams.xml", 'lastmod': today},
-        {'loc': f"{base_url}/sitemap-players.xml", 'lastmod': today},
-        {'loc': f"{base_url}/sitemap-series.xml", 'lastmod': today},
-        {'loc': f"{base_url}/sitemap-matches.xml", 'lastmod': today},
-        {'loc': f"{base_url}/sitemap-posts.xml", 'lastmod': today},
-        {'loc': f"{base_url}/sitemap-pages.xml", 'lastmod': today},
-    ]
-    
-    xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    xml_content += '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    
-    for sitemap in sitemaps:
-        xml_content += '  <sitemap>\n'
-        xml_content += f'    <loc>{sitemap["loc"]}</loc>\n'
-        xml_content += f'    <lastmod>{sitemap["lastmod"]}</lastmod>\n'
-        xml_content += '  </sitemap>\n'
-    
-    xml_content += '</sitemapindex>'
-    
-    return Response(xml_content, mimetype='application/xml')
-
-@app.route('/sitemap-main.xml')
-def sitemap_main():
-    """Main pages sitemap - homepage, live scores, categories"""
-    from flask import Response
-    
-    base_url = "https://cricbuzz-score.com"
-    pages = []
-    
-    pages.append({'loc': base_url, 'priority': '1.0', 'changefreq': 'hourly'})
-    pages.append({'loc': f"{base_url}/live-scores", 'priority': '1.0', 'changefreq': 'always'})
-    pages.append({'loc': f"{base_url}/recent-matches", 'priority': '0.9', 'changefreq': 'hourly'})
-    pages.append({'loc': f"{base_url}/teams", 'priority': '0.9', 'changefreq': 'weekly'})
-    pages.append({'loc': f"{base_url}/series", 'priority': '0.9', 'changefreq': 'daily'})
-    
-    categories = PostCategory.query.all()
-    for cat in categories:
-        pages.append({'loc': f"{base_url}/category/{cat.slug}", 'priority': '0.8', 'changefreq': 'daily'})
-    
-    return generate_sitemap_response(pages)
-
-@app.route('/sitemap-teams.xml')
-def sitemap_teams():
-    """Teams sitemap"""
-    from flask import Response
-    
-    base_url = "https://cricbuzz-score.com"
-    pages = []
-    
-    teams = Team.query.all()
-    for team in teams:
-        team_slug = team.slug or str(team.id)
-        pages.append({'loc': f"{base_url}/team/{team_slug}", 'priority': '0.7', 'changefreq': 'weekly'})
-    
-    return generate_sitemap_response(pages)
-
-@app.route('/sitemap-players.xml')
-def sitemap_players():
-    """Players sitemap"""
-    from flask import Response
-    
-    base_url = "https://cricbuzz-score.com"
-    pages = []
-    
-    players = Player.query.all()
-    for player in players:
-        player_slug = player.slug or str(player.id)
-        pages.append({'loc': f"{base_url}/player/{player_slug}", 'priority': '0.6', 'changefreq': 'weekly'})
-    
-    return generate_sitemap_response(pages)
-
-@app.route('/sitemap-series.xml')
-def sitemap_series():
-    """Series sitemap"""
-    from flask import Response
-    
-    base_url = "https://cricbuzz-score.com"
-    pages = []
-    
-    series_list = Series.query.all()
-    for s in series_list:
-        series_slug = s.slug or str(s.id)
-        pages.append({'loc': f"{base_url}/series/{series_slug}", 'priority': '0.8', 'changefreq': 'daily'})
-    
-    return generate_sitemap_response(pages)
-
-@app.route('/sitemap-matches.xml')
-def sitemap_matches():
-    """Matches sitemap - all scraped/stored matches"""
-    base_url = "https://cricbuzz-score.com"
-    pages = []
-
-    today = datetime.utcnow().strftime('%Y-%m-%d')
-
-    # Static recent-matches listing page
-    pages.append({'loc': f"{base_url}/recent-matches", 'priority': '0.9', 'changefreq': 'hourly'})
+    """Sitemap index listing every section shard"""
+    return sitemap_response('sitemap.xml')
+
+@app.route('/sitemap-<name>.xml')
+def sitemap_section(name):
+    """Section sitemaps (main, teams, players, series, matches, posts, pages); shards 2+ as sitemap-<section>-<n>.xml"""
+    return sitemap_response(f'sitemap-{name}.xml')
+
+def live_pages_from_db():
+    """Serve public live pages from the Match table while the live-score job keeps it fresh"""
+    mode = os.environ.get('LIVE_PAGES_SOURCE', 'auto').lower()
+    if mode == 'db':
+        return True
+    if mode == 'scrape':
+        return False
+    setting = LiveScoreScrapeSetting.query.first()
+    if not setting or not setting.auto_scrape_enabled or not setting.last_scrape:
+        return False
+    max_age = max((setting.interval_seconds or 60) * 3, 180)
+    return (datetime.utcnow() - setting.last_scrape).total_seconds() < max_age
+
+def match_card_from_db(m, state=None):
+    """Build the template match dict from a Match row"""
+    return {
+        'match_id': m.match_id,
+        'slug': m.slug,
+        'match_format': m.series_name or m.match_format or 'Match',
+        'series_name': m.series_name or '',
+        'team1_name': m.team1_name or 'Team 1',
+        'team2_name': m.team2_name or 'Team 2',
+        'team1_score': m.team1_score or '',
+        'team2_score': m.team2_score or '',
+        'state': state or ('Preview' if m.state == 'Upcoming' else m.state) or 'Live',
+        'result': m.result or '',
+        'team1_flag': m.team1_flag or '',
+        'team2_flag': m.team2_flag or ''
+    }
 
-    # Individual match detail pages from DB
-    matches = Match.query.filter(Match.slug.isnot(None)).all()
-    for m in matches:
-        lastmod = m.updated_at.strftime('%Y-%m-%d') if m.updated_at else today
-        pages.append({
-            'loc': f"{base_url}/cricket-match/{m.slug}",
-            'lastmod': lastmod,
-            'priority': '0.8',
-            'changefreq': 'daily'
+def get_live_match_cards(limit=None):
+    """Live-page matches in Cricbuzz container order, from the DB or the scrape cache"""
+    if live_pages_from_db():
+        query = Match.query.filter(Match.live_order.isnot(None)).order_by(Match.live_order)
+        if limit:
+            query = query.limit(limit)
+        return [match_card_from_db(m) for m in query.all()]
+    
+    scrape_result = scraper.get_live_scores_cached()
+    if not scrape_result.get('success'):
+        return []
+    
+    scraped = scrape_result.get('matches', [])[:limit] if limit else scrape_result.get('matches', [])
+    match_ids = [str(m.get('match_id')) for m in scraped if m.get('match_id')]
+    slugs = dict(db.session.query(Match.match_id, Match.slug).filter(Match.match_id.in_(match_ids)).all()) if match_ids else {}
+    
+    cards = []
+    for m in scraped:
+        cards.append({
+            'match_id': m.get('match_id'),
+            'slug': slugs.get(str(m.get('match_id'))),
+            'match_format': m.get('series_name', 'Match'),
+            'series_name': m.get('series_name', ''),
+            'team1_name': m.get('team1_name', 'Team 1'),
+            'team2_name': m.get('team2_name', 'Team 2'),
+            'team1_score': m.get('team1_score', ''),
+            'team2_score': m.get('team2_score', ''),
+            'state': m.get('state', 'Live'),
+            'result': m.get('result', ''),
+            'team1_flag': m.get('team1_flag', ''),
+            'team2_flag': m.get('team2_flag', '')
         })
+    return cards
+
+def get_recent_match_cards(limit=20):
+    """Recently completed matches, from the DB or the scrape cache"""
+    if live_pages_from_db():
+        rows = Match.query.filter(Match.state == 'Complete').order_by(Match.updated_at.desc()).limit(limit).all()
+        return [match_card_from_db(m, state='Complete') for m in rows]
+    
+    recent_result = scraper.get_recent_matches_cached()
+    if not recent_result.get('success'):
+        return []
+    
+    scraped = recent_result.get('matches', [])[:limit]
+    match_ids = [str(m.get('match_id')) for m in scraped if m.get('match_id')]
+    slugs = dict(db.session.query(Match.match_id, Match.slug).filter(Match.match_id.in_(match_ids)).all()) if match_ids else {}
+    
+    cards = []
+    for m in scraped:
+        cards.append({
+            'match_id': m.get('match_id'),
+            'slug': slugs.get(str(m.get('match_id'))),
+            'match_format': m.get('series_name') or m.get('match_format') or 'Match',
+            'series_name': m.get('series_name', ''),
+            'team1_name': m.get('team1_name', 'Team 1'),
+            'team2_name': m.get('team2_name', 'Team 2'),
+            'team1_score': m.get('team1_score', ''),
+            'team2_score': m.get('team2_score', ''),
+            'state': 'Complete',
+            'result': m.get('result', ''),
+            'team1_flag': m.get('team1_flag', ''),
+            'team2_flag': m.get('team2_flag', '')
+        })
+    return cards
+
+def collect_match_flags(cards):
+    """Map '<match_id>_1'/'<match_id>_2' to team flag URLs for templates"""
+    flags = {}
+    for m in cards:
+        if m.get('team1_flag'):
+            flags[f"{m.get('match_id')}_1"] = m.get('team1_flag')
+        if m.get('team2_flag'):
+            flags[f"{m.get('match_id')}_2"] = m.get('team2_flag')
+    return flags
+
+def scorecard_tables(innings):
+    """Per-team (batting_data, bowling_data) tables from scorecard innings"""
+    batting_data = []
+    bowling_data = []
+    for inning in innings:
+        team_name = inning.get('team_name', '')
+        batting_data.append({
+            'team': team_name,
+            'batsmen': inning.get('batting', [])
+        })
+        bowling_data.append({
+            'team': team_name,
+            'bowlers': inning.get('bowling', [])
+        })
+    return batting_data, bowling_data
 
-    return generate_sitemap_response(pages)
-
-@app.route('/sitemap-posts.xml')
-def sitemap_posts():
-    """Posts/Blog sitemap"""
-    from flask import Response
-    
-    base_url = "https://cricbuzz-score.com"
-    pages = []
-    
-    posts = Post.query.filter_by(is_published=True).all()
-    for post in posts:
-        pages.append({'loc': f"{base_url}/post/{post.slug}", 'priority': '0.7', 'changefreq': 'daily'})
-    
-    return generate_sitemap_response(pages)
-
-@app.route('/sitemap-pages.xml')
-def sitemap_static_pages():
-    """Static pages sitemap"""
-    from flask import Response
-    
-    base_url = "https://cricbuzz-score.com"
-    pages = []
-    
-    static_pages = Page.query.filter_by(is_published=True).all()
-    for page in static_pages:
-        pages.append({'loc': f"{base_url}/page/{page.slug}", 'priority': '0.5', 'changefreq': 'monthly'})
-    
-    return generate_sitemap_response(pages)
+def scorecard_from_db(m):
+    """A completed match's saved scorecard in scrape_scorecard's shape, or None"""
+    if not m or not m.innings_data or m.state not in scraper.SCORECARD_COMPLETE_STATES:
+        return None
+    return {
+        'success': True,
+        'from_db': True,
+        'match_id': m.match_id,
+        'match_status': m.state,
+        'team1': m.team1_name,
+        'team2': m.team2_name,
+        'team1_score': m.team1_score,
+        'team2_score': m.team2_score,
+        'venue': m.venue,
+        'match_date': m.match_date,
+        'match_time': m.match_time,
+        'match_format': m.match_format,
+        'series_name': m.series_name,
+        'result': m.result,
+        'toss': m.toss,
+        'live_status': m.live_status,
+        'innings': m.innings_data
+    }
 
-def generate_sitemap_response(pages):
-    """Helper function to generate sitemap XML response"""
-    from flask import Response
-    
-    xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    xml_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    
-    for page in pages:
-        xml_content += '  <url>\n'
-        xml_content += f'    <loc>{page["loc"]}</loc>\n'
-        if 'lastmod' in page:
-            xml_content += f'    <lastmod>{page["lastmod"]}</lastmod>\n'
-        if 'changefreq' in page:
-            xml_content += f'    <changefreq>{page["changefreq"]}</changefreq>\n'
-        if 'priority' in page:
-            xml_content += f'    <priority>{page["priority"]}</priority>\n'
-        xml_content += '  </url>\n'
-    
-    xml_content += '</urlset>'
-    
-    return Response(xml_content, mimetype='application/xml')
+def scorecard_server_timing(scorecard, elapsed_ms):
+    """Server-Timing header value for the scorecard lookup, plus the scrape if this request ran it"""
+    parts = [f'scorecard;dur={elapsed_ms:.1f};desc="{"db" if scorecard.get("from_db") else "cache"}"']
+    timing = scorecard.get('timing')
+    if timing:
+        parts.append(f"scrape-fetch;dur={timing['fetch_ms']}")
+        parts.append(f"scrape-parse;dur={timing['parse_ms']}")
+        parts.append(f'scrape-live-page;dur={timing["live_page_wait_ms"] + timing["live_page_parse_ms"]:.1f};desc="{timing["live_page"]}"')
+        parts.append(f"scrape-total;dur={timing['total_ms']}")
+    return ', '.join(parts)
+
+def get_match_scorecard(match_id, match=None):
+    """
+    Scorecard for a match page. Completed matches with a saved scorecard are
+    read from the DB; anything else comes from the scorecard cache, and a
+    completed match's scorecard is saved to the DB the first time it is fetched.
+    """
+    saved = scorecard_from_db(match)
+    if saved:
+        return saved
+
+    scorecard = scraper.get_scorecard_cached(match_id, match.state if match else None)
+    if match and match.state in scraper.SCORECARD_COMPLETE_STATES and scorecard.get('success') and scorecard.get('innings'):
+        try:
+            match.innings_data = scorecard['innings']
+            match.batting_data, match.bowling_data = scorecard_tables(scorecard['innings'])
+            db.session.commit()
+            scraper.drop_cached_result(f'scorecard:{match_id}')
+        except Exception as e:
+            db.session.rollback()
+            logging.error(f"Error saving scorecard for match {match_id}: {str(e)}")
+    return scorecard
 
 @app.route('/')
 def index():
-    # Use same order as live-scores page - get from scraper
-    scrape_result = scraper.scrape_live_scores()
-    
-    matches = []
-    match_flags = {}
-    
-    if scrape_result.get('success'):
-        for m in scrape_result.get('matches', [])[:20]:
-            # Get match from database to include slug
-            db_match = Match.query.filter_by(match_id=str(m.get('match_id'))).first()
-            match_data = {
-                'match_id': m.get('match_id'),
-                'slug': db_match.slug if db_match else None,
-                'match_format': m.get('series_name', 'Match'),
-                'team1_name': m.get('team1_name', 'Team 1'),
-                'team2_name': m.get('team2_name', 'Team 2'),
-                'team1_score': m.get('team1_score', ''),
-                'team2_score': m.get('team2_score', ''),
-                'state': m.get('state', 'Live'),
-                'result': m.get('result', ''),
-                'team1_flag': m.get('team1_flag', ''),
-                'team2_flag': m.get('team2_flag', '')
-            }
-            matches.append(type('Match', (), match_data)())
-            
-            if m.get('team1_flag'):
-                match_flags[f"{m.get('match_id')}_1"] = m.get('team1_flag')
-            if m.get('team2_flag'):
-                match_flags[f"{m.get('match_id')}_2"] = m.get('team2_flag')
+    # Same order as live-scores page (Cricbuzz container order)
+    live_cards = get_live_match_cards(limit=20)
+    matches = [type('Match', (), m)() for m in live_cards]
+    match_flags = collect_match_flags(live_cards)
     
     recent_posts = Post.query.filter_by(is_published=True).order_by(Post.created_at.desc()).limit(10).all()
     
     # Get recent series for home page (order by id desc for most recently added)
     recent_series = Series.query.order_by(Series.id.desc()).limit(10).all()
     
-    # Fetch recently completed matches from Cricbuzz
-    recent_result = scraper.scrape_recent_matches()
-    recent_matches = []
-    recent_match_flags = {}
-    if recent_result.get('success'):
-        for m in recent_result.get('matches', [])[:20]:
-            db_match = Match.query.filter_by(match_id=str(m.get('match_id'))).first()
-            match_data = {
-                'match_id': m.get('match_id'),
-                'slug': db_match.slug if db_match else None,
-                'match_format': m.get('series_name') or m.get('match_format') or 'Match',
-                'series_name': m.get('series_name', ''),
-                'team1_name': m.get('team1_name', 'Team 1'),
-                'team2_name': m.get('team2_name', 'Team 2'),
-                'team1_score': m.get('team1_score', ''),
-                'team2_score': m.get('team2_score', ''),
-                'state': 'Complete',
-                'result': m.get('result', ''),
-                'team1_flag': m.get('team1_flag', ''),
-                'team2_flag': m.get('team2_flag', '')
-            }
-            recent_matches.append(type('Match', (), match_data)())
-            if m.get('team1_flag'):
-                recent_match_flags[f"{m.get('match_id')}_1"] = m.get('team1_flag')
-            if m.get('team2_flag'):
-                recent_match_flags[f"{m.get('match_id')}_2"] = m.get('team2_flag')
+    # Recently completed matches
+    recent_cards = get_recent_match_cards(limit=20)
+    recent_matches = [type('Match', (), m)() for m in recent_cards]
+    recent_match_flags = collect_match_flags(recent_cards)
     
     return render_template('index.html', matches=matches, match_flags=match_flags, recent_posts=recent_posts, series=recent_series, recent_matches=recent_matches, recent_match_flags=recent_match_flags)
 
 @app.route('/live-scores')
 def live_scores():
-    # Scrape live data from Cricbuzz using new function
-    scrape_result = scraper.scrape_live_scores()
-    
-    matches = []
-    match_flags = {}
-    
-    if scrape_result.get('success'):
-        for m in scrape_result.get('matches', []):
-            match_data = {
-                'match_id': m.get('match_id'),
-                'match_format': m.get('series_name', 'Match'),
-                'team1_name': m.get('team1_name', 'Team 1'),
-                'team2_name': m.get('team2_name', 'Team 2'),
-                'team1_score': m.get('team1_score', ''),
-                'team2_score': m.get('team2_score', ''),
-                'state': m.get('state', 'Live'),
-                'result': m.get('result', '')
-            }
-            matches.append(type('Match', (), match_data)())
-            
-            if m.get('team1_flag'):
-                match_flags[f"{m.get('match_id')}_1"] = m.get('team1_flag')
-            if m.get('team2_flag'):
-                match_flags[f"{m.get('match_id')}_2"] = m.get('team2_flag')
+    live_cards = get_live_match_cards()
+    matches = [type('Match', (), m)() for m in live_cards]
+    match_flags = collect_match_flags(live_cards)
     
     # Recent matches for sidebar from database - ALL scraped matches
     recent_matches = Match.query.order_by(Match.updated_at.desc()).limit(50).all()
     
-    teams = Team.query.all()
     for m in recent_matches:
+        team1_flag = m.team1_flag or resolve_team_flag(m.team1_name)
+        team2_flag = m.team2_flag or resolve_team_flag(m.team2_name)
         if m.match_id:
-            match_flags[f"{m.match_id}_1"] = m.team1_flag if m.team1_flag else get_team_flag_from_list(m.team1_name, teams)
-            match_flags[f"{m.match_id}_2"] = m.team2_flag if m.team2_flag else get_team_flag_from_list(m.team2_name, teams)
+            match_flags[f"{m.match_id}_1"] = team1_flag
+            match_flags[f"{m.match_id}_2"] = team2_flag
         if m.team1_name:
-            match_flags[m.team1_name] = m.team1_flag if m.team1_flag else get_team_flag_from_list(m.team1_name, teams)
+            match_flags[m.team1_name] = team1_flag
         if m.team2_name:
-            match_flags[m.team2_name] = m.team2_flag if m.team2_flag else get_team_flag_from_list(m.team2_name, teams)
+            match_flags[m.team2_name] = team2_flag
     
     # Get "Today Live Match" category posts
     today_live_category = PostCategory.query.filter_by(slug='today-live-match').first()
@@ -729,11 +509,10 @@ def recent_matches_page():
     match_flags = {}
     
     # Add flags for DB matches
-    teams = Team.query.all()
     for m in db_matches:
         if m.match_id:
-            match_flags[f"{m.match_id}_1"] = m.team1_flag if m.team1_flag else get_team_flag_from_list(m.team1_name, teams)
-            match_flags[f"{m.match_id}_2"] = m.team2_flag if m.team2_flag else get_team_flag_from_list(m.team2_name, teams)
+            match_flags[f"{m.match_id}_1"] = m.team1_flag or resolve_team_flag(m.team1_name)
+            match_flags[f"{m.match_id}_2"] = m.team2_flag or resolve_team_flag(m.team2_name)
     
     # No live scraping - show only database matches scraped from admin
     live_matches = []
@@ -842,11 +621,18 @@ def match_detail(slug):
     if match and match.slug and match.slug != slug:
         return redirect(url_for('match_detail', slug=match.slug), code=301)
     
+    # Unknown slugs are not Cricbuzz ids; don't scrape or cache them
+    if not match and not slug.isdigit():
+        return "Scorecard not available", 404
+    
     # Get match_id for scorecard scraping
     actual_match_id = match.match_id if match else slug
     
-    # Scrape scorecard from Cricbuzz
-    scorecard = scraper.scrape_scorecard(actual_match_id)
+    # Saved scorecard for completed matches, otherwise the state-aware scorecard cache
+    import time
+    scorecard_started = time.perf_counter()
+    scorecard = get_match_scorecard(actual_match_id, match)
+    scorecard_ms = (time.perf_counter() - scorecard_started) * 1000
     
     series = None
     
@@ -861,7 +647,7 @@ def match_detail(slug):
         # Create a temporary match object from scorecard data
         if scorecard:
             match = type('Match', (), {
-                'match_id': match_id,
+                'match_id': actual_match_id,
                 'series_id': scorecard.get('series_id', ''),
                 'team1_name': scorecard.get('team1') or scorecard.get('team1_name', 'Team 1'),
                 'team2_name': scorecard.get('team2') or scorecard.get('team2_name', 'Team 2'),
@@ -878,7 +664,9 @@ def match_detail(slug):
         else:
             return "Scorecard not available", 404
     
-    return render_template('match_detail.html', match=match, series=series, scorecard=scorecard)
+    response = make_response(render_template('match_detail.html', match=match, series=series, scorecard=scorecard))
+    response.headers['Server-Timing'] = scorecard_server_timing(scorecard, scorecard_ms)
+    return response
 
 @app.route('/news')
 def news():
@@ -968,7 +756,7 @@ def admin_live_score():
         db.session.commit()
     
     # Auto-fetch from container on page load using new function
-    scrape_result = scraper.scrape_live_scores()
+    scrape_result = scraper.get_live_scores_cached()
     
     all_sorted = []
     live_count = 0
@@ -1032,9 +820,10 @@ def admin_live_score_scrape():
         result = scraper.scrape_live_scores()
         
         if result.get('success'):
-            for match_data in result.get('matches', []):
-                upsert_match(match_data)
+            ingest_matches(db, Match, result.get('matches', []))
             
+            db.session.flush()
+            apply_live_order(db, Match, [m.get('match_id') for m in result.get('matches', [])])
             db.session.commit()
             
             setting = LiveScoreScrapeSetting.query.first()
@@ -1302,14 +1091,17 @@ def api_scrape_scorecard():
         if not match_id:
             return jsonify({'success': False, 'message': 'Match ID required'}), 400
         
-        scorecard = scraper.scrape_scorecard(match_id)
+        # Get database match for fallback values and the scorecard cache TTL
+        db_match = Match.query.filter_by(match_id=str(match_id)).first()
+        
+        # Page visitors share the state-aware scorecard cache; admin tools pass refresh to scrape now
+        if data.get('refresh'):
+            scraper.drop_cached_result(f'scorecard:{match_id}')
+        scorecard = dict(scraper.get_scorecard_cached(match_id, db_match.state if db_match else None))
         
         if not scorecard:
             return jsonify({'success': False, 'message': 'Failed to scrape scorecard'}), 400
         
-        # Get database match for fallback values
-        db_match = Match.query.filter_by(match_id=str(match_id)).first()
-        
         # Fallback to database values if team names are empty (match not started)
         if db_match:
             if not scorecard.get('team1_name') and db_match.team1_name:
@@ -1419,43 +1211,14 @@ def scrape_category(category_slug):
         if not result:
             return jsonify({'success': False, 'message': 'Failed to scrape'}), 500
         
-        teams_scraped = 0
-        teams_updated = 0
-        existing_slugs = set(t.slug for t in Team.query.filter(Team.slug.isnot(None)).all())
-        
-        for team_data in result['teams']:
-            if not team_data.get('team_id'):
-                continue
-            
-            existing = Team.query.filter_by(team_id=team_data['team_id']).first()
-            if existing:
-                existing.name = team_data.get('name', existing.name)
-                existing.flag_url = team_data.get('flag_url', existing.flag_url)
-                existing.team_url = team_data.get('team_url', existing.team_url)
-                existing.category_id = category.id
-                existing.updated_at = datetime.utcnow()
-                if not existing.slug and existing.name:
-                    existing.slug = generate_slug(existing.name, existing_slugs)
-                    if existing.slug:
-                        existing_slugs.add(existing.slug)
-                teams_updated += 1
-            else:
-                team_name = team_data.get('name', '')
-                new_slug = generate_slug(team_name, existing_slugs) if team_name else None
-                if new_slug:
-                    existing_slugs.add(new_slug)
-                team = Team(
-                    team_id=team_data['team_id'],
-                    name=team_name,
-                    slug=new_slug,
-                    flag_url=team_data.get('flag_url'),
-                    team_url=team_data.get('team_url'),
-                    category_id=category.id
-                )
-                db.session.add(team)
-                teams_scraped += 1
+        teams_data = [t for t in result['teams'] if t.get('team_id')]
+        rows, teams_scraped = bulk_upsert_teams(db, Team, category.id, teams_data)
+        teams_updated = len(rows) - teams_scraped
+        if rows:
+            category.teams_scraped_at = datetime.utcnow()
         
         db.session.commit()
+        refresh_team_flag_index()
         
         total = teams_scraped + teams_updated
         log = ScrapeLog(
@@ -1494,33 +1257,11 @@ def scrape_team_players(team_id):
         
         players_data = scraper.scrape_players_from_team(team.team_url)
         
-        players_scraped = 0
-        players_updated = 0
-        for player_data in players_data:
-            if not player_data.get('player_id'):
-                continue
-            
-            # Use player_id for lookup (more reliable than name)
-            existing = Player.query.filter_by(player_id=player_data['player_id']).first()
-            if existing:
-                existing.name = player_data.get('name', existing.name)
-                existing.photo_url = player_data.get('photo_url', existing.photo_url)
-                existing.player_url = player_data.get('player_url', existing.player_url)
-                existing.role = player_data.get('role', existing.role)
-                existing.team_id = team.id
-                existing.updated_at = datetime.utcnow()
-                players_updated += 1
-            else:
-                player = Player(
-                    player_id=player_data['player_id'],
-                    name=player_data['name'],
-                    photo_url=player_data.get('photo_url'),
-                    player_url=player_data.get('player_url'),
-                    role=player_data.get('role'),
-                    team_id=team.id
-                )
-                db.session.add(player)
-                players_scraped += 1
+        players_data = [p for p in players_data if p.get('player_id')]
+        rows, players_scraped = bulk_upsert_players(db, Player, team.id, players_data)
+        players_updated = len(rows) - players_scraped
+        if rows:
+            team.players_scraped_at = datetime.utcnow()
         
         db.session.commit()
         
@@ -1551,34 +1292,30 @@ def scrape_team_players(team_id):
         db.session.commit()
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/scrape/all', methods=['POST'])
-def scrape_all():
+@job_handler('scrape_all_teams')
+def scrape_all_teams_job(ctx):
+    """Scrape teams for every category; resumes after the last finished category"""
     try:
-        total_teams = 0
-        categories = TeamCategory.query.all()
+        categories = TeamCategory.query.order_by(TeamCategory.id).all()
+        done = set(ctx.checkpoint.get('done_category_ids', []))
+        total_teams = ctx.checkpoint.get('total_teams', 0)
+        existing_slugs = load_slug_index(db, Team)
+        ctx.progress(len(done), len(categories), 'Scraping team categories')
         
         for category in categories:
+            if category.id in done:
+                continue
+            ctx.check_cancelled()
             result = scraper.scrape_category(category.slug)
             if result:
-                for team_data in result['teams']:
-                    existing = Team.query.filter_by(name=team_data['name'], category_id=category.id).first()
-                    if existing:
-                        existing.team_id = team_data.get('team_id')
-                        existing.flag_url = team_data.get('flag_url')
-                        existing.team_url = team_data.get('team_url')
-                        existing.updated_at = datetime.utcnow()
-                    else:
-                        team = Team(
-                            team_id=team_data.get('team_id'),
-                            name=team_data['name'],
-                            flag_url=team_data.get('flag_url'),
-                            team_url=team_data.get('team_url'),
-                            category_id=category.id
-                        )
-                        db.session.add(team)
-                    total_teams += 1
+                rows, _ = bulk_upsert_teams(db, Team, category.id, result['teams'], existing_slugs)
+                total_teams += len(rows)
+                if rows:
+                    category.teams_scraped_at = datetime.utcnow()
+            done.add(category.id)
+            ctx.save_checkpoint({'done_category_ids': sorted(done), 'total_teams': total_teams}, current=len(done), message=f'Scraped {category.name}')
         
-        db.session.commit()
+        refresh_team_flag_index()
         
         setting = ScrapeSetting.query.first()
         if setting:
@@ -1594,13 +1331,12 @@ def scrape_all():
         db.session.add(log)
         db.session.commit()
         
-        return jsonify({
-            'success': True,
-            'message': f'Scraped {total_teams} teams from all categories',
-            'teams_scraped': total_teams
-        })
+        return {'message': f'Scraped {total_teams} teams from all categories', 'teams_scraped': total_teams}
     
+    except JobCancelled:
+        raise
     except Exception as e:
+        db.session.rollback()
         log = ScrapeLog(
             category='all',
             status='error',
@@ -1608,6 +1344,14 @@ def scrape_all():
         )
         db.session.add(log)
         db.session.commit()
+        raise
+
+@app.route('/api/scrape/all', methods=['POST'])
+def scrape_all():
+    try:
+        job = enqueue_job(db, ScrapeJob, 'scrape_all_teams')
+        return jsonify({'success': True, 'job_id': job.id, 'message': 'Team scrape queued'})
+    except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/server-time')
@@ -1616,18 +1360,46 @@ def get_server_time():
     now = datetime.now()
     return jsonify({'time': now.strftime('%H:%M:%S')})
 
+# Seconds a CDN or browser may reuse match JSON before revalidating with If-None-Match
+LIVE_API_MAX_AGE = int(os.environ.get('LIVE_API_MAX_AGE', 10))
+RECENT_API_MAX_AGE = int(os.environ.get('RECENT_API_MAX_AGE', 60))
+# Most changed matches one /api/live-matches?since= response returns
+DELTA_API_LIMIT = 200
+
+def match_set_etag(query, *parts):
+    """Weak ETag for a set of matches: the newest updated_at and row count matching query's filters"""
+    newest, count = query.with_entities(db.func.max(Match.updated_at), db.func.count(Match.id)).first()
+    key = '|'.join(str(part) for part in (newest.isoformat() if newest else '', count) + parts)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+
+def not_modified(etag, max_age):
+    """A 304 response when the client already holds etag, else None"""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    return cacheable(Response(status=304), etag, max_age)
+
+def cacheable(response, etag, max_age):
+    """Attach the weak ETag and shared-cache headers to a match JSON response"""
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = f'public, max-age={max_age}, stale-while-revalidate={max_age}'
+    return response
+
 @app.route('/api/recent-matches')
 def get_recent_matches():
     offset = request.args.get('offset', 0, type=int)
     limit = request.args.get('limit', 5, type=int)
     
-    matches = Match.query.filter(Match.state == 'Complete').order_by(Match.updated_at.desc()).offset(offset).limit(limit + 1).all()
+    recent_query = Match.query.filter(Match.state == 'Complete')
+    etag = match_set_etag(recent_query, offset, limit)
+    cached = not_modified(etag, RECENT_API_MAX_AGE)
+    if cached:
+        return cached
+    
+    matches = recent_query.order_by(Match.updated_at.desc()).offset(offset).limit(limit + 1).all()
     
     has_more = len(matches) > limit
     matches = matches[:limit]
     
-    teams = Team.query.all()
-    
     result = []
     for m in matches:
         series_name = m.series.name if m.series else (m.series_name or '')
@@ -1641,11 +1413,11 @@ def get_recent_matches():
             'result': m.result,
             'match_date': m.match_date,
             'series_name': series_name,
-            'team1_flag': get_team_flag_from_list(m.team1_name, teams),
-            'team2_flag': get_team_flag_from_list(m.team2_name, teams)
+            'team1_flag': m.team1_flag or resolve_team_flag(m.team1_name),
+            'team2_flag': m.team2_flag or resolve_team_flag(m.team2_name)
         })
     
-    return jsonify({'matches': result, 'has_more': has_more})
+    return cacheable(jsonify({'matches': result, 'has_more': has_more}), etag, RECENT_API_MAX_AGE)
 
 @app.route('/api/settings/auto-scrape', methods=['POST'])
 def toggle_auto_scrape():
@@ -1718,139 +1490,107 @@ def clear_all_teams():
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
 
-scrape_progress = {}
-
 @app.route('/api/scrape/category/<category_slug>/players/progress', methods=['GET'])
 def get_scrape_progress(category_slug):
-    progress = scrape_progress.get(category_slug, {'percent': 0, 'current': 0, 'total': 0, 'status': 'idle'})
-    return jsonify(progress)
+    return jsonify(get_progress(f'players:{category_slug}'))
+
+def scrape_category_players_task(category_slug, job_id, team_ids):
+    """Background roster scrape for one category; reports through the shared progress store"""
+    progress_key = f'players:{category_slug}'
+    with app.app_context():
+        try:
+            category = TeamCategory.query.filter_by(slug=category_slug).first()
+            teams = Team.query.filter(Team.id.in_(team_ids)).all()
+            
+            def on_progress(done, total, team, team_players, errors):
+                update_progress(progress_key, done, total, errors=errors, team=team.name, team_players=team_players)
+            
+            total_players, error_count = run_roster_scrape(db, Player, scraper, teams, on_progress=on_progress)
+            
+            message = f'Scraped {total_players} players from {category.name}'
+            finish_progress(progress_key, current=len(teams), total=len(teams), errors=error_count,
+                            message=message, players_scraped=total_players)
+            
+            log = ScrapeLog(
+                category=f'{category_slug}_players',
+                status='success',
+                message=message,
+                players_scraped=total_players
+            )
+            db.session.add(log)
+            db.session.commit()
+        
+        except Exception as e:
+            db.session.rollback()
+            finish_progress(progress_key, status='error', message=str(e))
+            log = ScrapeLog(
+                category=f'{category_slug}_players',
+                status='error',
+                message=str(e)
+            )
+            db.session.add(log)
+            db.session.commit()
 
 @app.route('/api/scrape/category/<category_slug>/players', methods=['POST'])
 def scrape_category_players(category_slug):
+    import uuid
+    progress_started = False
     try:
         category = TeamCategory.query.filter_by(slug=category_slug).first()
         if not category:
             return jsonify({'success': False, 'message': 'Category not found'}), 404
         
-        total_players = 0
-        teams = Team.query.filter_by(category_id=category.id).filter(Team.team_url.isnot(None)).all()
-        total_teams = len(teams)
-        existing_player_slugs = set(p.slug for p in Player.query.filter(Player.slug.isnot(None)).all())
-        
-        scrape_progress[category_slug] = {'percent': 0, 'current': 0, 'total': total_teams, 'status': 'running'}
-        
-        for idx, team in enumerate(teams):
-            try:
-                players_data = scraper.scrape_players_from_team(team.team_url)
-                team_players = 0
-                for player_data in players_data:
-                    existing = Player.query.filter_by(name=player_data['name'], team_id=team.id).first()
-                    if existing:
-                        existing.player_id = player_data.get('player_id')
-                        existing.photo_url = player_data.get('photo_url')
-                        existing.player_url = player_data.get('player_url')
-                        existing.role = player_data.get('role')
-                        existing.updated_at = datetime.utcnow()
-                        if not existing.slug and existing.name:
-                            existing.slug = generate_slug(existing.name, existing_player_slugs)
-                            if existing.slug:
-                                existing_player_slugs.add(existing.slug)
-                    else:
-                        player_name = player_data.get('name', '')
-                        new_slug = generate_slug(player_name, existing_player_slugs) if player_name else None
-                        if new_slug:
-                            existing_player_slugs.add(new_slug)
-                        player = Player(
-                            player_id=player_data.get('player_id'),
-                            name=player_name,
-                            slug=new_slug,
-                            photo_url=player_data.get('photo_url'),
-                            player_url=player_data.get('player_url'),
-                            role=player_data.get('role'),
-                            team_id=team.id
-                        )
-                        db.session.add(player)
-                    team_players += 1
-                    total_players += 1
-                
-                db.session.commit()
-                
-                percent = int(((idx + 1) / total_teams) * 100)
-                scrape_progress[category_slug] = {'percent': percent, 'current': idx + 1, 'total': total_teams, 'status': 'running', 'team': team.name, 'team_players': team_players}
-            except Exception as e:
-                db.session.rollback()
-                continue
+        team_ids = [t.id for t in Team.query.filter_by(category_id=category.id).filter(Team.team_url.isnot(None)).all()]
+        if not team_ids:
+            return jsonify({'success': False, 'message': 'No teams to scrape'}), 400
         
-        scrape_progress[category_slug] = {'percent': 100, 'current': total_teams, 'total': total_teams, 'status': 'complete'}
+        job_id = uuid.uuid4().hex
+        if not start_progress(f'players:{category_slug}', len(team_ids), job_id=job_id):
+            running = get_progress(f'players:{category_slug}')
+            return jsonify({'success': False, 'message': 'Player scraping already in progress', 'job_id': running.get('job_id')}), 400
+        progress_started = True
         
-        log = ScrapeLog(
-            category=f'{category_slug}_players',
-            status='success',
-            message=f'Scraped {total_players} players from {category.name}',
-            players_scraped=total_players
-        )
-        db.session.add(log)
-        db.session.commit()
+        thread = threading.Thread(target=scrape_category_players_task, args=(category_slug, job_id, team_ids))
+        thread.daemon = True
+        thread.start()
         
         return jsonify({
             'success': True,
-            'message': f'Scraped {total_players} players from {category.name}',
-            'players_scraped': total_players
+            'job_id': job_id,
+            'message': f'Started scraping players for {len(team_ids)} teams in background',
+            'total': len(team_ids)
         })
     
     except Exception as e:
-        scrape_progress[category_slug] = {'percent': 0, 'current': 0, 'total': 0, 'status': 'error'}
-        log = ScrapeLog(
-            category=f'{category_slug}_players',
-            status='error',
-            message=str(e)
-        )
-        db.session.add(log)
-        db.session.commit()
+        if progress_started:
+            finish_progress(f'players:{category_slug}', status='error', message=str(e))
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/scrape/all-players', methods=['POST'])
-def scrape_all_players():
+@job_handler('scrape_all_players')
+def scrape_all_players_job(ctx):
+    """Scrape squads for every team; commits and checkpoints after each team"""
     try:
-        total_players = 0
-        teams = Team.query.filter(Team.team_url.isnot(None)).all()
-        existing_player_slugs = set(p.slug for p in Player.query.filter(Player.slug.isnot(None)).all())
+        last_team_id = ctx.checkpoint.get('last_team_id', 0)
+        total_players = ctx.checkpoint.get('total_players', 0)
+        teams_query = Team.query.filter(Team.team_url.isnot(None))
+        total = teams_query.count()
+        done = teams_query.filter(Team.id <= last_team_id).count()
+        teams = teams_query.filter(Team.id > last_team_id).order_by(Team.id).all()
+        existing_player_slugs = load_slug_index(db, Player)
+        ctx.progress(done, total, 'Scraping players')
         
         for team in teams:
+            ctx.check_cancelled()
             try:
                 players_data = scraper.scrape_players_from_team(team.team_url)
-                for player_data in players_data:
-                    existing = Player.query.filter_by(name=player_data['name'], team_id=team.id).first()
-                    if existing:
-                        existing.player_id = player_data.get('player_id')
-                        existing.photo_url = player_data.get('photo_url')
-                        existing.player_url = player_data.get('player_url')
-                        existing.role = player_data.get('role')
-                        existing.updated_at = datetime.utcnow()
-                        if not existing.slug and existing.name:
-                            existing.slug = generate_slug(existing.name, existing_player_slugs)
-                            if existing.slug:
-                                existing_player_slugs.add(existing.slug)
-                    else:
-                        player_name = player_data.get('name', '')
-                        new_slug = generate_slug(player_name, existing_player_slugs) if player_name else None
-                        if new_slug:
-                            existing_player_slugs.add(new_slug)
-                        player = Player(
-                            player_id=player_data.get('player_id'),
-                            name=player_name,
-                            slug=new_slug,
-                            photo_url=player_data.get('photo_url'),
-                            player_url=player_data.get('player_url'),
-                            role=player_data.get('role'),
-                            team_id=team.id
-                        )
-                        db.session.add(player)
-                    total_players += 1
+                rows, _ = bulk_upsert_players(db, Player, team.id, players_data, existing_player_slugs)
+                total_players += len(rows)
+                if rows:
+                    team.players_scraped_at = datetime.utcnow()
             except Exception as e:
-                continue
-        
-        db.session.commit()
+                db.session.rollback()
+            done += 1
+            ctx.save_checkpoint({'last_team_id': team.id, 'total_players': total_players}, current=done, message=f'Scraped {team.name}')
         
         log = ScrapeLog(
             category='all_players',
@@ -1861,13 +1601,12 @@ def scrape_all_players():
         db.session.add(log)
         db.session.commit()
         
-        return jsonify({
-            'success': True,
-            'message': f'Scraped {total_players} players from all teams',
-            'players_scraped': total_players
-        })
+        return {'message': f'Scraped {total_players} players from all teams', 'players_scraped': total_players}
     
+    except JobCancelled:
+        raise
     except Exception as e:
+        db.session.rollback()
         log = ScrapeLog(
             category='all_players',
             status='error',
@@ -1875,6 +1614,14 @@ def scrape_all_players():
         )
         db.session.add(log)
         db.session.commit()
+        raise
+
+@app.route('/api/scrape/all-players', methods=['POST'])
+def scrape_all_players():
+    try:
+        job = enqueue_job(db, ScrapeJob, 'scrape_all_players')
+        return jsonify({'success': True, 'job_id': job.id, 'message': 'Player scrape queued'})
+    except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/settings/category-auto-scrape', methods=['POST'])
@@ -1935,116 +1682,119 @@ def toggle_player_auto_scrape():
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-profile_scrape_progress = {}
-
 @app.route('/api/scrape/profiles/<category_slug>/progress', methods=['GET'])
 def get_profile_scrape_progress(category_slug):
-    progress = profile_scrape_progress.get(category_slug, {'percent': 0, 'current': 0, 'total': 0, 'status': 'idle', 'current_player': ''})
-    return jsonify(progress)
+    return jsonify(get_progress(f'profiles:{category_slug}', current_player=''))
+
+PROFILE_COMMIT_BATCH = 25
+
+def apply_profile_data(player, profile_data):
+    """Copy scraped profile fields onto a Player row"""
+    if profile_data.get('born'):
+        player.born = profile_data['born']
+    if profile_data.get('birth_place'):
+        player.birth_place = profile_data['birth_place']
+    if profile_data.get('nickname'):
+        player.nickname = profile_data['nickname']
+    if profile_data.get('role'):
+        player.role = profile_data['role']
+    if profile_data.get('batting_style'):
+        player.batting_style = profile_data['batting_style']
+    if profile_data.get('bowling_style'):
+        player.bowling_style = profile_data['bowling_style']
+    
+    player.bat_matches = profile_data.get('bat_matches')
+    player.bat_innings = profile_data.get('bat_innings')
+    player.bat_runs = profile_data.get('bat_runs')
+    player.bat_balls = profile_data.get('bat_balls')
+    player.bat_highest = profile_data.get('bat_highest')
+    player.bat_average = profile_data.get('bat_average')
+    player.bat_strike_rate = profile_data.get('bat_strike_rate')
+    player.bat_not_outs = profile_data.get('bat_not_outs')
+    player.bat_fours = profile_data.get('bat_fours')
+    player.bat_sixes = profile_data.get('bat_sixes')
+    player.bat_ducks = profile_data.get('bat_ducks')
+    player.bat_fifties = profile_data.get('bat_fifties')
+    player.bat_hundreds = profile_data.get('bat_hundreds')
+    player.bat_two_hundreds = profile_data.get('bat_two_hundreds')
+    
+    player.bowl_matches = profile_data.get('bowl_matches')
+    player.bowl_innings = profile_data.get('bowl_innings')
+    player.bowl_balls = profile_data.get('bowl_balls')
+    player.bowl_runs = profile_data.get('bowl_runs')
+    player.bowl_maidens = profile_data.get('bowl_maidens')
+    player.bowl_wickets = profile_data.get('bowl_wickets')
+    player.bowl_average = profile_data.get('bowl_average')
+    player.bowl_economy = profile_data.get('bowl_economy')
+    player.bowl_strike_rate = profile_data.get('bowl_strike_rate')
+    player.bowl_best_innings = profile_data.get('bowl_best_innings')
+    player.bowl_best_match = profile_data.get('bowl_best_match')
+    player.bowl_four_wickets = profile_data.get('bowl_four_wickets')
+    player.bowl_five_wickets = profile_data.get('bowl_five_wickets')
+    player.bowl_ten_wickets = profile_data.get('bowl_ten_wickets')
+    
+    player.batting_stats = profile_data.get('batting_stats')
+    player.bowling_stats = profile_data.get('bowling_stats')
+    player.career_timeline = profile_data.get('career_timeline')
+    
+    player.profile_scraped = True
+    player.profile_scraped_at = datetime.utcnow()
 
 def scrape_profiles_task(category_slug, player_ids):
-    import time
+    """Fetch and parse profiles on a worker pool; write to the DB in batches from this thread"""
+    progress_key = f'profiles:{category_slug}'
     with app.app_context():
         try:
             players = Player.query.filter(Player.id.in_(player_ids)).all()
+            players_by_id = {p.id: p for p in players}
+            jobs = [(p.id, p.player_url) for p in players if p.player_url]
+            total = len(players)
+            done = total - len(jobs)
             scraped_count = 0
+            error_count = 0
+            pending_writes = 0
             
-            for i, player in enumerate(players):
-                profile_scrape_progress[category_slug] = {
-                    'percent': int(((i + 1) / len(players)) * 100),
-                    'current': i + 1,
-                    'total': len(players),
-                    'status': 'running',
-                    'current_player': player.name
-                }
+            for (player_id, _), profile_data, error in scraper.scrape_concurrently(
+                    jobs, lambda job: scraper.scrape_player_profile(job[1])):
+                player = players_by_id[player_id]
+                done += 1
                 
-                if player.player_url:
-                    time.sleep(0.3)
-                    profile_data = scraper.scrape_player_profile(player.player_url)
-                    
-                    if profile_data:
-                        if profile_data.get('born'):
-                            player.born = profile_data['born']
-                        if profile_data.get('birth_place'):
-                            player.birth_place = profile_data['birth_place']
-                        if profile_data.get('nickname'):
-                            player.nickname = profile_data['nickname']
-                        if profile_data.get('role'):
-                            player.role = profile_data['role']
-                        if profile_data.get('batting_style'):
-                            player.batting_style = profile_data['batting_style']
-                        if profile_data.get('bowling_style'):
-                            player.bowling_style = profile_data['bowling_style']
-                        
-                        player.bat_matches = profile_data.get('bat_matches')
-                        player.bat_innings = profile_data.get('bat_innings')
-                        player.bat_runs = profile_data.get('bat_runs')
-                        player.bat_balls = profile_data.get('bat_balls')
-                        player.bat_highest = profile_data.get('bat_highest')
-                        player.bat_average = profile_data.get('bat_average')
-                        player.bat_strike_rate = profile_data.get('bat_strike_rate')
-                        player.bat_not_outs = profile_data.get('bat_not_outs')
-                        player.bat_fours = profile_data.get('bat_fours')
-                        player.bat_sixes = profile_data.get('bat_sixes')
-                        player.bat_ducks = profile_data.get('bat_ducks')
-                        player.bat_fifties = profile_data.get('bat_fifties')
-                        player.bat_hundreds = profile_data.get('bat_hundreds')
-                        player.bat_two_hundreds = profile_data.get('bat_two_hundreds')
-                        
-                        player.bowl_matches = profile_data.get('bowl_matches')
-                        player.bowl_innings = profile_data.get('bowl_innings')
-                        player.bowl_balls = profile_data.get('bowl_balls')
-                        player.bowl_runs = profile_data.get('bowl_runs')
-                        player.bowl_maidens = profile_data.get('bowl_maidens')
-                        player.bowl_wickets = profile_data.get('bowl_wickets')
-                        player.bowl_average = profile_data.get('bowl_average')
-                        player.bowl_economy = profile_data.get('bowl_economy')
-                        player.bowl_strike_rate = profile_data.get('bowl_strike_rate')
-                        player.bowl_best_innings = profile_data.get('bowl_best_innings')
-                        player.bowl_best_match = profile_data.get('bowl_best_match')
-                        player.bowl_four_wickets = profile_data.get('bowl_four_wickets')
-                        player.bowl_five_wickets = profile_data.get('bowl_five_wickets')
-                        player.bowl_ten_wickets = profile_data.get('bowl_ten_wickets')
-                        
-                        player.batting_stats = profile_data.get('batting_stats')
-                        player.bowling_stats = profile_data.get('bowling_stats')
-                        player.career_timeline = profile_data.get('career_timeline')
-                        
-                        player.profile_scraped = True
-                        player.profile_scraped_at = datetime.utcnow()
-                        scraped_count += 1
+                # scrape_player_profile returns None instead of raising when a fetch fails
+                if error or not profile_data:
+                    error_count += 1
+                else:
+                    apply_profile_data(player, profile_data)
+                    scraped_count += 1
+                    pending_writes += 1
+                    if pending_writes >= PROFILE_COMMIT_BATCH:
                         db.session.commit()
+                        pending_writes = 0
+                
+                update_progress(progress_key, done, total, errors=error_count,
+                                current_player=player.name, scraped=scraped_count)
             
-            profile_scrape_progress[category_slug] = {
-                'percent': 100,
-                'current': len(players),
-                'total': len(players),
-                'status': 'complete',
-                'current_player': '',
-                'scraped': scraped_count
-            }
+            db.session.commit()
+            
+            finish_progress(progress_key, current=total, total=total, errors=error_count,
+                            current_player='', scraped=scraped_count)
             
             log = ScrapeLog(
                 category=f'{category_slug}_profiles',
                 status='success',
-                message=f'Scraped {scraped_count} player profiles',
+                message=f'Scraped {scraped_count} player profiles ({error_count} errors)',
                 players_scraped=scraped_count
             )
             db.session.add(log)
             db.session.commit()
             
         except Exception as e:
-            profile_scrape_progress[category_slug] = {
-                'percent': 0, 'current': 0, 'total': 0, 
-                'status': 'error', 'current_player': '', 'error': str(e)
-            }
+            db.session.rollback()
+            finish_progress(progress_key, status='error', message=str(e), current_player='', error=str(e))
 
 @app.route('/api/scrape/profiles/<category_slug>', methods=['POST'])
 def scrape_category_profiles(category_slug):
+    progress_started = False
     try:
-        if profile_scrape_progress.get(category_slug, {}).get('status') == 'running':
-            return jsonify({'success': False, 'message': 'Profile scraping already in progress'}), 400
-        
         category = TeamCategory.query.filter_by(slug=category_slug).first()
         if not category:
             return jsonify({'success': False, 'message': 'Category not found'}), 404
@@ -2059,13 +1809,9 @@ def scrape_category_profiles(category_slug):
         
         player_ids = [p.id for p in players]
         
-        profile_scrape_progress[category_slug] = {
-            'percent': 0,
-            'current': 0,
-            'total': len(players),
-            'status': 'running',
-            'current_player': 'Starting...'
-        }
+        if not start_progress(f'profiles:{category_slug}', len(players), current_player='Starting...'):
+            return jsonify({'success': False, 'message': 'Profile scraping already in progress'}), 400
+        progress_started = True
         
         thread = threading.Thread(target=scrape_profiles_task, args=(category_slug, player_ids))
         thread.daemon = True
@@ -2078,7 +1824,8 @@ def scrape_category_profiles(category_slug):
         })
     
     except Exception as e:
-        profile_scrape_progress[category_slug] = {'percent': 0, 'current': 0, 'total': 0, 'status': 'error', 'current_player': ''}
+        if progress_started:
+            finish_progress(f'profiles:{category_slug}', status='error', message=str(e), current_player='', error=str(e))
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/settings/profile-auto-scrape', methods=['POST'])
@@ -2113,8 +1860,6 @@ def get_profile_scrape_settings():
     settings = ProfileScrapeSetting.query.all()
     return jsonify({s.category_slug: {'enabled': s.auto_scrape_enabled, 'time': s.scrape_time} for s in settings})
 
-series_scrape_progress = {}
-
 @app.route('/api/scrape/series-json', methods=['POST'])
 def scrape_series_json():
     try:
@@ -2131,200 +1876,33 @@ def scrape_series_json():
             series_id_from_url = url_match.group(1)
             series_name_from_url = url_match.group(2).replace('-', ' ').lower()
         
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0'
-        }, timeout=30)
+        response = scraper.http_get(url, timeout=(scraper.HTTP_CONNECT_TIMEOUT, 30))
         
         if response.status_code != 200:
             return jsonify({'success': False, 'message': 'Failed to fetch URL'}), 400
         
-        html = response.text.replace('\\"', '"')
+        state = PageState(response.text)
         
         is_matches_url = '/matches' in url
         
         if is_matches_url:
             matches_data = []
-            seen_ids = set()
-            
-            match_blocks = re.finditer(r'"matchDetailsMap"\s*:\s*\{\s*"key"\s*:\s*"([^"]+)"[^}]*"match"\s*:\s*\[', html)
-            date_map = {}
-            for mb in match_blocks:
-                date_key = mb.group(1)
-                block_start = mb.start()
-                block_context = html[block_start:block_start+5000]
-                match_ids = re.findall(r'"matchId"\s*:\s*(\d+)', block_context)
-                for mid in match_ids:
-                    date_map[mid] = date_key
             
-            match_positions = [(m.start(), m.group(1)) for m in re.finditer(r'"matchInfo"\s*:\s*\{[^}]*"matchId"\s*:\s*(\d+)', html)]
-            
-            for pos, mid in match_positions:
-                if mid in seen_ids:
-                    continue
-                seen_ids.add(mid)
-                
-                # Bound context by next matchInfo to prevent data contamination
-                next_match = html.find('"matchInfo"', pos + 50)
-                if next_match == -1 or next_match > pos + 2000:
-                    context_end = pos + 1500
-                else:
-                    context_end = next_match
-                context = html[pos:context_end]
-                
-                match_sid = re.search(r'"seriesId"\s*:\s*(\d+)', context)
-                if series_id_from_url and match_sid:
-                    if match_sid.group(1) != series_id_from_url:
-                        continue
-                
-                series_name = re.search(r'"seriesName"\s*:\s*"([^"]*)"', context)
-                match_desc = re.search(r'"matchDesc"\s*:\s*"([^"]*)"', context)
-                match_format = re.search(r'"matchFormat"\s*:\s*"([^"]*)"', context)
-                status = re.search(r'"status"\s*:\s*"([^"]*)"', context)
-                state = re.search(r'"state"\s*:\s*"([^"]*)"', context)
-                start_date = re.search(r'"startDate"\s*:\s*"?(\d+)"?', context)
-                
-                # Extract team info with IDs - ID verification is important
-                team1_name = re.search(r'"team1"\s*:\s*\{[^}]*"teamName"\s*:\s*"([^"]*)"', context)
-                team2_name = re.search(r'"team2"\s*:\s*\{[^}]*"teamName"\s*:\s*"([^"]*)"', context)
-                team1_id = re.search(r'"team1"\s*:\s*\{[^}]*"teamId"\s*:\s*(\d+)', context)
-                team2_id = re.search(r'"team2"\s*:\s*\{[^}]*"teamId"\s*:\s*(\d+)', context)
-                
-                venue_ground = re.search(r'"venueInfo"\s*:\s*\{[^}]*"ground"\s*:\s*"([^"]*)"', context)
-                venue_city = re.search(r'"venueInfo"\s*:\s*\{[^}]*"city"\s*:\s*"([^"]*)"', context)
-                venue_id = re.search(r'"venueInfo"\s*:\s*\{[^}]*"id"\s*:\s*(\d+)', context)
-                
-                team1_score = ''
-                team2_score = ''
-                match_state = state.group(1) if state else ''
-                
-                if match_state not in ['Preview', 'Upcoming', 'Scheduled', '']:
-                    # ACCURATE METHOD: Search for matchScoreMap with specific matchId
-                    # This ensures we get scores only for THIS match
-                    score_pattern = rf'"matchScoreMap"\s*:\s*\{{\s*"{mid}"\s*:\s*\{{[^}}]*"team1Score"\s*:\s*\{{[^}}]*"inngs1"\s*:\s*\{{([^}}]+)\}}'
-                    t1_verified = re.search(score_pattern, html)
-                    
-                    if t1_verified:
-                        sb = t1_verified.group(1)
-                        runs = re.search(r'"runs"\s*:\s*(\d+)', sb)
-                        wkts = re.search(r'"wickets"\s*:\s*(\d+)', sb)
-                        overs = re.search(r'"overs"\s*:\s*([\d.]+)', sb)
-                        if runs:
-                            team1_score = f"{runs.group(1)}/{wkts.group(1) if wkts else '?'}"
-                            if overs:
-                                team1_score += f" ({overs.group(1)})"
-                    else:
-                        # Fallback to context-based extraction for T1 only
-                        t1_score_block = re.search(r'"team1Score"\s*:\s*\{[^{]*"inngs1"\s*:\s*\{([^}]+)\}', context)
-                        if t1_score_block:
-                            sb = t1_score_block.group(1)
-                            runs = re.search(r'"runs"\s*:\s*(\d+)', sb)
-                            wkts = re.search(r'"wickets"\s*:\s*(\d+)', sb)
-                            overs = re.search(r'"overs"\s*:\s*([\d.]+)', sb)
-                            if runs:
-                                team1_score = f"{runs.group(1)}/{wkts.group(1) if wkts else '?'}"
-                                if overs:
-                                    team1_score += f" ({overs.group(1)})"
-                    
-                    # T2 Score - search with matchId verification
-                    score_pattern2 = rf'"matchScoreMap"\s*:\s*\{{\s*"{mid}"\s*:\s*\{{[^}}]*"team2Score"\s*:\s*\{{[^}}]*"inngs1"\s*:\s*\{{([^}}]+)\}}'
-                    t2_verified = re.search(score_pattern2, html)
-                    
-                    if t2_verified:
-                        sb = t2_verified.group(1)
-                        runs = re.search(r'"runs"\s*:\s*(\d+)', sb)
-                        wkts = re.search(r'"wickets"\s*:\s*(\d+)', sb)
-                        overs = re.search(r'"overs"\s*:\s*([\d.]+)', sb)
-                        if runs:
-                            team2_score = f"{runs.group(1)}/{wkts.group(1) if wkts else '?'}"
-                            if overs:
-                                team2_score += f" ({overs.group(1)})"
-                    else:
-                        # For T2, only use context if it appears BEFORE any other matchInfo
-                        # This prevents picking up scores from related matches
-                        if context.count('"team2Score"') == 1:
-                            t2_score_block = re.search(r'"team2Score"\s*:\s*\{[^{]*"inngs1"\s*:\s*\{([^}]+)\}', context)
-                            if t2_score_block:
-                                sb = t2_score_block.group(1)
-                                runs = re.search(r'"runs"\s*:\s*(\d+)', sb)
-                                wkts = re.search(r'"wickets"\s*:\s*(\d+)', sb)
-                                overs = re.search(r'"overs"\s*:\s*([\d.]+)', sb)
-                                if runs:
-                                    team2_score = f"{runs.group(1)}/{wkts.group(1) if wkts else '?'}"
-                                    if overs:
-                                        team2_score += f" ({overs.group(1)})"
-                
-                match_date = date_map.get(mid, '')
-                date_timestamp = 0
-                if start_date:
-                    try:
-                        from datetime import datetime as dt
-                        ts = int(start_date.group(1)) / 1000
-                        date_timestamp = ts
-                        if not match_date:
-                            match_date = dt.fromtimestamp(ts).strftime('%a, %d %b %Y')
-                    except:
-                        pass
-                
-                venue = ''
-                if venue_ground and venue_city:
-                    venue = f"{venue_ground.group(1)}, {venue_city.group(1)}"
-                elif venue_ground:
-                    venue = venue_ground.group(1)
-                
-                match_series_name = series_name.group(1) if series_name else ''
-                
+            for match in series_match_rows(state, series_id_from_url):
                 if series_name_from_url:
-                    match_series_lower = match_series_name.lower().replace(',', '').replace("'", '')
+                    match_series_lower = match['series_name'].lower().replace(',', '').replace("'", '')
                     if series_name_from_url not in match_series_lower and match_series_lower not in series_name_from_url:
                         continue
                 
-                team1_short = team1_name.group(1) if team1_name else ''
-                team2_short = team2_name.group(1) if team2_name else ''
-                match_slug = f"{team1_short.lower().replace(' ', '-')}-vs-{team2_short.lower().replace(' ', '-')}"
-                match_url = f"https://www.cricbuzz.com/live-cricket-scorecard/{mid}/{match_slug}"
-                
-                # Get series_id from context for verification
-                match_series_id = match_sid.group(1) if match_sid else series_id_from_url or ''
-                
-                matches_data.append({
-                    # PRIMARY IDs - Most important for verification
-                    'match_id': mid,
-                    'series_id': match_series_id,
-                    'team1_id': team1_id.group(1) if team1_id else '',
-                    'team2_id': team2_id.group(1) if team2_id else '',
-                    'venue_id': venue_id.group(1) if venue_id else '',
-                    # Match info
-                    'match_format': match_desc.group(1) if match_desc else '',
-                    'format_type': match_format.group(1) if match_format else '',
-                    'series_name': match_series_name,
-                    'match_date': match_date,
-                    'date_timestamp': date_timestamp,
-                    'state': match_state,
-                    # Team names
-                    'team1': team1_short,
-                    'team2': team2_short,
-                    # Scores
-                    'team1_score': team1_score,
-                    'team2_score': team2_score,
-                    # Other info
-                    'venue': venue,
-                    'result': status.group(1) if status else '',
-                    'match_url': match_url
-                })
+                match['match_date'] = match.pop('date_key') or match['match_date']
+                match_slug = f"{match['team1'].lower().replace(' ', '-')}-vs-{match['team2'].lower().replace(' ', '-')}"
+                match['match_url'] = f"https://www.cricbuzz.com/live-cricket-scorecard/{match['match_id']}/{match_slug}"
+                matches_data.append(match)
             
             matches_data.sort(key=lambda x: x.get('date_timestamp', 0))
             
             # AUTO-SAVE: Dynamically save all matches to database
-            saved_count = 0
-            updated_count = 0
-            for match in matches_data:
-                if match.get('match_id'):
-                    existing = Match.query.filter_by(match_id=str(match['match_id'])).first()
-                    upsert_match(match)
-                    if existing:
-                        updated_count += 1
-                    else:
-                        saved_count += 1
+            saved_count, updated_count = ingest_matches(db, Match, matches_data)
             
             try:
                 db.session.commit()
@@ -2342,53 +1920,7 @@ def scrape_series_json():
             })
         
         else:
-            series_data = []
-            seen = set()
-            
-            schedule_match = re.search(r'"seriesScheduleData"\s*:\s*(\[.*?\])\s*,\s*"', html, re.DOTALL)
-            
-            if schedule_match:
-                try:
-                    import json
-                    schedule_json = schedule_match.group(1)
-                    schedule_json = schedule_json.replace('\\"', '"')
-                    schedule = json.loads(schedule_json)
-                    
-                    for month_group in schedule:
-                        month_year = month_group.get('date', '')
-                        for series in month_group.get('series', []):
-                            sid = str(series.get('id', ''))
-                            name = series.get('name', '')
-                            
-                            if sid and sid not in seen:
-                                seen.add(sid)
-                                slug = name.lower().replace(' ', '-').replace(',', '').replace("'", '').replace('/', '-')
-                                series_url = f"https://www.cricbuzz.com/cricket-series/{sid}/{slug}/matches"
-                                series_data.append({
-                                    'id': sid,
-                                    'name': name,
-                                    'url': series_url,
-                                    'month_year': month_year.title() if month_year else ''
-                                })
-                except Exception as e:
-                    pass
-            
-            if not series_data:
-                match_positions = [(m.start(), m.group(1)) for m in re.finditer(r'"matchInfo"\s*:\s*\{[^}]*"seriesId"\s*:\s*(\d+)', html)]
-                
-                for pos, sid in match_positions:
-                    if sid in seen:
-                        continue
-                    
-                    context = html[pos:pos+2000]
-                    series_name_match = re.search(r'"seriesName"\s*:\s*"([^"]+)"', context)
-                    
-                    if series_name_match:
-                        name = series_name_match.group(1)
-                        seen.add(sid)
-                        slug = name.lower().replace(' ', '-').replace(',', '').replace("'", '')
-                        series_url = f"https://www.cricbuzz.com/cricket-series/{sid}/{slug}/matches"
-                        series_data.append({'id': sid, 'name': name, 'url': series_url, 'month_year': ''})
+            series_data = [dict(series, url=scraper.series_matches_url(series['id'], series['name'])) for series in series_schedule(state)]
             
             return jsonify({
                 'success': True,
@@ -2413,60 +1945,15 @@ def scrape_match_json():
         if not url:
             return jsonify({'success': False, 'message': 'URL or match_id required'}), 400
         
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0'
-        }, timeout=30)
+        response = scraper.http_get(url, timeout=(scraper.HTTP_CONNECT_TIMEOUT, 30))
         
         if response.status_code != 200:
             return jsonify({'success': False, 'message': 'Failed to fetch URL'}), 400
         
-        html = response.text.replace('\\"', '"')
-        
-        match_data = {}
+        state = PageState(response.text)
+        match_data = match_header(state, match_id)
         
-        header_match = re.search(r'"matchHeader"\s*:\s*\{([^{]*(?:\{[^}]*\}[^{]*)*)\}', html)
-        match_state = ''
-        if header_match:
-            header = header_match.group(1)
-            
-            # Extract all IDs from matchHeader
-            mid = re.search(r'"matchId"\s*:\s*(\d+)', header)
-            series_id = re.search(r'"seriesId"\s*:\s*(\d+)', header)
-            match_desc = re.search(r'"matchDescription"\s*:\s*"([^"]*)"', header)
-            match_format = re.search(r'"matchFormat"\s*:\s*"([^"]*)"', header)
-            status = re.search(r'"status"\s*:\s*"([^"]*)"', header)
-            state = re.search(r'"state"\s*:\s*"([^"]*)"', header)
-            toss_winner = re.search(r'"tossWinnerName"\s*:\s*"([^"]*)"', header)
-            toss_decision = re.search(r'"decision"\s*:\s*"([^"]*)"', header)
-            
-            # Team IDs from header
-            team1_id = re.search(r'"team1"\s*:\s*\{[^}]*"id"\s*:\s*(\d+)', header)
-            team2_id = re.search(r'"team2"\s*:\s*\{[^}]*"id"\s*:\s*(\d+)', header)
-            
-            # PRIMARY IDs - Most important
-            match_data['match_id'] = mid.group(1) if mid else match_id
-            match_data['series_id'] = series_id.group(1) if series_id else ''
-            match_data['team1_id'] = team1_id.group(1) if team1_id else ''
-            match_data['team2_id'] = team2_id.group(1) if team2_id else ''
-            
-            # Match info
-            match_data['match'] = match_desc.group(1) if match_desc else ''
-            match_data['format'] = match_format.group(1) if match_format else ''
-            match_data['status'] = status.group(1) if status else ''
-            match_state = state.group(1) if state else ''
-            match_data['state'] = match_state
-            match_data['toss'] = f"{toss_winner.group(1)} won toss, chose to {toss_decision.group(1)}" if toss_winner and toss_decision else ''
-        
-        series_match = re.search(r'"seriesDesc"\s*:\s*"([^"]*)"', html)
-        match_data['series'] = series_match.group(1) if series_match else ''
-        
-        venue_ground = re.search(r'"ground"\s*:\s*"([^"]*)"', html)
-        venue_city = re.search(r'"city"\s*:\s*"([^"]*)"', html)
-        venue_id = re.search(r'"venueInfo"\s*:\s*\{[^}]*"id"\s*:\s*(\d+)', html)
-        match_data['venue'] = f"{venue_ground.group(1)}, {venue_city.group(1)}" if venue_ground and venue_city else ''
-        match_data['venue_id'] = venue_id.group(1) if venue_id else ''
-        
-        if match_state in ['Preview', 'Upcoming', 'Scheduled']:
+        if match_data['state'] in ['Preview', 'Upcoming', 'Scheduled']:
             match_data['team1'] = ''
             match_data['team2'] = ''
             match_data['team1_score'] = 'Match not started'
@@ -2475,11 +1962,9 @@ def scrape_match_json():
             match_data['bowling'] = []
             return jsonify({'success': True, 'data': match_data})
         
-        target_match_id = match_data.get('match_id', match_id)
-        scorecard_pattern = rf'"scoreCard"\s*:\s*\[\s*\{{\s*"matchId"\s*:\s*{target_match_id}'
-        scorecard_match = re.search(scorecard_pattern, html)
+        innings_list = match_innings(state, match_data['match_id'])
         
-        if not scorecard_match:
+        if not innings_list:
             match_data['team1'] = ''
             match_data['team2'] = ''
             match_data['team1_score'] = 'No scorecard available'
@@ -2488,85 +1973,20 @@ def scrape_match_json():
             match_data['bowling'] = []
             return jsonify({'success': True, 'data': match_data})
         
-        scorecard_start = scorecard_match.start()
-        if scorecard_start != -1:
-            scorecard_section = html[scorecard_start:scorecard_start+80000]
-            
-            innings_data = []
-            innings_pattern = r'"inningsId"\s*:\s*(\d+)[^{]*"batTeamDetails"\s*:\s*\{[^}]*"batTeamName"\s*:\s*"([^"]*)"'
-            for m in re.finditer(innings_pattern, scorecard_section):
-                innings_data.append({'id': m.group(1), 'team': m.group(2), 'pos': m.start()})
-            
-            if len(innings_data) >= 1:
-                match_data['team1'] = innings_data[0]['team']
-                inn1_start = innings_data[0]['pos']
-                inn1_end = innings_data[1]['pos'] if len(innings_data) > 1 else inn1_start + 20000
-                inn1_section = scorecard_section[inn1_start:inn1_end]
-                
-                score_match = re.search(r'"scoreDetails"\s*:\s*\{[^}]*"overs"\s*:\s*([\d.]+)[^}]*"runs"\s*:\s*(\d+)[^}]*"wickets"\s*:\s*(\d+)', inn1_section)
-                if score_match:
-                    match_data['team1_score'] = f"{score_match.group(2)}/{score_match.group(3)} ({score_match.group(1)})"
-            
-            if len(innings_data) >= 2:
-                match_data['team2'] = innings_data[1]['team']
-                inn2_start = innings_data[1]['pos']
-                inn2_end = innings_data[2]['pos'] if len(innings_data) > 2 else inn2_start + 20000
-                inn2_section = scorecard_section[inn2_start:inn2_end]
-                
-                score_match = re.search(r'"scoreDetails"\s*:\s*\{[^}]*"overs"\s*:\s*([\d.]+)[^}]*"runs"\s*:\s*(\d+)[^}]*"wickets"\s*:\s*(\d+)', inn2_section)
-                if score_match:
-                    match_data['team2_score'] = f"{score_match.group(2)}/{score_match.group(3)} ({score_match.group(1)})"
-            
-            batting = []
-            bat_pattern = r'"batId":(\d+),"batName":"([^"]*)"[^}]*?"runs":(\d+),"balls":(\d+),"dots":(\d+),"fours":(\d+),"sixes":(\d+)[^}]*?"strikeRate":([\d.]+),"outDesc":"([^"]*)"'
-            bat_matches = re.finditer(bat_pattern, scorecard_section)
-            seen_batters = set()
-            for m in bat_matches:
-                bat_id = m.group(1)
-                if bat_id not in seen_batters:
-                    seen_batters.add(bat_id)
-                    batting.append({
-                        'player_id': bat_id,  # Primary ID for verification
-                        'name': m.group(2),
-                        'runs': m.group(3),
-                        'balls': m.group(4),
-                        'dots': m.group(5),
-                        'fours': m.group(6),
-                        'sixes': m.group(7),
-                        'sr': m.group(8),
-                        'status': m.group(9)
-                    })
-            match_data['batting'] = batting
-            
-            bowling = []
-            bowl_pattern = r'"bowlerId":(\d+),"bowlName":"([^"]*)"[^}]*?"overs":([\d.]+),"maidens":(\d+),"runs":(\d+),"wickets":(\d+),"economy":([\d.]+)'
-            bowl_matches = re.finditer(bowl_pattern, scorecard_section)
-            seen_bowlers = set()
-            for m in bowl_matches:
-                bowl_id = m.group(1)
-                if bowl_id not in seen_bowlers:
-                    seen_bowlers.add(bowl_id)
-                    bowling.append({
-                        'player_id': bowl_id,  # Primary ID for verification
-                        'name': m.group(2),
-                        'overs': m.group(3),
-                        'maidens': m.group(4),
-                        'runs': m.group(5),
-                        'wickets': m.group(6),
-                        'economy': m.group(7)
-                    })
-            match_data['bowling'] = bowling
-        else:
-            match_data['batting'] = []
-            match_data['bowling'] = []
+        for number, innings in enumerate(innings_list[:2], start=1):
+            match_data[f'team{number}'] = (innings.get('batTeamDetails') or {}).get('batTeamName', '')
+            score = innings_total(innings)
+            if score:
+                match_data[f'team{number}_score'] = score
+        
+        match_data['batting'], match_data['bowling'] = scorecard_players(innings_list)
         
         # AUTO-SAVE: Dynamically save match to database
         is_new = False
         if match_data.get('match_id'):
-            existing = Match.query.filter_by(match_id=str(match_data['match_id'])).first()
-            is_new = existing is None
-            upsert_match(match_data)
             try:
+                inserted, _ = ingest_matches(db, Match, [match_data])
+                is_new = inserted > 0
                 db.session.commit()
             except Exception as e:
                 db.session.rollback()
@@ -2648,37 +2068,8 @@ def save_series_matches():
             if series_id_from_url:
                 series = Series.query.filter_by(series_id=series_id_from_url).first()
             
-            for match in matches_list:
-                match_id = match.get('match_id', '')
-                if not match_id:
-                    continue
-                
-                existing = Match.query.filter_by(match_id=match_id).first()
-                if existing:
-                    existing.match_format = match.get('match_format', '')
-                    existing.venue = match.get('venue', '')
-                    existing.match_date = match.get('match_date', '')
-                    existing.team1_name = match.get('team1', '')
-                    existing.team1_score = match.get('team1_score', '')
-                    existing.team2_name = match.get('team2', '')
-                    existing.team2_score = match.get('team2_score', '')
-                    existing.result = match.get('result', '')
-                else:
-                    new_match = Match(
-                        match_id=match_id,
-                        match_format=match.get('match_format', ''),
-                        venue=match.get('venue', ''),
-                        match_date=match.get('match_date', ''),
-                        team1_name=match.get('team1', ''),
-                        team1_score=match.get('team1_score', ''),
-                        team2_name=match.get('team2', ''),
-                        team2_score=match.get('team2_score', ''),
-                        result=match.get('result', ''),
-                        match_url=match.get('match_url', ''),
-                        series_id=series.id if series else None
-                    )
-                    db.session.add(new_match)
-                saved_matches += 1
+            inserted, updated = ingest_matches(db, Match, matches_list, series.id if series else None)
+            saved_matches = inserted + updated
             
             db.session.commit()
         
@@ -2718,12 +2109,15 @@ def save_series_bulk():
         saved = 0
         updated = 0
         
+        series_ids = [s.get('id') for s in series_list if s.get('id')]
+        existing_series = {s.series_id: s for s in Series.query.filter(Series.series_id.in_(series_ids)).all()} if series_ids else {}
+        
         for s in series_list:
             series_id = s.get('id', '')
             if not series_id:
                 continue
             
-            existing = Series.query.filter_by(series_id=series_id).first()
+            existing = existing_series.get(series_id)
             if existing:
                 existing.name = s.get('name', existing.name)
                 existing.series_url = s.get('url', existing.series_url)
@@ -2743,6 +2137,7 @@ def save_series_bulk():
                     category_id=category.id if category else 1
                 )
                 db.session.add(new_series)
+                existing_series[series_id] = new_series
                 saved += 1
         
         db.session.commit()
@@ -2786,30 +2181,32 @@ def clear_all_series():
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/scrape/series/<category_slug>', methods=['POST'])
-def scrape_series(category_slug):
+@job_handler('scrape_series')
+def scrape_series_job(ctx):
+    """Scrape the series list of one category"""
+    category_slug = ctx.params['category_slug']
     try:
-        if category_slug not in scraper.SERIES_CATEGORIES:
-            return jsonify({'success': False, 'message': 'Invalid category'}), 400
-        
         category = SeriesCategory.query.filter_by(slug=category_slug).first()
         if not category:
-            return jsonify({'success': False, 'message': 'Category not found'}), 404
+            raise ValueError('Category not found')
         
+        ctx.progress(0, 1, f'Scraping {category.name} series')
         category_url = scraper.SERIES_CATEGORIES[category_slug]['url']
         series_list = scraper.scrape_series_from_category(category_url)
         
         if not series_list:
-            return jsonify({'success': False, 'message': 'No series found'}), 404
+            return {'message': 'No series found', 'series_scraped': 0, 'series_updated': 0}
         
         series_scraped = 0
         series_updated = 0
+        series_ids = [s['series_id'] for s in series_list if s.get('series_id')]
+        existing_by_id = {s.series_id: s for s in Series.query.filter(Series.series_id.in_(series_ids)).all()} if series_ids else {}
         for series_data in series_list:
             if not series_data.get('series_id'):
                 continue
             
             sid = series_data['series_id']
-            existing = Series.query.filter_by(series_id=sid).first()
+            existing = existing_by_id.get(sid)
             if existing:
                 existing.name = series_data.get('name', existing.name)
                 existing.series_url = series_data.get('series_url', existing.series_url)
@@ -2834,6 +2231,7 @@ def scrape_series(category_slug):
                     category_id=category.id
                 )
                 db.session.add(series)
+                existing_by_id[sid] = series
                 series_scraped += 1
         
         db.session.commit()
@@ -2853,14 +2251,14 @@ def scrape_series(category_slug):
             setting.last_scrape = datetime.utcnow()
             db.session.commit()
         
-        return jsonify({
-            'success': True,
+        return {
             'message': f'Saved {series_scraped} new series, updated {series_updated} existing',
             'series_scraped': series_scraped,
             'series_updated': series_updated
-        })
+        }
     
     except Exception as e:
+        db.session.rollback()
         log = ScrapeLog(
             category=f'series_{category_slug}',
             status='error',
@@ -2868,80 +2266,85 @@ def scrape_series(category_slug):
         )
         db.session.add(log)
         db.session.commit()
+        raise
+
+@app.route('/api/scrape/series/<category_slug>', methods=['POST'])
+def scrape_series(category_slug):
+    try:
+        if category_slug not in scraper.SERIES_CATEGORIES:
+            return jsonify({'success': False, 'message': 'Invalid category'}), 400
+        
+        category = SeriesCategory.query.filter_by(slug=category_slug).first()
+        if not category:
+            return jsonify({'success': False, 'message': 'Category not found'}), 404
+        
+        job = enqueue_job(db, ScrapeJob, 'scrape_series', {'category_slug': category_slug})
+        return jsonify({'success': True, 'job_id': job.id, 'message': f'{category.name} series scrape queued'})
+    except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-match_update_progress = {}
+ACCURATE_MATCH_FIELDS = ['match_format', 'venue', 'match_date', 'team1_name', 'team1_score', 'team2_name', 'team2_score', 'result', 'match_time', 'start_date', 'end_date']
+ACCURATE_COMMIT_BATCH = 20
+
+def apply_accurate_match_data(match, accurate_data):
+    """Copy non-empty fields from a match-page scrape onto a Match row"""
+    for field in ACCURATE_MATCH_FIELDS:
+        if accurate_data.get(field):
+            setattr(match, field, accurate_data[field])
+    match.updated_at = datetime.utcnow()
+
+@job_handler('update_matches_accurate')
+def update_matches_accurate_job(ctx):
+    """Refresh matches from their individual pages; checkpoints every ACCURATE_COMMIT_BATCH matches"""
+    import time
+    series_id = ctx.params.get('series_id')
+    last_match_id = ctx.checkpoint.get('last_id', 0)
+    updated_count = ctx.checkpoint.get('updated', 0)
+    
+    query = Match.query.filter_by(series_id=series_id) if series_id else Match.query
+    total = query.count()
+    done = query.filter(Match.id <= last_match_id).count()
+    matches = query.filter(Match.id > last_match_id).order_by(Match.id).all()
+    ctx.progress(done, total, 'Updating matches')
+    
+    for match in matches:
+        ctx.check_cancelled()
+        try:
+            accurate_data = scraper.update_match_with_accurate_data(match.match_id)
+            if accurate_data:
+                apply_accurate_match_data(match, accurate_data)
+                updated_count += 1
+            time.sleep(0.5)
+        except Exception as e:
+            print(f"Error updating match {match.match_id}: {e}")
+        done += 1
+        if done % ACCURATE_COMMIT_BATCH == 0 or done == total:
+            ctx.save_checkpoint({'last_id': match.id, 'updated': updated_count}, current=done, message=f'Updated {updated_count} matches')
+    
+    log = ScrapeLog(
+        category='matches_update_accurate',
+        status='success',
+        message=f'Updated {updated_count} matches with accurate data',
+        teams_scraped=updated_count
+    )
+    db.session.add(log)
+    db.session.commit()
+    
+    return {'message': f'Updated {updated_count} matches with accurate data', 'updated': updated_count}
 
 @app.route('/api/matches/update-accurate', methods=['POST'])
 def update_all_matches_accurate():
-    """Update all matches with accurate data from individual match pages"""
+    """Queue an update of all matches with accurate data from individual match pages"""
     try:
         data = request.get_json() or {}
         series_id = data.get('series_id')
         
-        if series_id:
-            matches = Match.query.filter_by(series_id=series_id).all()
-        else:
-            matches = Match.query.all()
-        
-        if not matches:
+        query = Match.query.filter_by(series_id=series_id) if series_id else Match.query
+        if not query.first():
             return jsonify({'success': False, 'message': 'No matches found'}), 404
         
-        updated_count = 0
-        for match in matches:
-            try:
-                accurate_data = scraper.update_match_with_accurate_data(match.match_id)
-                
-                if accurate_data:
-                    if accurate_data.get('match_format'):
-                        match.match_format = accurate_data['match_format']
-                    if accurate_data.get('venue'):
-                        match.venue = accurate_data['venue']
-                    if accurate_data.get('match_date'):
-                        match.match_date = accurate_data['match_date']
-                    if accurate_data.get('team1_name'):
-                        match.team1_name = accurate_data['team1_name']
-                    if accurate_data.get('team1_score'):
-                        match.team1_score = accurate_data['team1_score']
-                    if accurate_data.get('team2_name'):
-                        match.team2_name = accurate_data['team2_name']
-                    if accurate_data.get('team2_score'):
-                        match.team2_score = accurate_data['team2_score']
-                    if accurate_data.get('result'):
-                        match.result = accurate_data['result']
-                    if accurate_data.get('match_time'):
-                        match.match_time = accurate_data['match_time']
-                    if accurate_data.get('start_date'):
-                        match.start_date = accurate_data['start_date']
-                    if accurate_data.get('end_date'):
-                        match.end_date = accurate_data['end_date']
-                    
-                    match.updated_at = datetime.utcnow()
-                    updated_count += 1
-                
-                import time
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"Error updating match {match.match_id}: {e}")
-                continue
-        
-        db.session.commit()
-        
-        log = ScrapeLog(
-            category='matches_update_accurate',
-            status='success',
-            message=f'Updated {updated_count} matches with accurate data',
-            teams_scraped=updated_count
-        )
-        db.session.add(log)
-        db.session.commit()
-        
-        return jsonify({
-            'success': True,
-            'message': f'Updated {updated_count} matches with accurate data',
-            'updated': updated_count
-        })
+        job = enqueue_job(db, ScrapeJob, 'update_matches_accurate', {'series_id': series_id} if series_id else {})
+        return jsonify({'success': True, 'job_id': job.id, 'message': 'Match update queued'})
     
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -2958,30 +2361,7 @@ def update_single_match_accurate(match_id):
         accurate_data = scraper.update_match_with_accurate_data(match_id)
         
         if accurate_data:
-            if accurate_data.get('match_format'):
-                match.match_format = accurate_data['match_format']
-            if accurate_data.get('venue'):
-                match.venue = accurate_data['venue']
-            if accurate_data.get('match_date'):
-                match.match_date = accurate_data['match_date']
-            if accurate_data.get('team1_name'):
-                match.team1_name = accurate_data['team1_name']
-            if accurate_data.get('team1_score'):
-                match.team1_score = accurate_data['team1_score']
-            if accurate_data.get('team2_name'):
-                match.team2_name = accurate_data['team2_name']
-            if accurate_data.get('team2_score'):
-                match.team2_score = accurate_data['team2_score']
-            if accurate_data.get('result'):
-                match.result = accurate_data['result']
-            if accurate_data.get('match_time'):
-                match.match_time = accurate_data['match_time']
-            if accurate_data.get('start_date'):
-                match.start_date = accurate_data['start_date']
-            if accurate_data.get('end_date'):
-                match.end_date = accurate_data['end_date']
-            
-            match.updated_at = datetime.utcnow()
+            apply_accurate_match_data(match, accurate_data)
             db.session.commit()
             
             return jsonify({
@@ -2995,8 +2375,6 @@ def update_single_match_accurate(match_id):
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-match_scrape_progress = {}
-
 @app.route('/api/series/<int:series_id>/matches')
 def get_series_matches(series_id):
     try:
@@ -3018,71 +2396,59 @@ def get_series_matches(series_id):
     except Exception as e:
         return jsonify({'matches': [], 'error': str(e)})
 
+@job_handler('scrape_all_series_matches')
+def scrape_all_series_matches_job(ctx):
+    """Scrape matches for every series; commits and checkpoints after each series"""
+    last_series_id = ctx.checkpoint.get('last_id', 0)
+    total_matches = ctx.checkpoint.get('total_matches', 0)
+    series_processed = ctx.checkpoint.get('series_processed', 0)
+    
+    total = Series.query.count()
+    done = Series.query.filter(Series.id <= last_series_id).count()
+    all_series = Series.query.filter(Series.id > last_series_id).order_by(Series.id).all()
+    ctx.progress(done, total, 'Scraping series matches')
+    
+    for series in all_series:
+        ctx.check_cancelled()
+        try:
+            matches_list = scraper.scrape_matches_from_series(series.series_url)
+            if matches_list:
+                inserted, updated = ingest_matches(db, Match, matches_list, series.id)
+                total_matches += inserted + updated
+                series_processed += 1
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Error scraping matches for {series.name}: {e}")
+        done += 1
+        ctx.save_checkpoint(
+            {'last_id': series.id, 'total_matches': total_matches, 'series_processed': series_processed},
+            current=done, message=f'Scraped {series.name}'
+        )
+    
+    log = ScrapeLog(
+        category='all_series_matches',
+        status='success',
+        message=f'Scraped {total_matches} matches from {series_processed} series',
+        teams_scraped=total_matches
+    )
+    db.session.add(log)
+    db.session.commit()
+    
+    return {
+        'message': f'Scraped {total_matches} matches from {series_processed} series',
+        'total_matches': total_matches,
+        'series_processed': series_processed
+    }
+
 @app.route('/api/scrape/all-series-matches', methods=['POST'])
 def scrape_all_series_matches():
-    """Scrape matches for all series in database"""
+    """Queue a match scrape for all series in database"""
     try:
-        all_series = Series.query.all()
-        if not all_series:
+        if not Series.query.first():
             return jsonify({'success': False, 'message': 'No series found'}), 404
         
-        total_matches = 0
-        series_processed = 0
-        
-        for series in all_series:
-            try:
-                matches_list = scraper.scrape_matches_from_series(series.series_url)
-                if matches_list:
-                    for match_data in matches_list:
-                        match_id = match_data.get('match_id')
-                        if not match_id:
-                            continue
-                        
-                        existing = Match.query.filter_by(match_id=match_id).first()
-                        if existing:
-                            existing.match_format = match_data.get('match_format', existing.match_format)
-                            existing.venue = match_data.get('venue', existing.venue)
-                            existing.match_date = match_data.get('match_date', existing.match_date)
-                            existing.team1_name = match_data.get('team1', existing.team1_name)
-                            existing.team2_name = match_data.get('team2', existing.team2_name)
-                            existing.result = match_data.get('result', existing.result)
-                            existing.series_id = series.id
-                            existing.updated_at = datetime.utcnow()
-                        else:
-                            match = Match(
-                                match_id=match_id,
-                                match_format=match_data.get('match_format', ''),
-                                venue=match_data.get('venue', ''),
-                                match_date=match_data.get('match_date', ''),
-                                team1_name=match_data.get('team1', ''),
-                                team2_name=match_data.get('team2', ''),
-                                result=match_data.get('result', ''),
-                                series_id=series.id
-                            )
-                            db.session.add(match)
-                        total_matches += 1
-                    series_processed += 1
-            except Exception as e:
-                app.logger.error(f"Error scraping matches for {series.name}: {e}")
-                continue
-        
-        db.session.commit()
-        
-        log = ScrapeLog(
-            category='all_series_matches',
-            status='success',
-            message=f'Scraped {total_matches} matches from {series_processed} series',
-            teams_scraped=total_matches
-        )
-        db.session.add(log)
-        db.session.commit()
-        
-        return jsonify({
-            'success': True,
-            'message': f'Scraped {total_matches} matches from {series_processed} series',
-            'total_matches': total_matches,
-            'series_processed': series_processed
-        })
+        job = enqueue_job(db, ScrapeJob, 'scrape_all_series_matches')
+        return jsonify({'success': True, 'job_id': job.id, 'message': 'Series match scrape queued'})
     
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -3114,7 +2480,6 @@ def scrape_matches(series_id):
         format_order = {'1st ODI': 0, '2nd ODI': 1, '3rd ODI': 2, '1st T20I': 3, '2nd T20I': 4, '3rd T20I': 5, '4th T20I': 6, '5th T20I': 7, '1st Test': 0, '2nd Test': 1, '3rd Test': 2}
         
         for idx, match_data in enumerate(matches_list):
-            match_id = match_data['match_id']
             match_format = match_data.get('match_format', '')
             
             # Generate date if not provided
@@ -3124,37 +2489,10 @@ def scrape_matches(series_id):
                 match_dt = base_date + timedelta(days=format_idx * 3)
                 match_date = match_dt.strftime('%b %d, %Y')
             
-            existing = Match.query.filter_by(match_id=match_id).first()
-            if existing:
-                existing.match_format = match_format
-                existing.venue = match_data.get('venue')
-                if match_date:
-                    existing.match_date = match_date
-                existing.team1_name = match_data.get('team1_name')
-                existing.team1_score = match_data.get('team1_score')
-                existing.team2_name = match_data.get('team2_name')
-                existing.team2_score = match_data.get('team2_score')
-                existing.result = match_data.get('result')
-                existing.match_url = match_data.get('match_url')
-                existing.series_id = series_id  # Link match to series
-                existing.updated_at = datetime.utcnow()
-            else:
-                match = Match(
-                    match_id=match_id,
-                    match_format=match_format,
-                    venue=match_data.get('venue'),
-                    match_date=match_date,
-                    team1_name=match_data.get('team1_name'),
-                    team1_score=match_data.get('team1_score'),
-                    team2_name=match_data.get('team2_name'),
-                    team2_score=match_data.get('team2_score'),
-                    result=match_data.get('result'),
-                    match_url=match_data.get('match_url'),
-                    series_id=series_id
-                )
-                db.session.add(match)
+            match_data['match_date'] = match_date
             matches_scraped += 1
         
+        ingest_matches(db, Match, matches_list, series_id)
         db.session.commit()
         
         log = ScrapeLog(
@@ -3376,47 +2714,9 @@ def scrape_live_scores_api():
         if not result.get('success'):
             return jsonify(result), 500
         
-        saved = 0
-        updated = 0
-        
-        for match_data in result.get('matches', []):
-            if not match_data.get('match_id'):
-                continue
-            
-            existing = Match.query.filter_by(match_id=match_data['match_id']).first()
-            
-            if existing:
-                existing.team1_name = match_data.get('team1_name') or match_data.get('team1') or existing.team1_name
-                existing.team2_name = match_data.get('team2_name') or match_data.get('team2') or existing.team2_name
-                existing.match_format = match_data.get('match_format', existing.match_format)
-                existing.state = match_data.get('state') or match_data.get('status') or existing.state
-                existing.match_url = match_data.get('match_url', existing.match_url)
-                existing.cricbuzz_series_id = match_data.get('series_id', existing.cricbuzz_series_id)
-                existing.team1_score = match_data.get('team1_score') or existing.team1_score
-                existing.team2_score = match_data.get('team2_score') or existing.team2_score
-                existing.team1_flag = match_data.get('team1_flag') or existing.team1_flag
-                existing.team2_flag = match_data.get('team2_flag') or existing.team2_flag
-                existing.result = match_data.get('result') or existing.result
-                existing.updated_at = datetime.utcnow()
-                updated += 1
-            else:
-                new_match = Match(
-                    match_id=match_data['match_id'],
-                    team1_name=match_data.get('team1_name') or match_data.get('team1', ''),
-                    team2_name=match_data.get('team2_name') or match_data.get('team2', ''),
-                    match_format=match_data.get('match_format', ''),
-                    state=match_data.get('state') or match_data.get('status', 'Upcoming'),
-                    match_url=match_data.get('match_url', ''),
-                    cricbuzz_series_id=match_data.get('series_id'),
-                    team1_score=match_data.get('team1_score', ''),
-                    team2_score=match_data.get('team2_score', ''),
-                    team1_flag=match_data.get('team1_flag', ''),
-                    team2_flag=match_data.get('team2_flag', ''),
-                    result=match_data.get('result', '')
-                )
-                db.session.add(new_match)
-                saved += 1
-        
+        saved, updated = ingest_matches(db, Match, result.get('matches', []))
+        db.session.flush()
+        apply_live_order(db, Match, [m.get('match_id') for m in result.get('matches', [])])
         db.session.commit()
         
         return jsonify({
@@ -3573,16 +2873,47 @@ def admin_auto_post_run_now():
 @app.route('/api/live-matches')
 def api_live_matches():
     match_type = request.args.get('type', 'all')
+    since = request.args.get('since', type=int)
     try:
         if match_type == 'live':
-            matches = Match.query.filter(Match.state.in_(['live', 'Live', 'LIVE', 'In Progress', 'Innings Break', 'Toss', 'Stumps', 'Lunch', 'Tea', 'Drinks'])).order_by(Match.updated_at.desc()).all()
+            matches_query = Match.query.filter(Match.state.in_(['live', 'Live', 'LIVE', 'In Progress', 'Innings Break', 'Toss', 'Stumps', 'Lunch', 'Tea', 'Drinks']))
         elif match_type == 'upcoming':
-            matches = Match.query.filter(Match.state.in_(['upcoming', 'Upcoming', 'UPCOMING'])).order_by(Match.match_date).all()
+            matches_query = Match.query.filter(Match.state.in_(['upcoming', 'Upcoming', 'UPCOMING']))
         elif match_type == 'recent':
-            matches = Match.query.filter(Match.state.in_(['Complete', 'complete', 'COMPLETE', 'Result'])).order_by(Match.updated_at.desc()).limit(20).all()
+            matches_query = Match.query.filter(Match.state.in_(['Complete', 'complete', 'COMPLETE', 'Result']))
         else:
             # Return all matches for card refresh (default)
-            matches = Match.query.order_by(Match.updated_at.desc()).limit(50).all()
+            matches_query = Match.query
+        
+        # since=<version>: only matches whose score, state or result changed after that version
+        if since is not None:
+            matches_query = matches_query.filter(Match.change_version > since)
+        
+        # Answer revalidations from one aggregate query, before loading and serialising rows
+        etag = match_set_etag(matches_query, match_type, since)
+        cached = not_modified(etag, LIVE_API_MAX_AGE)
+        if cached:
+            return cached
+        
+        # Read the counter before the rows: a change committed in between is sent twice, never skipped
+        version = db.session.query(ChangeCounter.value).filter_by(name=MATCH_CHANGE_COUNTER).scalar() or 0
+        has_more = False
+        if since is not None:
+            matches = matches_query.order_by(Match.change_version).limit(DELTA_API_LIMIT + 1).all()
+            has_more = len(matches) > DELTA_API_LIMIT
+            if has_more:
+                # Stop at a version boundary so the next since= page starts cleanly
+                last_version = matches[DELTA_API_LIMIT].change_version
+                matches = [m for m in matches if m.change_version < last_version] or matches_query.filter(Match.change_version == last_version).all()
+                version = matches[-1].change_version
+        elif match_type == 'upcoming':
+            matches = matches_query.order_by(Match.match_date).all()
+        elif match_type == 'recent':
+            matches = matches_query.order_by(Match.updated_at.desc()).limit(20).all()
+        elif match_type == 'live':
+            matches = matches_query.order_by(Match.updated_at.desc()).all()
+        else:
+            matches = matches_query.order_by(Match.updated_at.desc()).limit(50).all()
         
         result = []
         for m in matches:
@@ -3595,18 +2926,41 @@ def api_live_matches():
                 'match_format': m.match_format,
                 'series_name': m.series_name,
                 'state': m.state,
-                'result': m.result
+                'result': m.result,
+                'version': m.change_version
             })
-        return jsonify({'success': True, 'matches': result})
+        return cacheable(jsonify({'success': True, 'matches': result, 'version': version, 'has_more': has_more}), etag, LIVE_API_MAX_AGE)
     except Exception as e:
         return jsonify({'success': False, 'matches': [], 'error': str(e)})
 
+@app.route('/api/live-stream')
+def api_live_stream():
+    """Server-Sent Events stream of score changes found by the live-score job"""
+    if not live_hub.connect():
+        return jsonify({'success': False, 'message': 'Too many live streams'}), 503, {'Retry-After': '30'}
+    ensure_listener()
+    response = Response(
+        live_hub.stream(request.headers.get('Last-Event-ID')),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+    # Runs whether or not the stream was ever iterated (HEAD, client gone before the first byte)
+    response.call_on_close(live_hub.disconnect)
+    return response
+
 @app.route('/api/match/<match_id>')
 def api_get_match_by_id(match_id):
     try:
+        # The row's updated_at is enough to answer a revalidation
+        updated_at = db.session.query(Match.updated_at).filter_by(match_id=match_id).scalar()
+        etag = hashlib.sha1(f"{match_id}|{updated_at.isoformat() if updated_at else ''}".encode('utf-8')).hexdigest()[:20]
+        cached = not_modified(etag, LIVE_API_MAX_AGE) if updated_at else None
+        if cached:
+            return cached
+        
         match = Match.query.filter_by(match_id=match_id).first()
         if match:
-            return jsonify({
+            return cacheable(jsonify({
                 'success': True,
                 'match': {
                     'match_id': match.match_id,
@@ -3619,7 +2973,7 @@ def api_get_match_by_id(match_id):
                     'state': match.state,
                     'result': match.result
                 }
-            })
+            }), etag, LIVE_API_MAX_AGE)
         else:
             return jsonify({'success': False, 'match': None, 'message': 'Match not found'})
     except Exception as e:
@@ -3646,6 +3000,7 @@ def api_create_category():
         )
         db.session.add(category)
         db.session.commit()
+        bump_template_context_version()
         return jsonify({'success': True, 'id': category.id})
     except Exception as e:
         db.session.rollback()
@@ -3670,6 +3025,7 @@ def api_update_category(cat_id):
         category.navbar_order = data.get('navbar_order', category.navbar_order)
         
         db.session.commit()
+        bump_template_context_version()
         return jsonify({'success': True})
     except Exception as e:
         db.session.rollback()
@@ -3681,6 +3037,7 @@ def api_delete_category(cat_id):
         category = PostCategory.query.get_or_404(cat_id)
         db.session.delete(category)
         db.session.commit()
+        bump_template_context_version()
         return jsonify({'success': True})
     except Exception as e:
         db.session.rollback()
@@ -3908,25 +3265,12 @@ def view_post(slug):
     scorecard_data = None
     if post.match_id:
         try:
-            from scraper import scrape_scorecard
             match = Match.query.filter_by(match_id=post.match_id).first()
-            scorecard_raw = scrape_scorecard(post.match_id)
+            scorecard_raw = get_match_scorecard(post.match_id, match)
             
-            if scorecard_raw:
+            if scorecard_raw.get('success'):
                 innings = scorecard_raw.get('innings', [])
-                batting_data = []
-                bowling_data = []
-                
-                for inning in innings:
-                    team_name = inning.get('team_name', '')
-                    batting_data.append({
-                        'team': team_name,
-                        'batsmen': inning.get('batting', [])
-                    })
-                    bowling_data.append({
-                        'team': team_name,
-                        'bowlers': inning.get('bowling', [])
-                    })
+                batting_data, bowling_data = scorecard_tables(innings)
                 
                 team1_name = scorecard_raw.get('team1_name') or (innings[0].get('team_name') if len(innings) > 0 else '') or (match.team1_name if match else '')
                 team2_name = scorecard_raw.get('team2_name') or (innings[1].get('team_name') if len(innings) > 1 else '') or (match.team2_name if match else '')
@@ -3966,25 +3310,81 @@ def view_category(slug):
     
     return render_template('category.html', category=category, posts=posts, categories=categories, recent_posts=recent_posts)
 
+# ============== TEMPLATE CONTEXT CACHE ==============
+
+TEMPLATE_CONTEXT_TTL = int(os.environ.get('TEMPLATE_CONTEXT_TTL', 60))
+
+# Site settings, navbar categories and footer pages shared by every template.
+# Loaded once per worker as plain snapshots (no session access while rendering)
+# and rebuilt when an admin write in this worker bumps the version, or when
+# another worker's write shows up in the stamp checked every TEMPLATE_CONTEXT_TTL seconds.
+template_context_cache = {'version': 0, 'loaded_version': -1, 'stamp': None, 'checked_at': 0, 'context': None}
+template_context_lock = threading.Lock()
+
+def bump_template_context_version():
+    """Force site settings, navbar and footer to reload on the next render"""
+    with template_context_lock:
+        template_context_cache['version'] += 1
+
+def snapshot_row(obj):
+    """Copy an ORM row's column values into a plain object for templates"""
+    from types import SimpleNamespace
+    return SimpleNamespace(**{column.key: getattr(obj, column.key) for column in obj.__table__.columns})
+
+def get_template_context_stamp():
+    """Cheap fingerprint of the tables behind the shared template context"""
+    def table_stamp(model):
+        return db.session.query(db.func.count(model.id), db.func.max(model.updated_at)).one()
+    return (tuple(table_stamp(SiteSettings)), tuple(table_stamp(PostCategory)), tuple(table_stamp(Page)))
+
+def build_template_context():
+    """Query site settings, navbar categories and footer pages once"""
+    settings = SiteSettings.query.first() or SiteSettings()
+    nav_categories = PostCategory.query.filter_by(show_in_navbar=True).order_by(PostCategory.navbar_order).all()
+    footer_pages = Page.query.filter_by(is_published=True, show_in_footer=True).order_by(Page.footer_order).all()
+    return {
+        'site_settings': snapshot_row(settings),
+        'nav_categories': [snapshot_row(cat) for cat in nav_categories],
+        'footer_pages': [snapshot_row(page) for page in footer_pages],
+    }
+
+def load_template_context():
+    """Return the cached shared template context, reloading when stale"""
+    import time
+    now = time.time()
+    with template_context_lock:
+        stale = template_context_cache['loaded_version'] != template_context_cache['version']
+        due_check = now - template_context_cache['checked_at'] >= TEMPLATE_CONTEXT_TTL
+        if not stale and not due_check:
+            return template_context_cache['context']
+        # Claim this check so concurrent renders keep using the current snapshot
+        template_context_cache['checked_at'] = now
+        version = template_context_cache['version']
+    
+    stamp = get_template_context_stamp()
+    if stale or stamp != template_context_cache['stamp'] or template_context_cache['context'] is None:
+        context = build_template_context()
+        with template_context_lock:
+            template_context_cache.update({'context': context, 'stamp': stamp, 'loaded_version': version})
+    return template_context_cache['context']
+
 @app.context_processor
 def inject_navbar_categories():
     try:
-        nav_categories = PostCategory.query.filter_by(show_in_navbar=True).order_by(PostCategory.navbar_order).all()
-        footer_pages = Page.query.filter_by(is_published=True, show_in_footer=True).order_by(Page.footer_order).all()
-        return dict(nav_categories=nav_categories, footer_pages=footer_pages)
+        context = load_template_context()
+        return dict(nav_categories=context['nav_categories'], footer_pages=context['footer_pages'])
     except:
+        db.session.rollback()
         return dict(nav_categories=[], footer_pages=[])
 
 @app.route('/api/scorecard/<match_id>')
 def api_get_scorecard(match_id):
     try:
-        from scraper import scrape_scorecard
-        
         match = Match.query.filter_by(match_id=match_id).first()
         
-        scorecard_data = scrape_scorecard(match_id)
+        scorecard_data = get_match_scorecard(match_id, match)
         
-        if not scorecard_data:
+        if not scorecard_data.get('success'):
             if match:
                 return jsonify({
                     'success': True,
@@ -3999,19 +3399,7 @@ def api_get_scorecard(match_id):
             return jsonify({'success': False, 'message': 'Unable to fetch scorecard'})
         
         innings = scorecard_data.get('innings', [])
-        batting_data = []
-        bowling_data = []
-        
-        for inning in innings:
-            team_name = inning.get('team_name', '')
-            batting_data.append({
-                'team': team_name,
-                'batsmen': inning.get('batting', [])
-            })
-            bowling_data.append({
-                'team': team_name,
-                'bowlers': inning.get('bowling', [])
-            })
+        batting_data, bowling_data = scorecard_tables(innings)
         
         team1_name = scorecard_data.get('team1_name') or (innings[0].get('team_name') if len(innings) > 0 else '') or (match.team1_name if match else '')
         team2_name = scorecard_data.get('team2_name') or (innings[1].get('team_name') if len(innings) > 1 else '') or (match.team2_name if match else '')
@@ -4019,7 +3407,7 @@ def api_get_scorecard(match_id):
         team2_score = (f"{innings[1].get('total_score', '')} ({innings[1].get('overs', '')} Ov)" if len(innings) > 1 and innings[1].get('total_score') else '') or (match.team2_score if match else '')
         result = scorecard_data.get('result') or (match.result if match else '')
         
-        if match:
+        if match and not scorecard_data.get('from_db'):
             match.team1_name = team1_name
             match.team2_name = team2_name
             match.team1_score = team1_score
@@ -4133,6 +3521,7 @@ def api_create_page():
         
         db.session.add(page)
         db.session.commit()
+        bump_template_context_version()
         return jsonify({'success': True, 'id': page.id})
     except Exception as e:
         db.session.rollback()
@@ -4161,6 +3550,7 @@ def api_update_page(page_id):
         page.footer_order = data.get('footer_order', page.footer_order)
         
         db.session.commit()
+        bump_template_context_version()
         return jsonify({'success': True})
     except Exception as e:
         db.session.rollback()
@@ -4173,6 +3563,7 @@ def api_delete_page(page_id):
         page = Page.query.get_or_404(page_id)
         db.session.delete(page)
         db.session.commit()
+        bump_template_context_version()
         return jsonify({'success': True})
     except Exception as e:
         db.session.rollback()
@@ -4185,69 +3576,126 @@ def view_page(slug):
 
 # ============== REDIRECT MANAGEMENT ==============
 
+REDIRECT_CACHE_TTL = int(os.environ.get('REDIRECT_CACHE_TTL', 60))
+REDIRECT_HIT_FLUSH_SECONDS = 30
+
+# Active redirects keyed by exact old_url and by lower(old_url); rebuilt when
+# an admin edits redirects in this worker, or when another worker's edit shows
+# up in the table stamp checked every REDIRECT_CACHE_TTL seconds.
+redirect_cache = {'version': 0, 'loaded_version': -1, 'stamp': None, 'checked_at': 0, 'exact': {}, 'lower': {}}
+redirect_hits = {}
+redirect_hits_flushed_at = [0]
+redirect_cache_lock = threading.Lock()
+
+def bump_redirect_version():
+    """Force the redirect map to reload on the next request"""
+    with redirect_cache_lock:
+        redirect_cache['version'] += 1
+
+def get_redirect_stamp():
+    """Cheap fingerprint of the redirects table (row count + last change)"""
+    count, last_updated = db.session.query(db.func.count(Redirect.id), db.func.max(Redirect.updated_at)).one()
+    return (count, last_updated)
+
+def load_redirect_map():
+    """Return (exact, lower) maps of active redirects, reloading when stale"""
+    import time
+    now = time.time()
+    with redirect_cache_lock:
+        stale = redirect_cache['loaded_version'] != redirect_cache['version']
+        due_check = now - redirect_cache['checked_at'] >= REDIRECT_CACHE_TTL
+        if not stale and not due_check:
+            return redirect_cache['exact'], redirect_cache['lower']
+        # Claim this check so concurrent requests keep using the current map
+        redirect_cache['checked_at'] = now
+        version = redirect_cache['version']
+    
+    stamp = get_redirect_stamp()
+    if stale or stamp != redirect_cache['stamp']:
+        exact = {}
+        lower = {}
+        rows = db.session.query(Redirect.id, Redirect.old_url, Redirect.new_url, Redirect.redirect_type).filter(Redirect.is_active == True).all()
+        for redirect_id, old_url, new_url, redirect_type in rows:
+            rule = (redirect_id, new_url, redirect_type)
+            exact[old_url] = rule
+            lower.setdefault(old_url.lower(), rule)
+        with redirect_cache_lock:
+            redirect_cache.update({'exact': exact, 'lower': lower, 'stamp': stamp, 'loaded_version': version})
+    return redirect_cache['exact'], redirect_cache['lower']
+
+def flush_redirect_hits():
+    """Write accumulated redirect hit counts in one batch"""
+    with redirect_cache_lock:
+        pending = dict(redirect_hits)
+        redirect_hits.clear()
+    if not pending:
+        return
+    with app.app_context():
+        try:
+            db.session.execute(
+                db.text("UPDATE redirects SET hit_count = COALESCE(hit_count, 0) + :hits WHERE id = :id"),
+                [{'id': redirect_id, 'hits': hits} for redirect_id, hits in pending.items()]
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logging.error(f"Failed to flush redirect hits: {e}")
+
+def record_redirect_hit(redirect_id):
+    """Count a hit in memory; flush in the background every REDIRECT_HIT_FLUSH_SECONDS"""
+    import time
+    now = time.time()
+    with redirect_cache_lock:
+        redirect_hits[redirect_id] = redirect_hits.get(redirect_id, 0) + 1
+        due = now - redirect_hits_flushed_at[0] >= REDIRECT_HIT_FLUSH_SECONDS
+        if due:
+            redirect_hits_flushed_at[0] = now
+    if due:
+        threading.Thread(target=flush_redirect_hits, daemon=True).start()
+
+atexit.register(flush_redirect_hits)
+
 @app.before_request
 def check_redirects():
     """Check if current URL has a redirect rule"""
     if request.path.startswith('/static/') or request.path.startswith('/api/') or request.path.startswith('/admin/'):
         return None
     
+    exact, lower = load_redirect_map()
+    if not exact:
+        return None
+    
     # Get original path
     original_path = request.path
     
-    # Try multiple URL variations to find a match
-    paths_to_try = []
-    
-    # 1. Original path as-is
-    paths_to_try.append(original_path)
-    
-    # 2. Without trailing slash (if not root)
+    # Try multiple URL variations to find a match:
+    # as-is, without/with trailing slash, without leading slash, lowercase
+    paths_to_try = [original_path]
     if original_path != '/' and original_path.endswith('/'):
         paths_to_try.append(original_path.rstrip('/'))
-    
-    # 3. With trailing slash
     if not original_path.endswith('/'):
         paths_to_try.append(original_path + '/')
-    
-    # 4. Without leading slash
     if original_path.startswith('/'):
         paths_to_try.append(original_path[1:])
-    
-    # 5. Lowercase version
     paths_to_try.append(original_path.lower())
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_paths = []
-    for p in paths_to_try:
-        if p not in seen:
-            seen.add(p)
-            unique_paths.append(p)
-    
-    # Try to find a matching redirect
-    redirect_rule = None
-    for path in unique_paths:
-        redirect_rule = Redirect.query.filter_by(old_url=path, is_active=True).first()
-        if redirect_rule:
+    rule = None
+    for path in paths_to_try:
+        rule = exact.get(path)
+        if rule:
             break
     
     # Also try case-insensitive match if still not found
-    if not redirect_rule:
-        redirect_rule = Redirect.query.filter(
-            db.func.lower(Redirect.old_url) == original_path.lower(),
-            Redirect.is_active == True
-        ).first()
+    if not rule:
+        rule = lower.get(original_path.lower())
     
-    if redirect_rule:
+    if rule:
+        redirect_id, new_url, redirect_type = rule
         # Prevent redirect loop - don't redirect to same URL
-        if redirect_rule.new_url == original_path or redirect_rule.new_url == original_path.rstrip('/'):
+        if new_url == original_path or new_url == original_path.rstrip('/'):
             return None
-        # Update hit count safely
-        try:
-            redirect_rule.hit_count += 1
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-        return redirect(redirect_rule.new_url, code=redirect_rule.redirect_type)
+        record_redirect_hit(redirect_id)
+        return redirect(new_url, code=redirect_type)
     return None
 
 @app.route('/admin/redirects')
@@ -4309,6 +3757,7 @@ def admin_save_redirect():
             message = 'Redirect added successfully'
         
         db.session.commit()
+        bump_redirect_version()
         return redirect(url_for('admin_redirects', message=message, type='success'))
     except Exception as e:
         db.session.rollback()
@@ -4359,6 +3808,7 @@ def admin_bulk_import_redirects():
             imported += 1
         
         db.session.commit()
+        bump_redirect_version()
         return redirect(url_for('admin_redirects', message=f'Imported {imported} redirects', type='success'))
     except Exception as e:
         db.session.rollback()
@@ -4371,6 +3821,7 @@ def admin_toggle_redirect(redirect_id):
         redirect_obj = Redirect.query.get_or_404(redirect_id)
         redirect_obj.is_active = not redirect_obj.is_active
         db.session.commit()
+        bump_redirect_version()
         status = 'enabled' if redirect_obj.is_active else 'disabled'
         return redirect(url_for('admin_redirects', message=f'Redirect {status}', type='success'))
     except Exception as e:
@@ -4384,6 +3835,7 @@ def admin_delete_redirect(redirect_id):
         redirect_obj = Redirect.query.get_or_404(redirect_id)
         db.session.delete(redirect_obj)
         db.session.commit()
+        bump_redirect_version()
         return redirect(url_for('admin_redirects', message='Redirect deleted', type='success'))
     except Exception as e:
         db.session.rollback()
@@ -4396,6 +3848,7 @@ def get_site_settings():
         settings = SiteSettings()
         db.session.add(settings)
         db.session.commit()
+        bump_template_context_version()
     return settings
 
 @app.route('/admin/seo')
@@ -4440,12 +3893,14 @@ def admin_ads_txt():
         settings = SiteSettings()
         db.session.add(settings)
         db.session.commit()
+        bump_template_context_version()
 
     if request.method == 'POST':
         content = request.form.get('ads_txt_content', '').strip()
         try:
             settings.ads_txt_content = content
             db.session.commit()
+            bump_template_context_version()
             message = 'ads.txt successfully saved!'
             success = True
         except Exception as e:
@@ -4481,6 +3936,7 @@ def admin_adsense():
         settings.ad_match_page_code = request.form.get('ad_match_page_code', '').strip()
         
         db.session.commit()
+        bump_template_context_version()
         message = "AdSense settings saved successfully!"
     
     return render_template('admin/adsense.html', settings=settings, message=message)
@@ -4495,6 +3951,7 @@ def admin_analytics():
         settings.ga_tracking_id = request.form.get('ga_tracking_id', '').strip()
         settings.ga_enabled = 'ga_enabled' in request.form
         db.session.commit()
+        bump_template_context_version()
         message = "Analytics settings saved successfully!"
     
     return render_template('admin/analytics.html', settings=settings, message=message)
@@ -4524,6 +3981,7 @@ def admin_theme():
         settings.link_color = request.form.get('link_color', '#1a472a')
         
         db.session.commit()
+        bump_template_context_version()
         message = "Theme settings saved successfully!"
     
     return render_template('admin/theme.html', settings=settings, message=message)
@@ -4532,10 +3990,9 @@ def admin_theme():
 def inject_site_settings():
     """Inject site settings into all templates"""
     try:
-        settings = SiteSettings.query.first()
-        if not settings:
-            settings = SiteSettings()
+        settings = load_template_context()['site_settings']
     except:
+        db.session.rollback()
         settings = None
     return dict(site_settings=settings)
 
@@ -4708,6 +4165,44 @@ def delete_push_subscriber(sub_id):
         db.session.rollback()
         return jsonify({'success': False, 'message': str(e)}), 500
 
+# ============== SCRAPE JOB QUEUE ==============
+
+@app.route('/api/jobs')
+def api_list_jobs():
+    """Recent jobs, newest first; optional ?type= and ?status= filters"""
+    query = ScrapeJob.query
+    if request.args.get('type'):
+        query = query.filter(ScrapeJob.job_type == request.args['type'])
+    if request.args.get('status'):
+        query = query.filter(ScrapeJob.status == request.args['status'])
+    jobs = query.order_by(ScrapeJob.id.desc()).limit(request.args.get('limit', 50, type=int)).all()
+    return jsonify({'success': True, 'jobs': [job_to_dict(job) for job in jobs]})
+
+@app.route('/api/jobs/<int:job_id>')
+def api_job_progress(job_id):
+    """Progress and outcome of any queued scrape job"""
+    job = ScrapeJob.query.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'message': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job_to_dict(job)})
+
+@app.route('/api/jobs/<int:job_id>/cancel', methods=['POST'])
+def api_cancel_job(job_id):
+    try:
+        job = cancel_job(db, ScrapeJob, job_id)
+        if not job:
+            return jsonify({'success': False, 'message': 'Job not found'}), 404
+        return jsonify({'success': True, 'job': job_to_dict(job)})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+# JOB_WORKER_MODE=embedded runs job workers inside every app process (the
+# per-type concurrency limits are enforced in the database, so this is safe
+# with several gunicorn workers); set it to "off" when run_worker.py runs them
+if os.environ.get('JOB_WORKER_MODE', 'embedded').lower() == 'embedded':
+    start_job_workers(app, db, ScrapeJob)
+
 if __name__ == '__main__':
     debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
     app.run(host='0.0.0.0', port=5000, debug=debug_mode)
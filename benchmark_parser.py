@@ -0,0 +1,99 @@
+"""
+Compare HTML parse cost before/after the scraper's parser changes:
+`python benchmark_parser.py [fixture_dir] [--runs N]`.
+
+Fixtures are stored pages, either *.html / *.html.gz files or the scraper's
+HTTP cache (the default directory), whose .json metadata records each page's
+URL. For every page this prints the median parse time and peak memory of a
+full html.parser tree ("before") and of scraper.parse_html with the strainer
+that page type uses ("after").
+"""
+import argparse
+import gzip
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+import scraper
+
+
+def strainer_for(url):
+    """The parse_only filter the scraper applies to this kind of page"""
+    if '/cricket-match/live-scores' in url:
+        return 'match container', scraper.MATCH_CONTAINER_ONLY
+    if '/cricket-match-squads/' in url:
+        return 'title + links', scraper.TITLE_AND_LINKS_ONLY
+    if '/profiles/' in url:
+        return 'body', scraper.BODY_ONLY
+    if '/cricket-team' in url and not url.rstrip('/').endswith('/players'):
+        return 'links', scraper.LINKS_ONLY
+    return 'full', None
+
+
+def load_fixtures(fixture_dir):
+    """Yield (url, html) for every stored page under fixture_dir; the file name stands in for a missing URL"""
+    for root, _, files in os.walk(fixture_dir):
+        for name in sorted(files):
+            if name.endswith('.html.gz'):
+                stem, opener = name[:-len('.html.gz')], gzip.open
+            elif name.endswith('.html'):
+                stem, opener = name[:-len('.html')], open
+            else:
+                continue
+            url = name
+            try:
+                with open(os.path.join(root, stem + '.json')) as f:
+                    url = json.load(f).get('url') or name
+            except (OSError, ValueError):
+                pass
+            with opener(os.path.join(root, name), 'rt', encoding='utf-8') as f:
+                yield url, f.read()
+
+
+def measure(parse, runs):
+    """(median seconds, peak bytes) for parse()"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        parse()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('fixture_dir', nargs='?', default=scraper.HTTP_CACHE_DIR)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Parser: {scraper.HTML_PARSER}; fixtures: {args.fixture_dir}")
+    print(f"{'page':<48} {'KB':>6} {'scope':<16} {'before ms':>10} {'after ms':>9} {'before MB':>10} {'after MB':>9}")
+    totals = [0, 0, 0, 0]
+    count = 0
+    for url, html in load_fixtures(args.fixture_dir):
+        scope, strainer = strainer_for(url)
+        before = measure(lambda: BeautifulSoup(html, 'html.parser'), args.runs)
+        after = measure(lambda: scraper.parse_html(html, strainer), args.runs)
+        print(f"{url[-48:]:<48} {len(html) // 1024:>6} {scope:<16} {before[0] * 1000:>10.1f} {after[0] * 1000:>9.1f} "
+              f"{before[1] / 1048576:>10.1f} {after[1] / 1048576:>9.1f}")
+        for i, value in enumerate((before[0], after[0], before[1], after[1])):
+            totals[i] += value
+        count += 1
+
+    if not count:
+        print("No fixtures found")
+        return
+    print(f"{'total (' + str(count) + ' pages)':<48} {'':>6} {'':<16} {totals[0] * 1000:>10.1f} {totals[1] * 1000:>9.1f} "
+          f"{totals[2] / 1048576:>10.1f} {totals[3] / 1048576:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
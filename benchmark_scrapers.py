@@ -0,0 +1,109 @@
+"""
+Replay recorded Cricbuzz pages through the scraper functions and report
+their speed, with no network: `python benchmark_scrapers.py [fixture_dir]
+[--runs N] [--only NAME]`. Record fixtures first with scraper_fixtures.py.
+
+For each scraper function this prints pages/sec, median and p95 time per
+call, and the median peak memory allocated during a call (tracemalloc).
+"""
+import argparse
+import re
+import statistics
+import time
+import tracemalloc
+
+import scraper
+from scraper_fixtures import FIXTURE_DIR, recorded_urls, replaying
+
+
+def benchmark_cases(urls):
+    """(function name, label, call) for every scraper call the recorded pages can serve"""
+    cases = []
+    category_slugs = {info['url']: slug for slug, info in scraper.CATEGORIES.items()}
+    for url in urls:
+        path = url.split('cricbuzz.com', 1)[-1]
+        if path == '/cricket-match/live-scores':
+            cases.append(('scrape_live_scores', '', scraper.scrape_live_scores))
+            cases.append(('scrape_series_from_live_page', '', scraper.scrape_series_from_live_page))
+        elif path == '/cricket-match/live-scores/recent-matches':
+            cases.append(('scrape_recent_matches', '', scraper.scrape_recent_matches))
+        elif re.match(r'/live-cricket-scorecard/\d+$', path):
+            match_id = path.rsplit('/', 1)[1]
+            cases.append(('scrape_scorecard', match_id, lambda match_id=match_id: scraper.scrape_scorecard(match_id)))
+        elif re.match(r'/cricket-match-squads/\d+$', path):
+            match_id = path.rsplit('/', 1)[1]
+            cases.append(('scrape_match_squads', match_id, lambda match_id=match_id: scraper.scrape_match_squads(match_id)))
+        elif path.startswith('/cricket-schedule/series/'):
+            cases.append(('scrape_series_from_category', path, lambda url=url: scraper.scrape_series_from_category(url)))
+        elif re.match(r'/cricket-series/\d+/.+/matches$', path):
+            cases.append(('scrape_matches_from_series', path, lambda url=url: scraper.scrape_matches_from_series(url)))
+        elif url in category_slugs:
+            slug = category_slugs[url]
+            cases.append(('scrape_category', slug, lambda slug=slug: scraper.scrape_category(slug)))
+        elif path.startswith('/cricket-team/') and path.endswith('/players'):
+            team_url = url[:-len('/players')]
+            cases.append(('scrape_players_from_team', path, lambda team_url=team_url: scraper.scrape_players_from_team(team_url)))
+        elif path.startswith('/profiles/'):
+            cases.append(('scrape_player_profile', path, lambda url=url: scraper.scrape_player_profile(url)))
+    return sorted(cases, key=lambda case: case[0])
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def run_case(adapter, call, runs):
+    """(timings, peak bytes per run, pages fetched per call)"""
+    timings = []
+    peaks = []
+    pages = 0
+    for _ in range(runs):
+        before = adapter.requests
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+        pages = adapter.requests - before
+    for _ in range(min(runs, 3)):
+        tracemalloc.start()
+        call()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return timings, peaks, pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark scraper functions on recorded pages')
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURE_DIR)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--only', help='benchmark only this scraper function')
+    args = parser.parse_args()
+
+    cases = [case for case in benchmark_cases(recorded_urls(args.fixture_dir)) if not args.only or case[0] == args.only]
+    if not cases:
+        print(f"No recorded pages for these scrapers in {args.fixture_dir}; run scraper_fixtures.py first")
+        return
+
+    results = {}
+    with replaying(args.fixture_dir) as adapter:
+        for name, label, call in cases:
+            call()  # warm up imports and compiled regexes
+            timings, peaks, pages = run_case(adapter, call, args.runs)
+            result = results.setdefault(name, {'timings': [], 'peaks': [], 'pages': 0, 'calls': 0})
+            result['timings'].extend(timings)
+            result['peaks'].extend(peaks)
+            result['pages'] += pages * len(timings)
+            result['calls'] += len(timings)
+
+    print(f"Parser: {scraper.HTML_PARSER}; fixtures: {args.fixture_dir}; {args.runs} runs per page")
+    print(f"{'function':<30} {'calls':>6} {'pages/s':>9} {'median ms':>10} {'p95 ms':>8} {'peak KB':>9}")
+    for name, result in results.items():
+        total = sum(result['timings'])
+        pages_per_sec = result['pages'] / total if total else 0
+        print(f"{name:<30} {result['calls']:>6} {pages_per_sec:>9.1f} "
+              f"{statistics.median(result['timings']) * 1000:>10.1f} {percentile(result['timings'], 0.95) * 1000:>8.1f} "
+              f"{statistics.median(result['peaks']) / 1024:>9.0f}")
+
+
+if __name__ == '__main__':
+    main()
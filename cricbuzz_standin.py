@@ -0,0 +1,172 @@
+"""
+Local stand-in for www.cricbuzz.com, serving pages recorded with
+scraper_fixtures.py at their original paths:
+`python cricbuzz_standin.py [fixture_dir] --port 8099 --latency-ms 150
+--error-rate 0.02 --rate-limit 20`.
+
+Point the app or scheduler at it with CRICBUZZ_BASE_URL=http://127.0.0.1:8099
+to load-test or benchmark end to end without touching the real site.
+
+- Responses carry an ETag and honour If-None-Match, so the conditional GET
+  cache sees 304s as it would upstream.
+- --latency-ms / --jitter-ms delay every response.
+- --error-rate answers that fraction of requests with 503.
+- --rate-limit answers 429 with Retry-After once requests per second exceed it.
+- With --fallback, a path that was not recorded is served the first recorded
+  page of the same shape (ids ignored), so any match or player id works.
+"""
+import argparse
+import hashlib
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import scraper
+from scraper_fixtures import FIXTURE_DIR, load_fixture, recorded_urls
+
+
+# Fixed words that follow an id in Cricbuzz paths; other segments next to an id are slugs
+PATH_TAILS = {'players', 'matches'}
+
+
+def path_shape(path):
+    """Path with ids and their slugs blanked, e.g. /cricket-team/{slug}/{id}/players"""
+    segments = path.split('?', 1)[0].split('/')
+    shape = []
+    for i, segment in enumerate(segments):
+        after_id = i > 0 and segments[i - 1].isdigit()
+        # /cricket-team/<slug>/<id>: a slug before the id, but never the first segment
+        before_id = i > 1 and i + 1 < len(segments) and segments[i + 1].isdigit()
+        if segment.isdigit():
+            shape.append('{id}')
+        elif (after_id or before_id) and segment not in PATH_TAILS:
+            shape.append('{slug}')
+        else:
+            shape.append(segment)
+    return '/'.join(shape)
+
+
+class RateLimit:
+    """Token bucket shared by all handler threads"""
+
+    def __init__(self, per_sec):
+        self.per_sec = per_sec
+        self.tokens = per_sec
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def allow(self):
+        if not self.per_sec:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.per_sec, self.tokens + (now - self.updated) * self.per_sec)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    # Set by make_server()
+    fixture_dir = FIXTURE_DIR
+    latency = 0.0
+    jitter = 0.0
+    error_rate = 0.0
+    rate_limit = RateLimit(0)
+    fallback_paths = None
+
+    def do_GET(self):
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+        if not self.rate_limit.allow():
+            self.send_plain(429, 'Too Many Requests', {'Retry-After': '1'})
+            return
+        if self.error_rate and random.random() < self.error_rate:
+            self.send_plain(503, 'Service Unavailable')
+            return
+
+        fixture = load_fixture(self.fixture_dir, scraper.CRICBUZZ_URL + self.path)
+        if not fixture and self.fallback_paths is not None:
+            fallback_url = self.fallback_paths.get(path_shape(self.path))
+            fixture = load_fixture(self.fixture_dir, fallback_url) if fallback_url else None
+        if not fixture:
+            self.send_plain(404, 'Not recorded')
+            return
+
+        meta, body = fixture
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(meta.get('status', 200))
+        self.send_header('Content-Type', meta.get('content_type', 'text/html; charset=utf-8'))
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_plain(self, status, message, headers=None):
+        body = message.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(fixture_dir=FIXTURE_DIR, host='127.0.0.1', port=8099, latency_ms=0, jitter_ms=0,
+                error_rate=0.0, rate_limit=0, fallback=False):
+    """A ThreadingHTTPServer serving fixture_dir; call serve_forever() on it"""
+    fallback_paths = None
+    if fallback:
+        fallback_paths = {}
+        for url in recorded_urls(fixture_dir):
+            if url.startswith(scraper.CRICBUZZ_URL):
+                fallback_paths.setdefault(path_shape(url[len(scraper.CRICBUZZ_URL):]), url)
+    handler = type('ConfiguredStandInHandler', (StandInHandler,), {
+        'fixture_dir': fixture_dir,
+        'latency': latency_ms / 1000.0,
+        'jitter': jitter_ms / 1000.0,
+        'error_rate': error_rate,
+        'rate_limit': RateLimit(rate_limit),
+        'fallback_paths': fallback_paths,
+    })
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve recorded Cricbuzz pages locally')
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURE_DIR)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--rate-limit', type=float, default=0, help='requests per second before 429s (0 = unlimited)')
+    parser.add_argument('--fallback', action='store_true', help='serve a same-shaped recorded page for unrecorded paths')
+    args = parser.parse_args()
+
+    server = make_server(args.fixture_dir, args.host, args.port, args.latency_ms, args.jitter_ms,
+                         args.error_rate, args.rate_limit, args.fallback)
+    print(f"Serving {len(recorded_urls(args.fixture_dir))} recorded pages on http://{args.host}:{args.port}")
+    print(f"Run the app with CRICBUZZ_BASE_URL=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+"""
+Gunicorn settings, read from the working directory the .replit commands run in.
+Workers are gevent so an open /api/live-stream costs a greenlet, not a
+thread; psycopg2 is made cooperative so a waiting query yields to other
+requests instead of blocking the worker.
+"""
+import os
+
+worker_class = 'gevent'
+# Streams (live_stream.STREAM_MAX_CLIENTS) plus headroom for page and API requests
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 4000))
+timeout = 300
+
+
+def post_fork(server, worker):
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
@@ -0,0 +1,225 @@
+import os
+import socket
+import threading
+import time
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+JOB_POLL_SECONDS = float(os.environ.get('JOB_POLL_SECONDS', 5))
+JOB_WORKER_THREADS = int(os.environ.get('JOB_WORKER_THREADS', 2))
+# A running job whose heartbeat is older than this belonged to a dead worker
+JOB_STALE_SECONDS = int(os.environ.get('JOB_STALE_SECONDS', 600))
+JOB_RETRY_BASE_SECONDS = 30
+JOB_CLAIM_LOCK_KEY = 72600103
+
+JOB_ACTIVE_STATUSES = ('queued', 'running')
+
+# job_type -> {'func': handler(ctx), 'concurrency': max running at once, 'max_attempts': int}
+job_handlers = {}
+
+class JobCancelled(Exception):
+    pass
+
+def job_handler(job_type, concurrency=1, max_attempts=3):
+    """Register a function as the handler for a job type"""
+    def decorator(func):
+        job_handlers[job_type] = {'func': func, 'concurrency': concurrency, 'max_attempts': max_attempts}
+        return func
+    return decorator
+
+class JobContext:
+    """What a handler sees of its job: params, checkpoint, progress and cancellation"""
+
+    def __init__(self, db, ScrapeJob, job):
+        self.db = db
+        self.ScrapeJob = ScrapeJob
+        self.job = job
+
+    @property
+    def params(self):
+        return self.job.params or {}
+
+    @property
+    def checkpoint(self):
+        return self.job.checkpoint or {}
+
+    @property
+    def attempt(self):
+        return self.job.attempts
+
+    def progress(self, current=None, total=None, message=None):
+        """Record progress and heartbeat; commits the session"""
+        if current is not None:
+            self.job.current = current
+        if total is not None:
+            self.job.total = total
+        if message is not None:
+            self.job.message = message
+        self.job.heartbeat_at = datetime.utcnow()
+        self.db.session.commit()
+
+    def save_checkpoint(self, checkpoint, current=None, total=None, message=None):
+        """Persist resume state together with the work committed so far"""
+        self.job.checkpoint = dict(checkpoint)
+        self.progress(current, total, message)
+
+    def check_cancelled(self):
+        """Raise JobCancelled if cancellation was requested"""
+        requested = self.db.session.query(self.ScrapeJob.cancel_requested).filter(self.ScrapeJob.id == self.job.id).scalar()
+        if requested:
+            raise JobCancelled()
+
+def job_to_dict(job):
+    percent = int(job.current * 100 / job.total) if job.total else (100 if job.status == 'complete' else 0)
+    return {
+        'id': job.id,
+        'job_type': job.job_type,
+        'params': job.params or {},
+        'status': job.status,
+        'current': job.current or 0,
+        'total': job.total or 0,
+        'percent': percent,
+        'message': job.message,
+        'result': job.result,
+        'error': job.error,
+        'attempts': job.attempts,
+        'max_attempts': job.max_attempts,
+        'cancel_requested': job.cancel_requested,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+def enqueue_job(db, ScrapeJob, job_type, params=None):
+    """
+    Queue a job and return it. A queued or running job of the same type and
+    params is returned instead, so double clicks do not start the work twice.
+    """
+    if job_type not in job_handlers:
+        raise ValueError(f'Unknown job type: {job_type}')
+    params = params or {}
+    for job in ScrapeJob.query.filter(ScrapeJob.job_type == job_type, ScrapeJob.status.in_(JOB_ACTIVE_STATUSES)).all():
+        if (job.params or {}) == params:
+            return job
+    job = ScrapeJob(
+        job_type=job_type,
+        params=params,
+        status='queued',
+        max_attempts=job_handlers[job_type]['max_attempts'],
+        message='Queued'
+    )
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+def cancel_job(db, ScrapeJob, job_id):
+    """Cancel a queued job now, or ask a running one to stop at its next check"""
+    job = ScrapeJob.query.get(job_id)
+    if not job:
+        return None
+    if job.status == 'queued':
+        job.status = 'cancelled'
+        job.finished_at = datetime.utcnow()
+        job.message = 'Cancelled'
+    elif job.status == 'running':
+        job.cancel_requested = True
+        job.message = 'Cancelling...'
+    db.session.commit()
+    return job
+
+def requeue_stale_jobs(db, ScrapeJob):
+    """Jobs whose worker stopped heartbeating go back to the queue and resume from their checkpoint"""
+    cutoff = datetime.utcnow() - timedelta(seconds=JOB_STALE_SECONDS)
+    ScrapeJob.query.filter(ScrapeJob.status == 'running', ScrapeJob.heartbeat_at < cutoff).update(
+        {ScrapeJob.status: 'queued', ScrapeJob.worker_id: None, ScrapeJob.message: 'Requeued after worker stopped'},
+        synchronize_session=False
+    )
+
+def claim_job(db, ScrapeJob, worker_id):
+    """Atomically take the oldest runnable job whose type is under its concurrency limit"""
+    if not job_handlers:
+        return None
+    if db.engine.dialect.name == 'postgresql':
+        # Serialises claims across processes so concurrency limits hold
+        db.session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': JOB_CLAIM_LOCK_KEY})
+    requeue_stale_jobs(db, ScrapeJob)
+
+    running = dict(db.session.query(ScrapeJob.job_type, db.func.count(ScrapeJob.id)).filter(
+        ScrapeJob.status == 'running'
+    ).group_by(ScrapeJob.job_type).all())
+    open_types = [t for t, h in job_handlers.items() if running.get(t, 0) < h['concurrency']]
+    if not open_types:
+        db.session.commit()
+        return None
+
+    now = datetime.utcnow()
+    job = ScrapeJob.query.filter(
+        ScrapeJob.status == 'queued',
+        ScrapeJob.job_type.in_(open_types),
+        db.or_(ScrapeJob.run_after.is_(None), ScrapeJob.run_after <= now)
+    ).order_by(ScrapeJob.id).first()
+    if job:
+        job.status = 'running'
+        job.worker_id = worker_id
+        job.attempts = (job.attempts or 0) + 1
+        job.started_at = job.started_at or now
+        job.heartbeat_at = now
+        job.message = 'Running'
+    db.session.commit()
+    return job
+
+def run_job(db, ScrapeJob, job):
+    """Execute one claimed job and record its outcome"""
+    handler = job_handlers[job.job_type]
+    ctx = JobContext(db, ScrapeJob, job)
+    try:
+        result = handler['func'](ctx) or {}
+        job.status = 'complete'
+        job.result = result
+        job.message = result.get('message', 'Complete')
+        job.current = job.total or job.current
+        job.error = None
+    except JobCancelled:
+        db.session.rollback()
+        job.status = 'cancelled'
+        job.message = 'Cancelled'
+    except Exception as e:
+        db.session.rollback()
+        job.error = str(e)
+        if job.attempts < job.max_attempts:
+            delay = JOB_RETRY_BASE_SECONDS * (2 ** (job.attempts - 1))
+            job.status = 'queued'
+            job.run_after = datetime.utcnow() + timedelta(seconds=delay)
+            job.message = f'Attempt {job.attempts} failed, retrying in {delay}s: {e}'
+        else:
+            job.status = 'error'
+            job.message = f'Failed after {job.attempts} attempts: {e}'
+        logger.error(f"Job {job.id} ({job.job_type}) failed: {e}")
+    if job.status != 'queued':
+        job.finished_at = datetime.utcnow()
+    job.worker_id = None
+    db.session.commit()
+
+def run_job_worker(app, db, ScrapeJob, stop_event=None):
+    """Claim and run jobs until stop_event is set"""
+    worker_id = f'{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}'
+    while not (stop_event and stop_event.is_set()):
+        job = None
+        try:
+            with app.app_context():
+                job = claim_job(db, ScrapeJob, worker_id)
+                if job:
+                    run_job(db, ScrapeJob, job)
+                db.session.remove()
+        except Exception as e:
+            logger.error(f"Job worker error: {e}")
+        if not job:
+            time.sleep(JOB_POLL_SECONDS)
+
+def start_job_workers(app, db, ScrapeJob, threads=None):
+    """Run job workers as daemon threads in this process; threads=0 starts none"""
+    for _ in range(JOB_WORKER_THREADS if threads is None else threads):
+        threading.Thread(target=run_job_worker, args=(app, db, ScrapeJob), daemon=True).start()
@@ -0,0 +1,220 @@
+"""
+Server-Sent Events fan-out for live score changes.
+
+run_live_score_scrape reports the matches whose score, state or result
+changed through notify_match_changes(). On PostgreSQL that is a NOTIFY on
+LIVE_SCORES_CHANNEL, so the scheduler can run in its own process; each web
+process keeps one listener thread that loads the changed rows and publishes
+them to its hub as a single event. Without PostgreSQL the event is published
+in-process.
+
+The hub keeps recent events in one shared ring buffer and waiting clients
+sleep on one Condition, so a publish costs the same for ten clients or ten
+thousand, and each client resumes from its own last event id. The web server
+runs gevent workers (gunicorn.conf.py), so an idle stream is a sleeping
+greenlet holding no thread and no DB connection. STREAM_MAX_SECONDS recycles
+streams; EventSource reconnects by itself and sends Last-Event-ID.
+"""
+import os
+import json
+import time
+import uuid
+import select
+import logging
+import threading
+from collections import deque
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+LIVE_SCORES_CHANNEL = 'live_scores'
+STREAM_HEARTBEAT_SECONDS = int(os.environ.get('STREAM_HEARTBEAT_SECONDS', 15))
+# Streams are closed after this long and the browser reconnects, so threads get recycled
+STREAM_MAX_SECONDS = int(os.environ.get('STREAM_MAX_SECONDS', 300))
+# Beyond this many open streams per process new clients get a 503 and fall back to polling.
+# Keep it below gunicorn's worker_connections so pages and the API always get a connection
+STREAM_MAX_CLIENTS = int(os.environ.get('STREAM_MAX_CLIENTS', 3000))
+STREAM_BACKLOG = 200
+# Match ids per NOTIFY payload; PostgreSQL caps payloads at 8000 bytes
+NOTIFY_CHUNK = 400
+
+stream_store = {}
+
+
+class LiveScoreHub:
+    """Recent score events of this process, read by every open stream"""
+
+    def __init__(self, backlog=STREAM_BACKLOG):
+        # Event ids are only meaningful to the process that issued them
+        self.token = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self.events = deque(maxlen=backlog)
+        self.condition = threading.Condition()
+        self.clients = 0
+
+    def publish(self, matches):
+        with self.condition:
+            self.seq += 1
+            self.events.append((self.seq, json.dumps({'matches': matches})))
+            self.condition.notify_all()
+
+    def connect(self):
+        """Reserve a stream slot; False when the process is at STREAM_MAX_CLIENTS"""
+        with self.condition:
+            if self.clients >= STREAM_MAX_CLIENTS:
+                return False
+            self.clients += 1
+            return True
+
+    def disconnect(self):
+        """Release a slot taken by connect(); call once the response is closed"""
+        with self.condition:
+            self.clients -= 1
+
+    def resume_position(self, last_event_id):
+        """Sequence number to continue after, or None if last_event_id is not from this hub's backlog"""
+        token, _, seq = (last_event_id or '').partition('-')
+        if token != self.token or not seq.isdigit():
+            return None
+        seq = int(seq)
+        with self.condition:
+            oldest = self.events[0][0] if self.events else self.seq + 1
+            if seq > self.seq or seq < oldest - 1:
+                return None
+        return seq
+
+    def wait_events(self, after, timeout):
+        """Events after seq `after`, waiting up to timeout for one; None if some already fell out of the backlog"""
+        with self.condition:
+            if self.seq <= after:
+                self.condition.wait(timeout)
+            if self.events and self.events[0][0] > after + 1:
+                return None
+            return [(seq, data) for seq, data in self.events if seq > after]
+
+    def stream(self, last_event_id=None):
+        """SSE text for one client; the caller holds a connect() slot and releases it when the response closes"""
+        yield "retry: 3000\n\n"
+        after = self.resume_position(last_event_id)
+        if after is None:
+            with self.condition:
+                after = self.seq
+            if last_event_id:
+                # Reconnected to another process or missed events: reload the full list once
+                yield f"id: {self.token}-{after}\nevent: reset\ndata: {{}}\n\n"
+
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            events = self.wait_events(after, min(STREAM_HEARTBEAT_SECONDS, remaining))
+            if events is None:
+                with self.condition:
+                    after = self.seq
+                yield f"id: {self.token}-{after}\nevent: reset\ndata: {{}}\n\n"
+            elif not events:
+                yield ": keepalive\n\n"
+            for seq, data in events or []:
+                yield f"id: {self.token}-{seq}\nevent: scores\ndata: {data}\n\n"
+                after = seq
+
+
+live_hub = LiveScoreHub()
+
+
+def init_live_stream(app, db, Match):
+    """Bind the stream to the app, its db and the Match model"""
+    stream_store.update({'app': app, 'db': db, 'Match': Match, 'listener': None})
+
+
+def uses_notify(db):
+    return db.engine.dialect.name == 'postgresql'
+
+
+def match_delta(m):
+    """The fields a live score card shows, as /api/live-matches returns them"""
+    return {
+        'match_id': m.match_id,
+        'team1_name': m.team1_name,
+        'team2_name': m.team2_name,
+        'team1_score': m.team1_score,
+        'team2_score': m.team2_score,
+        'match_format': m.match_format,
+        'series_name': m.series_name,
+        'state': m.state,
+        'result': m.result,
+        'live_status': m.live_status,
+        'version': m.change_version
+    }
+
+
+def publish_match_ids(match_ids):
+    """Load the changed matches and publish them as one event"""
+    Match = stream_store['Match']
+    with stream_store['app'].app_context():
+        matches = [match_delta(m) for m in Match.query.filter(Match.match_id.in_(list(match_ids))).all()]
+    if matches:
+        live_hub.publish(matches)
+
+
+def notify_match_changes(db, match_ids):
+    """Tell every web process these matches changed; call after the changes are committed"""
+    match_ids = [str(mid) for mid in match_ids]
+    if not match_ids or not stream_store:
+        return
+    if not uses_notify(db):
+        publish_match_ids(match_ids)
+        return
+    # Own connection, so the NOTIFY is sent without committing the caller's session
+    with db.engine.begin() as conn:
+        for i in range(0, len(match_ids), NOTIFY_CHUNK):
+            conn.execute(text("SELECT pg_notify(:channel, :payload)"),
+                         {'channel': LIVE_SCORES_CHANNEL, 'payload': json.dumps(match_ids[i:i + NOTIFY_CHUNK])})
+
+
+def listen_for_changes():
+    """Listener thread: relay NOTIFYs from any process into this process's hub"""
+    db = stream_store['db']
+    with stream_store['app'].app_context():
+        engine = db.engine
+    while True:
+        connection = None
+        try:
+            connection = engine.raw_connection()
+            # Read before detach(), which drops the pool record driver_connection comes from
+            dbapi_connection = connection.driver_connection
+            # Keep this connection out of the pool for as long as the process lives
+            connection.detach()
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {LIVE_SCORES_CHANNEL}")
+            while True:
+                if select.select([dbapi_connection], [], [], 60) == ([], [], []):
+                    continue
+                dbapi_connection.poll()
+                changed = set()
+                while dbapi_connection.notifies:
+                    changed.update(json.loads(dbapi_connection.notifies.pop(0).payload))
+                if changed:
+                    publish_match_ids(changed)
+        except Exception as e:
+            logger.error(f"Live score listener error, reconnecting: {e}")
+            time.sleep(5)
+        finally:
+            if connection is not None:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+
+
+def ensure_listener():
+    """Start the NOTIFY listener the first time this process serves a stream"""
+    if stream_store.get('listener') or not uses_notify(stream_store['db']):
+        return
+    with live_hub.condition:
+        if stream_store.get('listener'):
+            return
+        stream_store['listener'] = threading.Thread(target=listen_for_changes, name='live-score-listener', daemon=True)
+        stream_store['listener'].start()
@@ -0,0 +1,70 @@
+from datetime import datetime
+from sqlalchemy import text
+import logging
+
+logger = logging.getLogger(__name__)
+
+# db.create_all() only creates missing tables; it never alters existing ones.
+# Schema changes to existing tables are listed here as numbered migrations and
+# applied once, in order, at startup. Append new entries; never edit old ones.
+MIGRATIONS = [
+    (1, 'Match.live_order for DB-served live pages', [
+        "ALTER TABLE matches ADD COLUMN IF NOT EXISTS live_order INTEGER",
+    ]),
+    (2, 'ScrapeLog conditional GET stats', [
+        "ALTER TABLE scrape_logs ADD COLUMN IF NOT EXISTS pages_not_modified INTEGER DEFAULT 0",
+        "ALTER TABLE scrape_logs ADD COLUMN IF NOT EXISTS bytes_saved BIGINT DEFAULT 0",
+    ]),
+    (3, 'Indexes for hot lookup columns', [
+        "CREATE INDEX IF NOT EXISTS ix_players_player_id ON players (player_id)",
+        "CREATE INDEX IF NOT EXISTS ix_players_team_id ON players (team_id)",
+        "CREATE INDEX IF NOT EXISTS ix_teams_team_id ON teams (team_id)",
+        "CREATE INDEX IF NOT EXISTS ix_matches_state ON matches (state)",
+        "CREATE INDEX IF NOT EXISTS ix_matches_updated_at ON matches (updated_at)",
+        "CREATE INDEX IF NOT EXISTS ix_matches_series_id ON matches (series_id)",
+        "CREATE INDEX IF NOT EXISTS ix_posts_is_published_created_at ON posts (is_published, created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_redirects_old_url_is_active ON redirects (old_url, is_active)",
+        "CREATE INDEX IF NOT EXISTS ix_redirects_lower_old_url ON redirects (lower(old_url))",
+    ]),
+    (4, 'Match.change_version for the delta live score API', [
+        "ALTER TABLE matches ADD COLUMN IF NOT EXISTS change_version BIGINT",
+        "CREATE INDEX IF NOT EXISTS ix_matches_change_version ON matches (change_version)",
+    ]),
+    (5, 'Team and category ingest times for skipping unchanged pages', [
+        "ALTER TABLE team_categories ADD COLUMN IF NOT EXISTS teams_scraped_at TIMESTAMP",
+        "ALTER TABLE teams ADD COLUMN IF NOT EXISTS players_scraped_at TIMESTAMP",
+    ]),
+    # Scrapes never return TEAM_FLAGS URLs, so these were stored from get_team_flag() guesses
+    (6, 'Forget guessed Match team flags', [
+        "UPDATE matches SET team1_flag = NULL WHERE team1_flag LIKE 'https://flagcdn.com/%' OR team1_flag LIKE 'https://upload.wikimedia.org/%'",
+        "UPDATE matches SET team2_flag = NULL WHERE team2_flag LIKE 'https://flagcdn.com/%' OR team2_flag LIKE 'https://upload.wikimedia.org/%'",
+    ]),
+]
+
+# Arbitrary key so only one gunicorn worker migrates at a time
+MIGRATION_LOCK_KEY = 72600101
+
+
+def run_migrations(db):
+    """Apply pending MIGRATIONS and record them in schema_migrations"""
+    with db.engine.begin() as conn:
+        if db.engine.dialect.name == 'postgresql':
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': MIGRATION_LOCK_KEY})
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version INTEGER PRIMARY KEY, "
+            "description VARCHAR(200), "
+            "applied_at TIMESTAMP)"
+        ))
+        applied = set(row[0] for row in conn.execute(text("SELECT version FROM schema_migrations")))
+
+        for version, description, statements in MIGRATIONS:
+            if version in applied:
+                continue
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, description, applied_at) VALUES (:version, :description, :applied_at)"),
+                {'version': version, 'description': description, 'applied_at': datetime.utcnow()}
+            )
+            logger.info(f"Applied migration {version}: {description}")
@@ -9,6 +9,8 @@ def init_models(db):
         slug = db.Column(db.String(50), unique=True, nullable=False)
         url = db.Column(db.String(255), nullable=False)
         created_at = db.Column(db.DateTime, default=datetime.utcnow)
+        # When this category's team list was last ingested; a cached page newer than this was not
+        teams_scraped_at = db.Column(db.DateTime, nullable=True)
         
         teams = db.relationship('Team', backref='category', lazy=True)
 
@@ -16,7 +18,7 @@ def init_models(db):
         __tablename__ = 'teams'
         
         id = db.Column(db.Integer, primary_key=True)
-        team_id = db.Column(db.String(50), nullable=True)
+        team_id = db.Column(db.String(50), nullable=True, index=True)
         name = db.Column(db.String(100), nullable=False)
         slug = db.Column(db.String(150), unique=True, nullable=True, index=True)
         short_name = db.Column(db.String(20), nullable=True)
@@ -25,6 +27,8 @@ def init_models(db):
         category_id = db.Column(db.Integer, db.ForeignKey('team_categories.id'), nullable=False)
         created_at = db.Column(db.DateTime, default=datetime.utcnow)
         updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+        # When this team's roster was last ingested; a cached page newer than this was not
+        players_scraped_at = db.Column(db.DateTime, nullable=True)
         
         players = db.relationship('Player', backref='team', lazy=True, cascade='all, delete-orphan')
 
@@ -32,13 +36,13 @@ def init_models(db):
         __tablename__ = 'players'
         
         id = db.Column(db.Integer, primary_key=True)
-        player_id = db.Column(db.String(50), nullable=True)
+        player_id = db.Column(db.String(50), nullable=True, index=True)
         name = db.Column(db.String(100), nullable=False)
         slug = db.Column(db.String(150), unique=True, nullable=True, index=True)
         role = db.Column(db.String(50), nullable=True)
         photo_url = db.Column(db.String(500), nullable=True)
         player_url = db.Column(db.String(500), nullable=True)
-        team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
+        team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False, index=True)
         
         born = db.Column(db.String(100), nullable=True)
         birth_place = db.Column(db.String(200), nullable=True)
@@ -95,6 +99,8 @@ def init_models(db):
         message = db.Column(db.Text, nullable=True)
         teams_scraped = db.Column(db.Integer, default=0)
         players_scraped = db.Column(db.Integer, default=0)
+        pages_not_modified = db.Column(db.Integer, default=0)
+        bytes_saved = db.Column(db.BigInteger, default=0)
         created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     class ScrapeSetting(db.Model):
@@ -181,7 +187,7 @@ def init_models(db):
         match_time = db.Column(db.String(100), nullable=True)
         start_date = db.Column(db.String(50), nullable=True)
         end_date = db.Column(db.String(50), nullable=True)
-        state = db.Column(db.String(50), nullable=True)
+        state = db.Column(db.String(50), nullable=True, index=True)
         team1_name = db.Column(db.String(100), nullable=True)
         team1_score = db.Column(db.String(100), nullable=True)
         team1_flag = db.Column(db.String(500), nullable=True)
@@ -191,14 +197,16 @@ def init_models(db):
         result = db.Column(db.String(300), nullable=True)
         match_url = db.Column(db.String(500), nullable=True)
         series_name = db.Column(db.String(300), nullable=True)
-        series_id = db.Column(db.Integer, db.ForeignKey('series.id'), nullable=True)
+        series_id = db.Column(db.Integer, db.ForeignKey('series.id'), nullable=True, index=True)
         batting_data = db.Column(db.JSON, nullable=True)
         bowling_data = db.Column(db.JSON, nullable=True)
         innings_data = db.Column(db.JSON, nullable=True)
         toss = db.Column(db.String(300), nullable=True)
         live_status = db.Column(db.String(300), nullable=True)
+        live_order = db.Column(db.Integer, nullable=True)
+        change_version = db.Column(db.BigInteger, nullable=True, index=True)  # 'matches' change counter at its last score/state/result change
         created_at = db.Column(db.DateTime, default=datetime.utcnow)
-        updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+        updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     class MatchScrapeSetting(db.Model):
         __tablename__ = 'match_scrape_settings'
@@ -237,6 +245,9 @@ def init_models(db):
     
     class Post(db.Model):
         __tablename__ = 'posts'
+        __table_args__ = (
+            db.Index('ix_posts_is_published_created_at', 'is_published', 'created_at'),
+        )
         
         id = db.Column(db.Integer, primary_key=True)
         title = db.Column(db.String(300), nullable=False)
@@ -295,6 +306,9 @@ def init_models(db):
     
     class Redirect(db.Model):
         __tablename__ = 'redirects'
+        __table_args__ = (
+            db.Index('ix_redirects_old_url_is_active', 'old_url', 'is_active'),
+        )
         
         id = db.Column(db.Integer, primary_key=True)
         old_url = db.Column(db.String(500), unique=True, nullable=False, index=True)
@@ -305,6 +319,9 @@ def init_models(db):
         created_at = db.Column(db.DateTime, default=datetime.utcnow)
         updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Case-insensitive redirect lookups in check_redirects
+    db.Index('ix_redirects_lower_old_url', db.func.lower(Redirect.old_url))
+    
     class SiteSettings(db.Model):
         __tablename__ = 'site_settings'
         
@@ -419,4 +436,53 @@ def init_models(db):
         message = db.Column(db.Text, nullable=True)
         created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
-    return TeamCategory, Team, Player, ScrapeLog, ScrapeSetting, ProfileScrapeSetting, SeriesCategory, Series, SeriesScrapeSetting, Match, MatchScrapeSetting, LiveScoreScrapeSetting, PostCategory, Post, AdminUser, Page, Redirect, SiteSettings, PushSubscription, NotificationLog, AutoPostSetting, AutoPostLog
+    class ScrapeJob(db.Model):
+        __tablename__ = 'scrape_jobs'
+        __table_args__ = (
+            db.Index('ix_scrape_jobs_status_job_type', 'status', 'job_type'),
+        )
+        
+        id = db.Column(db.Integer, primary_key=True)
+        job_type = db.Column(db.String(50), nullable=False)
+        params = db.Column(db.JSON, nullable=True)
+        status = db.Column(db.String(20), default='queued')  # queued, running, complete, error, cancelled
+        attempts = db.Column(db.Integer, default=0)
+        max_attempts = db.Column(db.Integer, default=3)
+        cancel_requested = db.Column(db.Boolean, default=False)
+        checkpoint = db.Column(db.JSON, nullable=True)  # Handler resume state
+        current = db.Column(db.Integer, default=0)
+        total = db.Column(db.Integer, default=0)
+        message = db.Column(db.Text, nullable=True)
+        result = db.Column(db.JSON, nullable=True)
+        error = db.Column(db.Text, nullable=True)
+        worker_id = db.Column(db.String(200), nullable=True)
+        run_after = db.Column(db.DateTime, nullable=True)  # Retry backoff
+        heartbeat_at = db.Column(db.DateTime, nullable=True)
+        created_at = db.Column(db.DateTime, default=datetime.utcnow)
+        started_at = db.Column(db.DateTime, nullable=True)
+        finished_at = db.Column(db.DateTime, nullable=True)
+        updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    class ScrapeProgress(db.Model):
+        __tablename__ = 'scrape_progress'
+        
+        id = db.Column(db.Integer, primary_key=True)
+        key = db.Column(db.String(100), unique=True, nullable=False)  # e.g. players:international
+        job_id = db.Column(db.String(64), nullable=True)
+        status = db.Column(db.String(20), default='idle')  # running, complete, error
+        current = db.Column(db.Integer, default=0)
+        total = db.Column(db.Integer, default=0)
+        errors = db.Column(db.Integer, default=0)
+        message = db.Column(db.Text, nullable=True)
+        detail = db.Column(db.JSON, nullable=True)  # Scrape specific fields: current team/player, counts
+        started_at = db.Column(db.DateTime, nullable=True)
+        finished_at = db.Column(db.DateTime, nullable=True)
+        updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    class ChangeCounter(db.Model):
+        __tablename__ = 'change_counters'
+        
+        name = db.Column(db.String(50), primary_key=True)  # e.g. matches
+        value = db.Column(db.BigInteger, default=0, nullable=False)
+    
+    return TeamCategory, Team, Player, ScrapeLog, ScrapeSetting, ProfileScrapeSetting, SeriesCategory, Series, SeriesScrapeSetting, Match, MatchScrapeSetting, LiveScoreScrapeSetting, PostCategory, Post, AdminUser, Page, Redirect, SiteSettings, PushSubscription, NotificationLog, AutoPostSetting, AutoPostLog, ScrapeJob, ScrapeProgress, ChangeCounter
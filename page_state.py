@@ -0,0 +1,328 @@
+"""
+Structured access to the data Cricbuzz embeds in its pages.
+
+Cricbuzz is a Next.js app: page data is streamed into the HTML as string
+literals passed to self.__next_f.push(...) (the React flight stream), or on
+older pages as a __NEXT_DATA__ JSON script. PageState decodes that payload
+once with the json module, walks the result once, and answers lookups from
+the dicts it collected, so extraction cost grows with the page rather than
+with page size times the number of matches on it.
+
+The helpers below turn the raw objects into the dict shapes the scrapers and
+ingest_matches already use.
+"""
+import json
+import re
+from datetime import datetime
+
+NEXT_F_PUSH = 'self.__next_f.push([1,'
+NEXT_DATA_SCRIPT = re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+# A flight row starts "<hex id>:<optional type tag>" at the beginning of a line
+FLIGHT_ROW = re.compile(r'([0-9a-f]*):([A-Z]*)')
+# A text ("T") row continues "<hex byte length>,<text>"
+TEXT_ROW_LENGTH = re.compile(r'([0-9a-f]+),')
+
+UNSTARTED_STATES = ('Preview', 'Upcoming', 'Scheduled', '')
+
+json_decoder = json.JSONDecoder()
+
+
+def decode_flight_stream(html):
+    """Concatenate the string chunks pushed to self.__next_f into the flight stream text"""
+    chunks = []
+    pos = html.find(NEXT_F_PUSH)
+    while pos != -1:
+        start = pos + len(NEXT_F_PUSH)
+        while start < len(html) and html[start].isspace():
+            start += 1
+        try:
+            chunk, end = json_decoder.raw_decode(html, start)
+            if isinstance(chunk, str):
+                chunks.append(chunk)
+        except ValueError:
+            end = start
+        pos = html.find(NEXT_F_PUSH, end)
+    return ''.join(chunks)
+
+
+def skip_utf8_bytes(text, start, length):
+    """Index in text after `length` UTF-8 bytes from start (flight text rows are byte counted)"""
+    encoded = text[start:start + length].encode('utf-8')[:length]
+    return start + len(encoded.decode('utf-8', 'ignore'))
+
+
+def iter_flight_values(stream):
+    """Decode every JSON row of a flight stream; text and unparsable rows are skipped"""
+    pos = 0
+    size = len(stream)
+    while pos < size:
+        row = FLIGHT_ROW.match(stream, pos)
+        if not row:
+            newline = stream.find('\n', pos)
+            pos = size if newline == -1 else newline + 1
+            continue
+        start = row.end()
+        if row.group(2) == 'T':
+            length = TEXT_ROW_LENGTH.match(stream, start)
+            if length:
+                pos = skip_utf8_bytes(stream, length.end(), int(length.group(1), 16))
+            else:
+                # Malformed or truncated text row: drop the rest of the line
+                newline = stream.find('\n', start)
+                pos = size if newline == -1 else newline + 1
+            continue
+        try:
+            value, pos = json_decoder.raw_decode(stream, start)
+            yield value
+        except ValueError:
+            newline = stream.find('\n', start)
+            pos = size if newline == -1 else newline
+        if pos < size and stream[pos] == '\n':
+            pos += 1
+
+
+def iter_page_values(html):
+    """Top level JSON values embedded in a page"""
+    stream = decode_flight_stream(html)
+    if stream:
+        yield from iter_flight_values(stream)
+        return
+    script = NEXT_DATA_SCRIPT.search(html)
+    if script:
+        try:
+            yield json.loads(script.group(1))
+        except ValueError:
+            pass
+
+
+class PageState:
+    """Every JSON object embedded in a page, in document order"""
+
+    def __init__(self, html):
+        self.dicts = []
+        for value in iter_page_values(html):
+            stack = [value]
+            while stack:
+                item = stack.pop()
+                if isinstance(item, dict):
+                    self.dicts.append(item)
+                    stack.extend(reversed(list(item.values())))
+                elif isinstance(item, list):
+                    stack.extend(reversed(item))
+
+    def __bool__(self):
+        return bool(self.dicts)
+
+    def with_key(self, key):
+        """Objects that have key, in document order"""
+        return [d for d in self.dicts if key in d]
+
+    def values(self, key):
+        """Values stored under key anywhere on the page, in document order"""
+        return [d[key] for d in self.dicts if key in d]
+
+    def first(self, key, default=None):
+        for d in self.dicts:
+            if key in d:
+                return d[key]
+        return default
+
+
+def as_list(value):
+    """Cricbuzz stores some collections as {"bat_1": {...}} maps and others as lists"""
+    if isinstance(value, dict):
+        return list(value.values())
+    return value if isinstance(value, list) else []
+
+
+def text(value):
+    return '' if value is None else str(value)
+
+
+def innings_score(team_score):
+    """'runs/wickets (overs)' for a team's first innings, or '' """
+    innings = (team_score or {}).get('inngs1') or {}
+    if innings.get('runs') is None:
+        return ''
+    score = f"{innings['runs']}/{innings['wickets'] if innings.get('wickets') is not None else '?'}"
+    if innings.get('overs') is not None:
+        score += f" ({innings['overs']})"
+    return score
+
+
+def series_schedule(state):
+    """[{'id', 'name', 'month_year'}] from a series schedule page, falling back to the series of listed matches"""
+    series_data = []
+    seen = set()
+    for schedule in state.values('seriesScheduleData'):
+        for month_group in as_list(schedule):
+            month_year = text(month_group.get('date'))
+            for series in as_list(month_group.get('series')):
+                sid = text(series.get('id'))
+                if sid and sid not in seen:
+                    seen.add(sid)
+                    series_data.append({'id': sid, 'name': text(series.get('name')), 'month_year': month_year.title()})
+    if series_data:
+        return series_data
+
+    for info in state.values('matchInfo'):
+        if not isinstance(info, dict):
+            continue
+        sid = text(info.get('seriesId'))
+        if sid and sid not in seen and info.get('seriesName'):
+            seen.add(sid)
+            series_data.append({'id': sid, 'name': info['seriesName'], 'month_year': ''})
+    return series_data
+
+
+def series_match_rows(state, series_id=None):
+    """
+    One dict per match listed on a series page, in page order. Scores come
+    from the match's own matchScore (or the page's matchScoreMap entry for its
+    id) and are left empty for matches that have not started.
+    """
+    score_map = {}
+    for scores in state.values('matchScoreMap'):
+        if isinstance(scores, dict):
+            score_map.update({text(mid): score for mid, score in scores.items()})
+    date_map = {}
+    for details in state.values('matchDetailsMap'):
+        if not isinstance(details, dict):
+            continue
+        for entry in as_list(details.get('match')):
+            info = entry.get('matchInfo') if isinstance(entry, dict) else None
+            if info and info.get('matchId') is not None:
+                date_map.setdefault(text(info['matchId']), text(details.get('key')))
+
+    rows = []
+    seen = set()
+    for entry in state.with_key('matchInfo'):
+        info = entry['matchInfo']
+        if not isinstance(info, dict) or info.get('matchId') is None:
+            continue
+        mid = text(info['matchId'])
+        if mid in seen:
+            continue
+        seen.add(mid)
+        match_sid = text(info.get('seriesId'))
+        if series_id and match_sid and match_sid != str(series_id):
+            continue
+
+        match_state = text(info.get('state'))
+        team1_score = team2_score = ''
+        if match_state not in UNSTARTED_STATES:
+            score = entry.get('matchScore') or score_map.get(mid) or {}
+            team1_score = innings_score(score.get('team1Score'))
+            team2_score = innings_score(score.get('team2Score'))
+
+        match_date = ''
+        date_timestamp = 0
+        try:
+            date_timestamp = int(info.get('startDate')) / 1000
+            match_date = datetime.fromtimestamp(date_timestamp).strftime('%a, %d %b %Y')
+        except (TypeError, ValueError, OverflowError, OSError):
+            pass
+
+        venue_info = info.get('venueInfo') or {}
+        venue = ', '.join(part for part in (text(venue_info.get('ground')), text(venue_info.get('city'))) if part)
+        team1 = info.get('team1') or {}
+        team2 = info.get('team2') or {}
+
+        rows.append({
+            'match_id': mid,
+            'series_id': match_sid or text(series_id),
+            'team1_id': text(team1.get('teamId')),
+            'team2_id': text(team2.get('teamId')),
+            'venue_id': text(venue_info.get('id')),
+            'match_format': text(info.get('matchDesc')),
+            'format_type': text(info.get('matchFormat')),
+            'series_name': text(info.get('seriesName')),
+            'match_date': match_date,
+            'date_key': date_map.get(mid, ''),
+            'date_timestamp': date_timestamp,
+            'state': match_state,
+            'team1': text(team1.get('teamName')),
+            'team2': text(team2.get('teamName')),
+            'team1_score': team1_score,
+            'team2_score': team2_score,
+            'venue': venue,
+            'result': text(info.get('status')),
+        })
+    return rows
+
+
+def match_header(state, match_id=''):
+    """Summary fields of a match page's matchHeader, as scrape_match_json reports them"""
+    header = state.first('matchHeader') or {}
+    toss = header.get('tossResults') or {}
+    venue_info = state.first('venueInfo') or {}
+    ground = venue_info.get('ground') or state.first('ground')
+    city = venue_info.get('city') or state.first('city')
+    return {
+        'match_id': text(header.get('matchId') or match_id),
+        'series_id': text(header.get('seriesId')),
+        'team1_id': text((header.get('team1') or {}).get('id')),
+        'team2_id': text((header.get('team2') or {}).get('id')),
+        'match': text(header.get('matchDescription')),
+        'format': text(header.get('matchFormat')),
+        'status': text(header.get('status')),
+        'state': text(header.get('state')),
+        'toss': f"{toss['tossWinnerName']} won toss, chose to {toss['decision']}" if toss.get('tossWinnerName') and toss.get('decision') else '',
+        'series': text(state.first('seriesDesc')),
+        'venue': f"{ground}, {city}" if ground and city else '',
+        'venue_id': text(venue_info.get('id')),
+    }
+
+
+def match_innings(state, match_id):
+    """The scoreCard innings list for match_id, or [] when the page has none"""
+    for scorecard in state.values('scoreCard'):
+        innings = as_list(scorecard)
+        if innings and isinstance(innings[0], dict) and text(innings[0].get('matchId')) == text(match_id):
+            return innings
+    return []
+
+
+def innings_total(innings):
+    details = innings.get('scoreDetails') or {}
+    if details.get('runs') is None:
+        return ''
+    return f"{details['runs']}/{details.get('wickets', 0)} ({details.get('overs', 0)})"
+
+
+def scorecard_players(innings_list):
+    """(batting, bowling) rows across all innings, one per player id"""
+    batting = []
+    bowling = []
+    seen_batters = set()
+    seen_bowlers = set()
+    for innings in innings_list:
+        for bat in as_list((innings.get('batTeamDetails') or {}).get('batsmenData')):
+            bat_id = text(bat.get('batId'))
+            if bat_id and bat_id not in seen_batters:
+                seen_batters.add(bat_id)
+                batting.append({
+                    'player_id': bat_id,
+                    'name': text(bat.get('batName')),
+                    'runs': text(bat.get('runs')),
+                    'balls': text(bat.get('balls')),
+                    'dots': text(bat.get('dots')),
+                    'fours': text(bat.get('fours')),
+                    'sixes': text(bat.get('sixes')),
+                    'sr': text(bat.get('strikeRate')),
+                    'status': text(bat.get('outDesc')),
+                })
+        for bowl in as_list((innings.get('bowlTeamDetails') or {}).get('bowlersData')):
+            bowl_id = text(bowl.get('bowlerId'))
+            if bowl_id and bowl_id not in seen_bowlers:
+                seen_bowlers.add(bowl_id)
+                bowling.append({
+                    'player_id': bowl_id,
+                    'name': text(bowl.get('bowlName')),
+                    'overs': text(bowl.get('overs')),
+                    'maidens': text(bowl.get('maidens')),
+                    'runs': text(bowl.get('runs')),
+                    'wickets': text(bowl.get('wickets')),
+                    'economy': text(bowl.get('economy')),
+                })
+    return batting, bowling
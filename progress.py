@@ -0,0 +1,167 @@
+import os
+import time
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+# Running scrapes report many times a second; rows are written at most this often
+PROGRESS_WRITE_SECONDS = float(os.environ.get('PROGRESS_WRITE_SECONDS', 1))
+# A running row not updated for this long belonged to a worker that died
+PROGRESS_STALE_SECONDS = int(os.environ.get('PROGRESS_STALE_SECONDS', 300))
+
+progress_store = {}
+# key -> monotonic time of the last write from this process
+last_progress_write = {}
+
+def init_progress_store(db, ScrapeProgress):
+    """Bind the progress store to the app's db and model"""
+    progress_store.update({'db': db, 'ScrapeProgress': ScrapeProgress})
+
+def progress_table():
+    return progress_store['ScrapeProgress'].__table__
+
+def write_progress(values, where=None):
+    """
+    Update the row for values['key'] on its own connection so progress is
+    visible to other workers without committing the caller's session.
+    Returns the number of rows updated.
+    """
+    table = progress_table()
+    condition = table.c.key == values['key']
+    if where is not None:
+        condition = condition & where
+    with progress_store['db'].engine.begin() as conn:
+        return conn.execute(table.update().where(condition).values(**values)).rowcount
+
+def insert_progress(values):
+    """Insert a new row; returns False if another worker created it first"""
+    try:
+        with progress_store['db'].engine.begin() as conn:
+            conn.execute(progress_table().insert().values(**values))
+        return True
+    except IntegrityError:
+        return False
+
+def start_progress(key, total, job_id=None, **detail):
+    """
+    Mark key as running. Returns False without touching the row when another
+    worker or the scheduler is already running it, so callers can refuse to
+    start the same scrape twice.
+    """
+    if not progress_store:
+        return True
+    table = progress_table()
+    now = datetime.utcnow()
+    values = {
+        'key': key, 'job_id': job_id, 'status': 'running', 'current': 0, 'total': total,
+        'errors': 0, 'message': None, 'detail': detail, 'started_at': now, 'updated_at': now,
+        'finished_at': None,
+    }
+    stale_cutoff = now - timedelta(seconds=PROGRESS_STALE_SECONDS)
+    not_running = (table.c.status != 'running') | (table.c.updated_at < stale_cutoff)
+    try:
+        started = write_progress(values, not_running) > 0
+        if not started:
+            with progress_store['db'].engine.connect() as conn:
+                exists = conn.execute(table.select().where(table.c.key == key)).first() is not None
+            started = not exists and insert_progress(values)
+    except Exception as e:
+        logger.error(f"Progress start failed for {key}: {e}")
+        return True
+    if started:
+        last_progress_write[key] = time.monotonic()
+    return started
+
+def update_progress(key, current, total=None, errors=None, message=None, **detail):
+    """Record progress of a running scrape; throttled to PROGRESS_WRITE_SECONDS per key"""
+    if not progress_store:
+        return
+    now = time.monotonic()
+    if now - last_progress_write.get(key, 0) < PROGRESS_WRITE_SECONDS and (total is None or current < total):
+        return
+    last_progress_write[key] = now
+    values = {'key': key, 'current': current, 'updated_at': datetime.utcnow()}
+    if total is not None:
+        values['total'] = total
+    if errors is not None:
+        values['errors'] = errors
+    if message is not None:
+        values['message'] = message
+    if detail:
+        values['detail'] = detail
+    try:
+        write_progress(values)
+    except Exception as e:
+        logger.error(f"Progress update failed for {key}: {e}")
+
+def finish_progress(key, status='complete', current=None, total=None, errors=None, message=None, **detail):
+    """Record the final state of a scrape; always written"""
+    if not progress_store:
+        return
+    now = datetime.utcnow()
+    values = {'key': key, 'status': status, 'updated_at': now, 'finished_at': now, 'message': message}
+    if current is not None:
+        values['current'] = current
+    if total is not None:
+        values['total'] = total
+    if errors is not None:
+        values['errors'] = errors
+    if detail:
+        values['detail'] = detail
+    last_progress_write.pop(key, None)
+    try:
+        if not write_progress(values):
+            insert_progress(dict({'started_at': now, 'current': 0, 'total': 0, 'errors': 0}, **values))
+    except Exception as e:
+        logger.error(f"Progress finish failed for {key}: {e}")
+
+def progress_to_dict(row):
+    """Row as the progress API reports it, with throughput and ETA"""
+    status = row.status
+    message = row.message
+    now = datetime.utcnow()
+    if status == 'running' and row.updated_at and row.updated_at < now - timedelta(seconds=PROGRESS_STALE_SECONDS):
+        status = 'error'
+        message = 'Scrape stopped reporting progress'
+
+    current = row.current or 0
+    total = row.total or 0
+    end = now if status == 'running' else (row.finished_at or row.updated_at or now)
+    elapsed = max((end - row.started_at).total_seconds(), 0) if row.started_at else 0
+    items_per_sec = round(current / elapsed, 2) if elapsed and current else 0
+    eta_seconds = None
+    if status == 'running' and items_per_sec:
+        eta_seconds = int((total - current) / items_per_sec) if total > current else 0
+
+    progress = dict(row.detail or {})
+    progress.update({
+        'job_id': row.job_id,
+        'status': status,
+        'current': current,
+        'total': total,
+        'percent': int(current * 100 / total) if total else (100 if status == 'complete' else 0),
+        'errors': row.errors or 0,
+        'items_per_sec': items_per_sec,
+        'eta_seconds': eta_seconds,
+        'elapsed_seconds': int(elapsed),
+        'started_at': row.started_at.isoformat() if row.started_at else None,
+        'updated_at': row.updated_at.isoformat() if row.updated_at else None,
+    })
+    if message is not None:
+        progress['message'] = message
+    return progress
+
+def get_progress(key, **defaults):
+    """Progress for key as a dict; defaults (plus status 'idle') when nothing was recorded"""
+    row = None
+    if progress_store:
+        ScrapeProgress = progress_store['ScrapeProgress']
+        try:
+            row = progress_store['db'].session.query(ScrapeProgress).filter_by(key=key).first()
+        except Exception as e:
+            logger.error(f"Progress read failed for {key}: {e}")
+    if not row:
+        return dict({'percent': 0, 'current': 0, 'total': 0, 'status': 'idle'}, **defaults)
+    return dict(defaults, **progress_to_dict(row))
@@ -0,0 +1,16 @@
+"""
+Dedicated scheduler process: `python run_scheduler.py`.
+Run web workers with SCHEDULER_MODE=off so they stay pure request servers;
+this process still takes the scheduler advisory lock, so a second copy
+only ever stands by.
+"""
+import os
+import time
+
+os.environ['SCHEDULER_MODE'] = 'auto'
+
+from app import app  # noqa: F401,E402
+
+if __name__ == '__main__':
+    while True:
+        time.sleep(3600)
@@ -0,0 +1,16 @@
+"""
+Dedicated scrape job worker: `python run_worker.py`.
+Run the web app with JOB_WORKER_MODE=off so queued scrape jobs only run here.
+Concurrency limits per job type are enforced in the database, so several
+copies of this process can run side by side.
+"""
+import os
+
+os.environ['JOB_WORKER_MODE'] = 'off'
+
+from app import app, db, ScrapeJob  # noqa: E402
+from jobs import run_job_worker, start_job_workers, JOB_WORKER_THREADS  # noqa: E402
+
+if __name__ == '__main__':
+    start_job_workers(app, db, ScrapeJob, max(JOB_WORKER_THREADS - 1, 0))
+    run_job_worker(app, db, ScrapeJob)
@@ -1,7 +1,14 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
+from sqlalchemy import or_, and_, text, event, inspect
+from team_flags import resolve_team_flag, refresh_team_flag_index
+from sitemaps import refresh_sitemaps
+from progress import start_progress, update_progress, finish_progress
+from live_stream import notify_match_changes
 import atexit
+import threading
+import time
 import unicodedata
 import re
 import os
@@ -34,52 +41,38 @@ def run_daily_scrape(app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scra
             
             total_teams = 0
             categories = TeamCategory.query.all()
-            existing_slugs = set(t.slug for t in Team.query.filter(Team.slug.isnot(None)).all())
+            existing_slugs = load_slug_index(db, Team)
+            cache_snapshot = scraper.get_http_cache_stats()
             
             for category in categories:
-                result = scraper.scrape_category(category.slug)
+                # A 304 is only skipped if this category's teams were ingested after the page was cached
+                result = scraper.scrape_category(category.slug, skip_unchanged=category.teams_scraped_at)
                 if result:
-                    for team_data in result['teams']:
-                        existing = Team.query.filter_by(name=team_data['name'], category_id=category.id).first()
-                        if existing:
-                            existing.team_id = team_data.get('team_id')
-                            existing.flag_url = team_data.get('flag_url')
-                            existing.team_url = team_data.get('team_url')
-                            existing.updated_at = datetime.utcnow()
-                            if not existing.slug and existing.name:
-                                existing.slug = generate_slug(existing.name, existing_slugs)
-                                if existing.slug:
-                                    existing_slugs.add(existing.slug)
-                        else:
-                            team_name = team_data.get('name', '')
-                            new_slug = generate_slug(team_name, existing_slugs) if team_name else None
-                            if new_slug:
-                                existing_slugs.add(new_slug)
-                            team = Team(
-                                team_id=team_data.get('team_id'),
-                                name=team_name,
-                                slug=new_slug,
-                                flag_url=team_data.get('flag_url'),
-                                team_url=team_data.get('team_url'),
-                                category_id=category.id
-                            )
-                            db.session.add(team)
-                        total_teams += 1
+                    rows, _ = bulk_upsert_teams(db, Team, category.id, result['teams'], existing_slugs)
+                    total_teams += len(rows)
+                    if rows:
+                        category.teams_scraped_at = datetime.utcnow()
             
             db.session.commit()
+            refresh_team_flag_index()
             
             setting.last_scrape = datetime.utcnow()
             db.session.commit()
             
+            cache_stats = scraper.http_cache_stats_since(cache_snapshot)
             log = ScrapeLog(
                 category='auto_daily',
                 status='success',
-                message=f'Auto scraped {total_teams} teams from all categories',
-                teams_scraped=total_teams
+                message=f'Auto scraped {total_teams} teams from all categories ({cache_stats["not_modified"]} pages unchanged)',
+                teams_scraped=total_teams,
+                pages_not_modified=cache_stats['not_modified'],
+                bytes_saved=cache_stats['bytes_saved']
             )
             db.session.add(log)
             db.session.commit()
             
+            refresh_sitemaps(['teams'])
+            
             print(f"[SCHEDULER] Auto scrape completed: {total_teams} teams")
             
         except Exception as e:
@@ -94,68 +87,63 @@ def run_daily_scrape(app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scra
 
 def run_daily_player_scrape(app, db, Team, Player, ScrapeLog, ScrapeSetting, scraper):
     with app.app_context():
+        progress_started = False
         try:
             setting = ScrapeSetting.query.first()
             if not setting or not setting.player_auto_scrape_enabled:
                 return
             
             total_players = 0
+            error_count = 0
             teams = Team.query.filter(Team.team_url.isnot(None)).all()
-            existing_player_slugs = set(p.slug for p in Player.query.filter(Player.slug.isnot(None)).all())
+            if not start_progress('players:all', len(teams)):
+                print("[SCHEDULER] Player scrape already running, skipping")
+                return
+            progress_started = True
+            existing_player_slugs = load_slug_index(db, Player)
+            cache_snapshot = scraper.get_http_cache_stats()
             
-            for team in teams:
+            for done, team in enumerate(teams, start=1):
                 try:
-                    players_data = scraper.scrape_players_from_team(team.team_url)
-                    for player_data in players_data:
-                        existing = Player.query.filter_by(name=player_data['name'], team_id=team.id).first()
-                        if existing:
-                            existing.player_id = player_data.get('player_id')
-                            existing.photo_url = player_data.get('photo_url')
-                            existing.player_url = player_data.get('player_url')
-                            existing.role = player_data.get('role')
-                            existing.updated_at = datetime.utcnow()
-                            if not existing.slug and existing.name:
-                                existing.slug = generate_slug(existing.name, existing_player_slugs)
-                                if existing.slug:
-                                    existing_player_slugs.add(existing.slug)
-                        else:
-                            player_name = player_data.get('name', '')
-                            new_slug = generate_slug(player_name, existing_player_slugs) if player_name else None
-                            if new_slug:
-                                existing_player_slugs.add(new_slug)
-                            player = Player(
-                                player_id=player_data.get('player_id'),
-                                name=player_name,
-                                slug=new_slug,
-                                photo_url=player_data.get('photo_url'),
-                                player_url=player_data.get('player_url'),
-                                role=player_data.get('role'),
-                                team_id=team.id
-                            )
-                            db.session.add(player)
-                        total_players += 1
+                    players_data = scraper.scrape_players_from_team(team.team_url, skip_unchanged=team.players_scraped_at)
+                    rows, _ = bulk_upsert_players(db, Player, team.id, players_data, existing_player_slugs)
+                    total_players += len(rows)
+                    if rows:
+                        team.players_scraped_at = datetime.utcnow()
                 except Exception as e:
                     print(f"[SCHEDULER] Error scraping players for {team.name}: {e}")
+                    error_count += 1
                     continue
+                finally:
+                    update_progress('players:all', done, len(teams), errors=error_count, team=team.name)
             
             db.session.commit()
+            finish_progress('players:all', current=len(teams), total=len(teams), errors=error_count,
+                            message=f'Auto scraped {total_players} players', players_scraped=total_players)
             
             setting.last_player_scrape = datetime.utcnow()
             db.session.commit()
             
+            cache_stats = scraper.http_cache_stats_since(cache_snapshot)
             log = ScrapeLog(
                 category='auto_players',
                 status='success',
-                message=f'Auto scraped {total_players} players from all teams',
-                players_scraped=total_players
+                message=f'Auto scraped {total_players} players from all teams ({cache_stats["not_modified"]} pages unchanged)',
+                players_scraped=total_players,
+                pages_not_modified=cache_stats['not_modified'],
+                bytes_saved=cache_stats['bytes_saved']
             )
             db.session.add(log)
             db.session.commit()
             
+            refresh_sitemaps(['players'])
+            
             print(f"[SCHEDULER] Auto player scrape completed: {total_players} players")
             
         except Exception as e:
             print(f"[SCHEDULER] Auto player scrape error: {e}")
+            if progress_started:
+                finish_progress('players:all', status='error', message=str(e))
             log = ScrapeLog(
                 category='auto_players',
                 status='error',
@@ -164,12 +152,13 @@ def run_daily_player_scrape(app, db, Team, Player, ScrapeLog, ScrapeSetting, scr
             db.session.add(log)
             db.session.commit()
 
-def init_scheduler(app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scraper, Player=None, Match=None, LiveScoreScrapeSetting=None, ProfileScrapeSetting=None, SeriesCategory=None, Series=None, SeriesScrapeSetting=None, MatchScrapeSetting=None):
-    global scheduler_started
-    
-    if scheduler_started:
-        return
-    
+def run_sitemap_refresh(app):
+    with app.app_context():
+        refresh_sitemaps()
+        print("[SCHEDULER] Sitemaps refreshed")
+
+def register_scheduled_jobs(app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scraper, Player=None, Match=None, LiveScoreScrapeSetting=None, ProfileScrapeSetting=None, SeriesCategory=None, Series=None, SeriesScrapeSetting=None, MatchScrapeSetting=None, Post=None, PostCategory=None, AutoPostSetting=None, AutoPostLog=None):
+    """Add every job enabled in the settings tables (the DB is the source of truth)"""
     with app.app_context():
         setting = ScrapeSetting.query.first()
         if setting and setting.auto_scrape_enabled:
@@ -264,11 +253,159 @@ def init_scheduler(app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scrape
                 )
                 
                 print(f"[SCHEDULER] Match auto-scrape scheduled (every {interval_hours}h)")
+        
+        # Picks up admin edits and live-score updates that no nightly job covers
+        from apscheduler.triggers.interval import IntervalTrigger
+        sitemap_minutes = int(os.environ.get('SITEMAP_REFRESH_MINUTES', 30))
+        scheduler.add_job(
+            func=lambda: run_sitemap_refresh(app),
+            trigger=IntervalTrigger(minutes=sitemap_minutes),
+            id='sitemap_refresh',
+            replace_existing=True
+        )
+        print(f"[SCHEDULER] Sitemap refresh scheduled (every {sitemap_minutes}m)")
+        
+        if setting and Player:
+            for category, enabled_attr, time_attr in CATEGORY_PLAYER_SETTINGS:
+                if getattr(setting, enabled_attr):
+                    update_category_player_schedule(app, db, ScrapeSetting, TeamCategory, Team, Player, ScrapeLog, scraper, category, True, getattr(setting, time_attr))
+        
+        if MatchScrapeSetting and Match and Series and SeriesCategory:
+            for ms in MatchScrapeSetting.query.filter(MatchScrapeSetting.auto_scrape_enabled == True, MatchScrapeSetting.category_slug.isnot(None)).all():
+                update_category_matches_schedule(app, db, SeriesCategory, Series, Match, ScrapeLog, MatchScrapeSetting, scraper, ms.category_slug, True, ms.scrape_time)
     
-    scheduler.start()
+    if AutoPostSetting and Post and PostCategory and AutoPostLog and Match:
+        update_auto_post_schedule(app, db, Match, Post, PostCategory, AutoPostSetting, AutoPostLog)
+
+# Only one process may run scheduled jobs. Every gunicorn worker calls
+# init_scheduler; the one that takes the PostgreSQL advisory lock starts
+# APScheduler and the rest retry every SCHEDULER_LEADER_CHECK_SECONDS, so a
+# standby takes over when the leader's connection (and lock) goes away.
+# SCHEDULER_MODE=off keeps a process out of the election entirely, e.g. web
+# workers when run_scheduler.py runs as its own service.
+SCHEDULER_MODE = os.environ.get('SCHEDULER_MODE', 'auto').lower()
+SCHEDULER_LOCK_KEY = 72600102
+SCHEDULER_LEADER_CHECK_SECONDS = int(os.environ.get('SCHEDULER_LEADER_CHECK_SECONDS', 30))
+
+CATEGORY_PLAYER_SETTINGS = [
+    ('international', 'intl_auto', 'intl_time'),
+    ('domestic', 'domestic_auto', 'domestic_time'),
+    ('league', 'league_auto', 'league_time'),
+    ('women', 'women_auto', 'women_time'),
+]
+
+# Columns that change which jobs exist; last_scrape and friends are left out
+# so a job finishing does not trigger a reschedule
+SCHEDULE_SETTING_COLUMNS = {
+    'ScrapeSetting': ['auto_scrape_enabled', 'scrape_time', 'player_auto_scrape_enabled', 'player_scrape_time',
+                      'intl_auto', 'intl_time', 'domestic_auto', 'domestic_time', 'league_auto', 'league_time', 'women_auto', 'women_time'],
+    'LiveScoreScrapeSetting': ['auto_scrape_enabled', 'interval_seconds'],
+    'ProfileScrapeSetting': ['category_slug', 'auto_scrape_enabled', 'scrape_time'],
+    'SeriesScrapeSetting': ['category_slug', 'auto_scrape_enabled', 'scrape_time'],
+    'MatchScrapeSetting': ['category_slug', 'auto_scrape_enabled', 'scrape_time', 'interval_hours'],
+    'AutoPostSetting': ['is_enabled', 'schedule_hour', 'schedule_minute'],
+}
+
+scheduler_leader = {'conn': None, 'is_leader': False, 'settings_stamp': None}
+
+def try_acquire_scheduler_lock(db):
+    """Take the scheduler advisory lock on a dedicated connection held for the life of the process"""
+    if db.engine.dialect.name != 'postgresql':
+        return True
+    conn = db.engine.connect()
+    try:
+        acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {'key': SCHEDULER_LOCK_KEY}).scalar()
+        # Session-level lock: it survives the commit and is released when the connection closes
+        conn.commit()
+    except Exception:
+        conn.close()
+        raise
+    if not acquired:
+        conn.close()
+        return False
+    scheduler_leader['conn'] = conn
+    return True
+
+def scheduler_lock_alive():
+    """True while the connection holding the advisory lock still works"""
+    conn = scheduler_leader['conn']
+    if conn is None:
+        return True
+    try:
+        conn.execute(text("SELECT 1"))
+        conn.commit()
+        return True
+    except Exception:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        scheduler_leader['conn'] = None
+        return False
+
+def schedule_settings_stamp(settings_models):
+    """Snapshot of the schedule-relevant settings columns"""
+    stamp = []
+    for Model in settings_models:
+        columns = [getattr(Model, name) for name in SCHEDULE_SETTING_COLUMNS[Model.__name__]]
+        stamp.append(tuple(tuple(row) for row in Model.query.with_entities(*columns).order_by(Model.id).all()))
+    return tuple(stamp)
+
+def run_scheduler_leader_loop(app, register_jobs, settings_models, db):
+    """Elect this process as scheduler leader when possible and keep its jobs in sync with settings"""
+    while True:
+        try:
+            with app.app_context():
+                if not scheduler_leader['is_leader']:
+                    if try_acquire_scheduler_lock(db):
+                        scheduler_leader['settings_stamp'] = schedule_settings_stamp(settings_models)
+                        # Drop jobs queued by admin toggles while this process was a standby
+                        scheduler.remove_all_jobs()
+                        register_jobs()
+                        if scheduler.running:
+                            scheduler.resume()
+                        else:
+                            scheduler.start()
+                        scheduler_leader['is_leader'] = True
+                        print(f"[SCHEDULER] Process {os.getpid()} is the scheduler leader")
+                elif not scheduler_lock_alive():
+                    scheduler.pause()
+                    scheduler.remove_all_jobs()
+                    scheduler_leader['is_leader'] = False
+                    print(f"[SCHEDULER] Process {os.getpid()} lost scheduler leadership, jobs paused")
+                else:
+                    # Settings may have been changed through another worker
+                    stamp = schedule_settings_stamp(settings_models)
+                    if stamp != scheduler_leader['settings_stamp']:
+                        scheduler_leader['settings_stamp'] = stamp
+                        scheduler.remove_all_jobs()
+                        register_jobs()
+                        print("[SCHEDULER] Jobs rebuilt after settings change")
+                db.session.remove()
+        except Exception as e:
+            print(f"[SCHEDULER] Leader check error: {e}")
+        time.sleep(SCHEDULER_LEADER_CHECK_SECONDS)
+
+def init_scheduler(app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scraper, Player=None, Match=None, LiveScoreScrapeSetting=None, ProfileScrapeSetting=None, SeriesCategory=None, Series=None, SeriesScrapeSetting=None, MatchScrapeSetting=None, Post=None, PostCategory=None, AutoPostSetting=None, AutoPostLog=None):
+    global scheduler_started
+    
+    if scheduler_started:
+        return
     scheduler_started = True
     
-    atexit.register(lambda: scheduler.shutdown())
+    if SCHEDULER_MODE == 'off':
+        print("[SCHEDULER] Disabled in this process (SCHEDULER_MODE=off)")
+        return
+    
+    register_jobs = lambda: register_scheduled_jobs(
+        app, db, TeamCategory, Team, ScrapeLog, ScrapeSetting, scraper, Player, Match, LiveScoreScrapeSetting,
+        ProfileScrapeSetting, SeriesCategory, Series, SeriesScrapeSetting, MatchScrapeSetting,
+        Post, PostCategory, AutoPostSetting, AutoPostLog
+    )
+    settings_models = [m for m in (ScrapeSetting, LiveScoreScrapeSetting, ProfileScrapeSetting, SeriesScrapeSetting, MatchScrapeSetting, AutoPostSetting) if m]
+    
+    threading.Thread(target=run_scheduler_leader_loop, args=(app, register_jobs, settings_models, db), daemon=True).start()
+    atexit.register(lambda: scheduler.shutdown(wait=False) if scheduler.running else None)
 
 def update_schedule(app, db, ScrapeSetting, TeamCategory, Team, ScrapeLog, scraper, enabled, scrape_time):
     global scheduler_started
@@ -310,66 +447,214 @@ def update_player_schedule(app, db, ScrapeSetting, Team, Player, ScrapeLog, scra
     else:
         print("[SCHEDULER] Daily player scrape disabled")
 
+def load_slug_index(db, Model):
+    """All slugs currently used by Model, loaded with a single column-only query"""
+    return set(slug for (slug,) in db.session.query(Model.slug).filter(Model.slug.isnot(None)).all())
+
+def bulk_upsert_teams(db, Team, category_id, teams_data, existing_slugs=None):
+    """
+    Insert or update a batch of scraped teams for one category.
+    Existing rows are resolved with one query (by team_id, then by name within
+    the category) and new slugs are allocated against one slug index.
+    Returns (rows, inserted_count); rows follow teams_data order.
+    """
+    teams_data = [t for t in teams_data if t.get('team_id') or t.get('name')]
+    if not teams_data:
+        return [], 0
+    if existing_slugs is None:
+        existing_slugs = load_slug_index(db, Team)
+    
+    team_ids = [t['team_id'] for t in teams_data if t.get('team_id')]
+    names = [t['name'] for t in teams_data if t.get('name')]
+    existing_rows = Team.query.filter(or_(
+        Team.team_id.in_(team_ids or ['']),
+        and_(Team.category_id == category_id, Team.name.in_(names or ['']))
+    )).all()
+    by_team_id = {t.team_id: t for t in existing_rows if t.team_id}
+    by_name = {t.name: t for t in existing_rows if t.category_id == category_id}
+    
+    rows = []
+    new_rows = []
+    for team_data in teams_data:
+        team = by_team_id.get(team_data.get('team_id')) or by_name.get(team_data.get('name'))
+        if team:
+            if team_data.get('team_id'):
+                team.team_id = team_data['team_id']
+            if team_data.get('name'):
+                team.name = team_data['name']
+            if team_data.get('flag_url'):
+                team.flag_url = team_data['flag_url']
+            if team_data.get('team_url'):
+                team.team_url = team_data['team_url']
+            team.category_id = category_id
+            team.updated_at = datetime.utcnow()
+            if not team.slug and team.name:
+                team.slug = generate_slug(team.name, existing_slugs)
+                if team.slug:
+                    existing_slugs.add(team.slug)
+        else:
+            team_name = team_data.get('name', '')
+            new_slug = generate_slug(team_name, existing_slugs) if team_name else None
+            if new_slug:
+                existing_slugs.add(new_slug)
+            team = Team(
+                team_id=team_data.get('team_id'),
+                name=team_name,
+                slug=new_slug,
+                flag_url=team_data.get('flag_url'),
+                team_url=team_data.get('team_url'),
+                category_id=category_id
+            )
+            new_rows.append(team)
+        if team.team_id:
+            by_team_id[team.team_id] = team
+        by_name[team.name] = team
+        rows.append(team)
+    
+    db.session.add_all(new_rows)
+    return rows, len(new_rows)
+
+def bulk_upsert_players(db, Player, team_id, players_data, existing_slugs=None):
+    """
+    Insert or update a batch of scraped players for one team (Team.id).
+    Existing rows are resolved with one query (by player_id, then by name,
+    both within the team) and new slugs are allocated against one slug index.
+    A player on several squads keeps one row per team.
+    Returns (rows, inserted_count); rows follow players_data order.
+    """
+    players_data = [p for p in players_data if p.get('name')]
+    if not players_data:
+        return [], 0
+    if existing_slugs is None:
+        existing_slugs = load_slug_index(db, Player)
+    
+    existing_rows = Player.query.filter(Player.team_id == team_id).all()
+    by_player_id = {p.player_id: p for p in existing_rows if p.player_id}
+    by_name = {p.name: p for p in existing_rows}
+    
+    rows = []
+    new_rows = []
+    for player_data in players_data:
+        player = by_player_id.get(player_data.get('player_id')) or by_name.get(player_data['name'])
+        if player:
+            player.name = player_data['name']
+            if player_data.get('player_id'):
+                player.player_id = player_data['player_id']
+            if player_data.get('photo_url'):
+                player.photo_url = player_data['photo_url']
+            if player_data.get('player_url'):
+                player.player_url = player_data['player_url']
+            if player_data.get('role'):
+                player.role = player_data['role']
+            player.updated_at = datetime.utcnow()
+            if not player.slug and player.name:
+                player.slug = generate_slug(player.name, existing_slugs)
+                if player.slug:
+                    existing_slugs.add(player.slug)
+        else:
+            new_slug = generate_slug(player_data['name'], existing_slugs)
+            if new_slug:
+                existing_slugs.add(new_slug)
+            player = Player(
+                player_id=player_data.get('player_id'),
+                name=player_data['name'],
+                slug=new_slug,
+                photo_url=player_data.get('photo_url'),
+                player_url=player_data.get('player_url'),
+                role=player_data.get('role'),
+                team_id=team_id
+            )
+            new_rows.append(player)
+        if player.player_id:
+            by_player_id[player.player_id] = player
+        by_name[player.name] = player
+        rows.append(player)
+    
+    db.session.add_all(new_rows)
+    return rows, len(new_rows)
+
+def run_roster_scrape(db, Player, scraper, teams, skip_unchanged=False, on_progress=None):
+    """
+    Fetch team rosters concurrently and merge each into Player as it arrives.
+    on_progress(done, total, team, team_players, errors) is called after every team.
+    With skip_unchanged, a 304 is skipped for teams whose roster was ingested
+    after the page was cached. Returns (total_players, error_count).
+    """
+    existing_player_slugs = load_slug_index(db, Player)
+    teams_by_id = {t.id: t for t in teams}
+    jobs = [(t.id, t.team_url, t.players_scraped_at if skip_unchanged else None) for t in teams]
+    
+    total_players = 0
+    error_count = 0
+    done = 0
+    for (team_id, _, _), players_data, error in scraper.scrape_concurrently(
+            jobs, lambda job: scraper.scrape_players_from_team(job[1], skip_unchanged=job[2])):
+        team = teams_by_id[team_id]
+        done += 1
+        team_players = 0
+        if error:
+            error_count += 1
+        else:
+            try:
+                rows, _ = bulk_upsert_players(db, Player, team.id, players_data or [], existing_player_slugs)
+                team_players = len(rows)
+                if rows:
+                    team.players_scraped_at = datetime.utcnow()
+                db.session.commit()
+                total_players += team_players
+            except Exception as e:
+                print(f"[SCHEDULER] Error saving players for {team.name}: {e}")
+                db.session.rollback()
+                error_count += 1
+        if on_progress:
+            on_progress(done, len(jobs), team, team_players, error_count)
+    
+    return total_players, error_count
+
 def run_category_player_scrape(app, db, TeamCategory, Team, Player, ScrapeLog, ScrapeSetting, scraper, category_slug):
+    progress_key = f'players:{category_slug}'
     with app.app_context():
+        progress_started = False
         try:
             category = TeamCategory.query.filter_by(slug=category_slug).first()
             if not category:
                 return
             
-            total_players = 0
             teams = Team.query.filter_by(category_id=category.id).filter(Team.team_url.isnot(None)).all()
-            existing_player_slugs = set(p.slug for p in Player.query.filter(Player.slug.isnot(None)).all())
+            if not start_progress(progress_key, len(teams)):
+                print(f"[SCHEDULER] {category_slug} players scrape already running, skipping")
+                return
+            progress_started = True
+            cache_snapshot = scraper.get_http_cache_stats()
             
-            for team in teams:
-                try:
-                    players_data = scraper.scrape_players_from_team(team.team_url)
-                    for player_data in players_data:
-                        existing = Player.query.filter_by(name=player_data['name'], team_id=team.id).first()
-                        if existing:
-                            existing.player_id = player_data.get('player_id')
-                            existing.photo_url = player_data.get('photo_url')
-                            existing.player_url = player_data.get('player_url')
-                            existing.role = player_data.get('role')
-                            existing.updated_at = datetime.utcnow()
-                            if not existing.slug and existing.name:
-                                existing.slug = generate_slug(existing.name, existing_player_slugs)
-                                if existing.slug:
-                                    existing_player_slugs.add(existing.slug)
-                        else:
-                            player_name = player_data.get('name', '')
-                            new_slug = generate_slug(player_name, existing_player_slugs) if player_name else None
-                            if new_slug:
-                                existing_player_slugs.add(new_slug)
-                            player = Player(
-                                player_id=player_data.get('player_id'),
-                                name=player_name,
-                                slug=new_slug,
-                                photo_url=player_data.get('photo_url'),
-                                player_url=player_data.get('player_url'),
-                                role=player_data.get('role'),
-                                team_id=team.id
-                            )
-                            db.session.add(player)
-                        total_players += 1
-                except Exception as e:
-                    continue
+            def on_progress(done, total, team, team_players, errors):
+                update_progress(progress_key, done, total, errors=errors, team=team.name, team_players=team_players)
             
-            db.session.commit()
+            total_players, error_count = run_roster_scrape(db, Player, scraper, teams, skip_unchanged=True, on_progress=on_progress)
             
+            cache_stats = scraper.http_cache_stats_since(cache_snapshot)
+            message = f'Auto scraped {total_players} players from {category.name} ({cache_stats["not_modified"]} pages unchanged, {error_count} errors)'
+            finish_progress(progress_key, current=len(teams), total=len(teams), errors=error_count,
+                            message=message, players_scraped=total_players)
             log = ScrapeLog(
                 category=f'auto_{category_slug}_players',
                 status='success',
-                message=f'Auto scraped {total_players} players from {category.name}',
-                players_scraped=total_players
+                message=message,
+                players_scraped=total_players,
+                pages_not_modified=cache_stats['not_modified'],
+                bytes_saved=cache_stats['bytes_saved']
             )
             db.session.add(log)
             db.session.commit()
             
+            refresh_sitemaps(['players'])
+            
             print(f"[SCHEDULER] Auto {category_slug} players scrape completed: {total_players} players")
             
         except Exception as e:
             print(f"[SCHEDULER] Auto {category_slug} players scrape error: {e}")
+            if progress_started:
+                finish_progress(progress_key, status='error', message=str(e))
 
 def update_category_player_schedule(app, db, ScrapeSetting, TeamCategory, Team, Player, ScrapeLog, scraper, category, enabled, scrape_time):
     job_id = f'{category}_player_scrape'
@@ -391,6 +676,236 @@ def update_category_player_schedule(app, db, ScrapeSetting, TeamCategory, Team,
     else:
         print(f"[SCHEDULER] {category.title()} player scrape disabled")
 
+MATCH_TEXT_COLUMNS = [
+    'cricbuzz_series_id', 'team1_id', 'team2_id', 'venue_id', 'match_format', 'format_type',
+    'venue', 'match_date', 'match_time', 'start_date', 'end_date', 'state',
+    'team1_name', 'team1_score', 'team1_flag', 'team2_name', 'team2_score', 'team2_flag',
+    'result', 'match_url', 'series_name', 'toss', 'live_status'
+]
+MATCH_VALUE_COLUMNS = ['series_id', 'batting_data', 'bowling_data', 'innings_data']
+MATCH_INGEST_CHUNK = 500
+
+# Columns whose change is pushed to live score streams
+LIVE_DELTA_COLUMNS = ['state', 'team1_score', 'team2_score', 'result', 'live_status']
+
+MATCH_CHANGE_COUNTER = 'matches'
+
+def next_change_version(conn, name=MATCH_CHANGE_COUNTER):
+    """
+    Increment a change_counters row on conn and return it. The row stays
+    locked until conn's transaction commits, so versions become visible in
+    the order they were handed out and a since= reader never skips one.
+    """
+    version = conn.execute(text("UPDATE change_counters SET value = value + 1 WHERE name = :name RETURNING value"), {'name': name}).scalar()
+    if version is None:
+        conn.execute(text("INSERT INTO change_counters (name, value) VALUES (:name, 1)"), {'name': name})
+        version = 1
+    return version
+
+def stamp_match_versions(db, Match, match_ids):
+    """
+    Give the matches one new change version in a short transaction of its
+    own and return it. Call after the changes are committed, so the counter
+    row is never locked behind a long scrape or ahead of match row locks.
+    """
+    table = Match.__table__
+    with db.engine.begin() as conn:
+        version = next_change_version(conn)
+        for i in range(0, len(match_ids), MATCH_INGEST_CHUNK):
+            chunk = match_ids[i:i + MATCH_INGEST_CHUNK]
+            conn.execute(table.update().where(table.c.match_id.in_(chunk)).values(change_version=version))
+    return version
+
+# session.info key for the match ids changed in the session's current transaction
+CHANGED_MATCHES_KEY = 'changed_match_ids'
+
+def record_match_changes(db, match_ids):
+    """Queue match ids to be stamped and pushed to live streams when the session commits"""
+    db.session.info.setdefault(CHANGED_MATCHES_KEY, set()).update(match_ids)
+
+def track_match_changes(db, Match):
+    """
+    Collect the matches whose LIVE_DELTA_COLUMNS an ORM flush changes and,
+    once the transaction commits, stamp them with a new change_version and
+    notify live streams. Core upserts (ingest_matches on PostgreSQL) bypass
+    the ORM and record their changed rows themselves.
+    """
+    @event.listens_for(db.session, 'before_flush')
+    def collect_changed_matches(session, flush_context, instances):
+        changed = [
+            obj.match_id for obj in list(session.new) + list(session.dirty)
+            if isinstance(obj, Match) and obj.match_id and (obj in session.new or any(
+                inspect(obj).attrs[column].history.has_changes() for column in LIVE_DELTA_COLUMNS))
+        ]
+        if changed:
+            record_match_changes(db, changed)
+    
+    @event.listens_for(db.session, 'after_commit')
+    def stamp_changed_matches(session):
+        match_ids = session.info.pop(CHANGED_MATCHES_KEY, None)
+        if not match_ids:
+            return
+        match_ids = sorted(match_ids)
+        try:
+            stamp_match_versions(db, Match, match_ids)
+            notify_match_changes(db, match_ids)
+        except Exception as e:
+            print(f"[SCHEDULER] Match change stamp error: {e}")
+    
+    @event.listens_for(db.session, 'after_rollback')
+    def forget_changed_matches(session):
+        session.info.pop(CHANGED_MATCHES_KEY, None)
+
+def normalize_match_row(match_data, db_series_id=None):
+    """Map a scraped match dict (any of the scrapers' key spellings) to Match columns"""
+    state = match_data.get('status') or match_data.get('state') or ''
+    if state == 'Preview':
+        state = 'Upcoming'
+    row = {
+        'match_id': str(match_data['match_id']),
+        'cricbuzz_series_id': match_data.get('series_id'),
+        'team1_name': match_data.get('team1') or match_data.get('team1_name'),
+        'team2_name': match_data.get('team2') or match_data.get('team2_name'),
+        'state': state,
+        'series_id': match_data.get('db_series_id') or db_series_id,
+        'batting_data': match_data.get('batting') or None,
+        'bowling_data': match_data.get('bowling') or None,
+        'innings_data': match_data.get('innings') or None,
+    }
+    for column in MATCH_TEXT_COLUMNS:
+        if column not in row:
+            row[column] = match_data.get(column)
+    for column in MATCH_TEXT_COLUMNS:
+        value = row[column]
+        row[column] = str(value).strip() if value not in (None, '') else None
+    return row
+
+def ingest_matches(db, Match, matches_data, db_series_id=None):
+    """
+    Upsert many scraped matches keyed on match_id.
+    Columns are only overwritten when the incoming value is non-empty, so a
+    sparse scrape never blanks out scores or results written by another one.
+    On PostgreSQL this is one INSERT ... ON CONFLICT per MATCH_INGEST_CHUNK rows.
+    Returns (inserted_count, updated_count).
+    """
+    rows = {}
+    for match_data in matches_data:
+        if not isinstance(match_data, dict) or not match_data.get('match_id'):
+            continue
+        row = normalize_match_row(match_data, db_series_id)
+        previous = rows.get(row['match_id'])
+        if previous:
+            # Same match twice in one batch: keep the non-empty values from both
+            row = {k: (v if v not in (None, '') else previous.get(k)) for k, v in row.items()}
+        rows[row['match_id']] = row
+    if not rows:
+        return 0, 0
+    
+    match_ids = list(rows.keys())
+    stored_flags = {}
+    stored_slugs = {}
+    stored_live = {}
+    live_columns = [getattr(Match, column) for column in LIVE_DELTA_COLUMNS]
+    for i in range(0, len(match_ids), MATCH_INGEST_CHUNK):
+        chunk = match_ids[i:i + MATCH_INGEST_CHUNK]
+        for mid, team1_flag, team2_flag, slug, *live in db.session.query(Match.match_id, Match.team1_flag, Match.team2_flag, Match.slug, *live_columns).filter(Match.match_id.in_(chunk)).all():
+            stored_flags[mid] = (team1_flag, team2_flag)
+            stored_slugs[mid] = slug
+            stored_live[mid] = tuple(live)
+    existing_ids = set(stored_flags)
+    
+    # Persist a flag from a scraped team when neither the scrape nor the stored row has
+    # one, so pages can read Match.team1_flag/team2_flag without resolving per request.
+    # Guesses are left to render time, where a later team scrape can still improve them
+    for match_id, row in rows.items():
+        team1_stored, team2_stored = stored_flags.get(match_id, (None, None))
+        if not row['team1_flag'] and not team1_stored:
+            row['team1_flag'] = resolve_team_flag(row['team1_name'], guess=False)
+        if not row['team2_flag'] and not team2_stored:
+            row['team2_flag'] = resolve_team_flag(row['team2_name'], guess=False)
+    
+    # Slugs are only needed for new rows and stored rows that never got one; check candidates against the table once
+    candidates = {}
+    for match_id, row in rows.items():
+        if stored_slugs.get(match_id) or not (row['team1_name'] and row['team2_name']):
+            continue
+        match_title = f"{row['team1_name']} vs {row['team2_name']}"
+        if row['series_name']:
+            match_title += f" {row['series_name']}"
+        match_title += f" {match_id}"
+        candidates[match_id] = generate_slug(match_title)
+    taken = set()
+    if candidates:
+        taken = set(slug for (slug,) in db.session.query(Match.slug).filter(Match.slug.in_(list(candidates.values()))).all())
+    
+    now = datetime.utcnow()
+    for match_id, row in rows.items():
+        slug = candidates.get(match_id)
+        if slug:
+            slug = generate_slug(slug, taken)
+            taken.add(slug)
+        row['slug'] = slug
+        row['created_at'] = now
+        row['updated_at'] = now
+    
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        from sqlalchemy import func, case, cast, Text
+        
+        table = Match.__table__
+        values = list(rows.values())
+        changed = []
+        for i in range(0, len(values), MATCH_INGEST_CHUNK):
+            stmt = pg_insert(table).values(values[i:i + MATCH_INGEST_CHUNK])
+            excluded = stmt.excluded
+            update_set = {c: func.coalesce(func.nullif(excluded[c], ''), table.c[c]) for c in MATCH_TEXT_COLUMNS}
+            # A missing scorecard binds as the JSON value null, not SQL NULL, so COALESCE alone would keep it
+            update_set.update({
+                c: case((or_(excluded[c].is_(None), cast(excluded[c], Text) == 'null'), table.c[c]), else_=excluded[c])
+                for c in MATCH_VALUE_COLUMNS
+            })
+            update_set['slug'] = func.coalesce(table.c.slug, excluded.slug)
+            update_set['updated_at'] = excluded.updated_at
+            stmt = stmt.on_conflict_do_update(index_elements=['match_id'], set_=update_set)
+            for mid, *live in db.session.execute(stmt.returning(table.c.match_id, *[table.c[c] for c in LIVE_DELTA_COLUMNS])):
+                if stored_live.get(mid) != tuple(live):
+                    changed.append(mid)
+        # The ORM flush hook never sees these rows; they are stamped when the caller commits
+        if changed:
+            record_match_changes(db, changed)
+        # Match objects already loaded in this session must not shadow the new values
+        for obj in list(db.session.identity_map.values()):
+            if isinstance(obj, Match) and obj.match_id in rows:
+                db.session.expire(obj)
+    else:
+        # Plain ORM writes: track_match_changes collects them at flush
+        existing = {m.match_id: m for m in Match.query.filter(Match.match_id.in_(list(existing_ids))).all()} if existing_ids else {}
+        for match_id, row in rows.items():
+            match = existing.get(match_id)
+            if match is None:
+                db.session.add(Match(**row))
+                continue
+            for column in MATCH_TEXT_COLUMNS + MATCH_VALUE_COLUMNS:
+                if row[column] not in (None, ''):
+                    setattr(match, column, row[column])
+            if not match.slug:
+                match.slug = row['slug']
+            match.updated_at = now
+    
+    updated = len(existing_ids)
+    return len(rows) - updated, updated
+
+def apply_live_order(db, Match, match_ids):
+    """Store Cricbuzz live-page container order on Match.live_order"""
+    order = {str(mid): position for position, mid in enumerate(match_ids) if mid}
+    # Matches that dropped off the live page lose their position
+    Match.query.filter(
+        Match.live_order.isnot(None),
+        Match.match_id.notin_(list(order.keys()) or [''])
+    ).update({Match.live_order: None}, synchronize_session=False)
+    for match in Match.query.filter(Match.match_id.in_(list(order.keys()))).all():
+        match.live_order = order[match.match_id]
+
 def run_live_score_scrape(app, db, Match, ScrapeLog, LiveScoreScrapeSetting, scraper):
     with app.app_context():
         try:
@@ -405,90 +920,14 @@ def run_live_score_scrape(app, db, Match, ScrapeLog, LiveScoreScrapeSetting, scr
                 return
             
             all_matches = result.get('matches', [])
+            inserted, updated = ingest_matches(db, Match, all_matches)
+            updated_count = inserted + updated
             
-            updated_count = 0
-            for match_data in all_matches:
-                if not isinstance(match_data, dict):
-                    continue
-                    
-                match_id = match_data.get('match_id')
-                if not match_id:
-                    continue
-                
-                existing = Match.query.filter_by(match_id=match_id).first()
-                if existing:
-                    # Update team names if provided (scraper uses team1_name/team2_name keys)
-                    if match_data.get('team1_name'):
-                        existing.team1_name = match_data.get('team1_name')
-                    if match_data.get('team2_name'):
-                        existing.team2_name = match_data.get('team2_name')
-                    # Only update scores if new value is not empty (preserve existing scores)
-                    if match_data.get('team1_score'):
-                        existing.team1_score = match_data.get('team1_score')
-                    if match_data.get('team2_score'):
-                        existing.team2_score = match_data.get('team2_score')
-                    # Update result only if not empty
-                    if match_data.get('result'):
-                        existing.result = match_data.get('result')
-                    if match_data.get('state'):
-                        state_val = match_data.get('state')
-                        # Convert Preview to Upcoming for consistency
-                        if state_val == 'Preview':
-                            state_val = 'Upcoming'
-                        existing.state = state_val
-                    if match_data.get('match_format'):
-                        existing.match_format = match_data.get('match_format')
-                    if match_data.get('series_name'):
-                        existing.series_name = match_data.get('series_name')
-                    if match_data.get('match_url'):
-                        existing.match_url = match_data.get('match_url')
-                    if match_data.get('series_id'):
-                        existing.cricbuzz_series_id = match_data.get('series_id')
-                    # Update team flags if available
-                    if match_data.get('team1_flag'):
-                        existing.team1_flag = match_data.get('team1_flag')
-                    if match_data.get('team2_flag'):
-                        existing.team2_flag = match_data.get('team2_flag')
-                    existing.updated_at = datetime.utcnow()
-                else:
-                    # Convert Preview to Upcoming for new matches
-                    new_state = match_data.get('state', '')
-                    if new_state == 'Preview':
-                        new_state = 'Upcoming'
-                    
-                    # Generate slug for new match
-                    team1 = match_data.get('team1_name', '')
-                    team2 = match_data.get('team2_name', '')
-                    match_format = match_data.get('match_format', '')
-                    match_slug = None
-                    if team1 and team2:
-                        match_title = f"{team1} vs {team2}"
-                        if match_format:
-                            match_title += f" {match_format}"
-                        match_slug = generate_slug(match_title)
-                    
-                    new_match = Match(
-                        match_id=match_id,
-                        slug=match_slug,
-                        team1_name=team1,
-                        team1_score=match_data.get('team1_score', ''),
-                        team2_name=team2,
-                        team2_score=match_data.get('team2_score', ''),
-                        result=match_data.get('result', ''),
-                        state=new_state,
-                        match_format=match_format,
-                        series_name=match_data.get('series_name', ''),
-                        match_url=match_data.get('match_url', ''),
-                        cricbuzz_series_id=match_data.get('series_id', ''),
-                        team1_flag=match_data.get('team1_flag', ''),
-                        team2_flag=match_data.get('team2_flag', '')
-                    )
-                    db.session.add(new_match)
-                updated_count += 1
-            
-            db.session.commit()
-            
+            db.session.flush()
+            if result.get('success'):
+                apply_live_order(db, Match, [m.get('match_id') for m in all_matches if isinstance(m, dict)])
             setting.last_scrape = datetime.utcnow()
+            # Changed matches are stamped and pushed to streams once this commits
             db.session.commit()
             
             print(f"[SCHEDULER] Live score auto-scrape: {updated_count} matches updated")
@@ -520,7 +959,9 @@ def update_live_score_schedule(app, db, Match, ScrapeLog, LiveScoreScrapeSetting
         print(f"[SCHEDULER] Live score auto-scrape disabled")
 
 def run_category_profile_scrape(app, db, TeamCategory, Team, Player, ScrapeLog, ProfileScrapeSetting, scraper, category_slug):
+    progress_key = f'profiles:{category_slug}'
     with app.app_context():
+        progress_started = False
         try:
             category = TeamCategory.query.filter_by(slug=category_slug).first()
             if not category:
@@ -532,10 +973,20 @@ def run_category_profile_scrape(app, db, TeamCategory, Team, Player, ScrapeLog,
                 Player.player_url.isnot(None)
             ).all()
             
+            if not start_progress(progress_key, len(players), current_player='Starting...'):
+                print(f"[SCHEDULER] {category_slug} profiles scrape already running, skipping")
+                return
+            progress_started = True
+            
             scraped_count = 0
-            for player in players:
+            error_count = 0
+            cache_snapshot = scraper.get_http_cache_stats()
+            for done, player in enumerate(players, start=1):
                 try:
-                    profile_data = scraper.scrape_player_profile(player.player_url)
+                    # Unchanged pages only need parsing if the profile was never stored
+                    profile_data = scraper.scrape_player_profile(player.player_url, skip_unchanged=bool(player.profile_scraped))
+                    if profile_data and profile_data.get('not_modified'):
+                        continue
                     if profile_data:
                         if profile_data.get('born'):
                             player.born = profile_data['born']
@@ -560,26 +1011,42 @@ def run_category_profile_scrape(app, db, TeamCategory, Team, Player, ScrapeLog,
                         
                         if scraped_count % 10 == 0:
                             db.session.commit()
+                    else:
+                        # scrape_player_profile returns None instead of raising when a fetch fails
+                        error_count += 1
                             
                 except Exception as e:
                     print(f"[SCHEDULER] Error scraping profile for {player.name}: {e}")
+                    error_count += 1
                     continue
+                finally:
+                    update_progress(progress_key, done, len(players), errors=error_count,
+                                    current_player=player.name, scraped=scraped_count)
             
             db.session.commit()
+            finish_progress(progress_key, current=len(players), total=len(players), errors=error_count,
+                            current_player='', scraped=scraped_count)
             
+            cache_stats = scraper.http_cache_stats_since(cache_snapshot)
             log = ScrapeLog(
                 category=f'{category_slug}_profiles',
                 status='success',
-                message=f'Auto scraped {scraped_count} player profiles',
-                players_scraped=scraped_count
+                message=f'Auto scraped {scraped_count} player profiles ({cache_stats["not_modified"]} pages unchanged)',
+                players_scraped=scraped_count,
+                pages_not_modified=cache_stats['not_modified'],
+                bytes_saved=cache_stats['bytes_saved']
             )
             db.session.add(log)
             db.session.commit()
             
+            refresh_sitemaps(['players'])
+            
             print(f"[SCHEDULER] Auto {category_slug} profiles scrape completed: {scraped_count} profiles")
             
         except Exception as e:
             print(f"[SCHEDULER] Auto {category_slug} profiles scrape error: {e}")
+            if progress_started:
+                finish_progress(progress_key, status='error', message=str(e), current_player='', error=str(e))
 
 def update_category_profile_schedule(app, db, TeamCategory, Team, Player, ScrapeLog, ProfileScrapeSetting, scraper, category, enabled, scrape_time):
     job_id = f'{category}_profile_scrape'
@@ -651,6 +1118,8 @@ def run_category_series_scrape(app, db, SeriesCategory, Series, ScrapeLog, Serie
             db.session.add(log)
             db.session.commit()
             
+            refresh_sitemaps(['series'])
+            
             print(f"[SCHEDULER] Auto {category_slug} series scrape completed: {total_series} series")
             
         except Exception as e:
@@ -693,61 +1162,13 @@ def run_category_matches_scrape(app, db, SeriesCategory, Series, Match, ScrapeLo
                 try:
                     matches_list = scraper.scrape_matches_from_series(series.series_url)
                     if matches_list:
-                        for match_data in matches_list:
-                            match_id = match_data.get('match_id')
-                            if not match_id:
-                                continue
-                            
-                            existing = Match.query.filter_by(match_id=match_id).first()
-                            if existing:
-                                existing.match_format = match_data.get('match_format', existing.match_format)
-                                existing.venue = match_data.get('venue', existing.venue)
-                                existing.match_date = match_data.get('match_date', existing.match_date)
-                                existing.team1_name = match_data.get('team1', existing.team1_name)
-                                existing.team2_name = match_data.get('team2', existing.team2_name)
-                                if match_data.get('team1_score'):
-                                    existing.team1_score = match_data.get('team1_score')
-                                if match_data.get('team2_score'):
-                                    existing.team2_score = match_data.get('team2_score')
-                                existing.result = match_data.get('result', existing.result)
-                                # Update team flags
-                                if match_data.get('team1_flag'):
-                                    existing.team1_flag = match_data.get('team1_flag')
-                                if match_data.get('team2_flag'):
-                                    existing.team2_flag = match_data.get('team2_flag')
-                                # Update state - convert Preview to Upcoming
-                                if match_data.get('state'):
-                                    state_val = match_data.get('state')
-                                    if state_val == 'Preview':
-                                        state_val = 'Upcoming'
-                                    existing.state = state_val
-                                existing.series_id = series.id
-                                existing.updated_at = datetime.utcnow()
-                            else:
-                                # Convert state for new matches
-                                new_state = match_data.get('state', '')
-                                if new_state == 'Preview':
-                                    new_state = 'Upcoming'
-                                
-                                match = Match(
-                                    match_id=match_id,
-                                    match_format=match_data.get('match_format', ''),
-                                    venue=match_data.get('venue', ''),
-                                    match_date=match_data.get('match_date', ''),
-                                    team1_name=match_data.get('team1', ''),
-                                    team2_name=match_data.get('team2', ''),
-                                    team1_score=match_data.get('team1_score', ''),
-                                    team2_score=match_data.get('team2_score', ''),
-                                    team1_flag=match_data.get('team1_flag', ''),
-                                    team2_flag=match_data.get('team2_flag', ''),
-                                    result=match_data.get('result', ''),
-                                    state=new_state,
-                                    series_id=series.id
-                                )
-                                db.session.add(match)
-                            total_matches += 1
+                        inserted, updated = ingest_matches(db, Match, matches_list, series.id)
+                        # Commit per series so match rows are not held locked across the next fetch
+                        db.session.commit()
+                        total_matches += inserted + updated
                 except Exception as e:
                     print(f"[SCHEDULER] Error scraping matches for {series.name}: {e}")
+                    db.session.rollback()
                     continue
             
             db.session.commit()
@@ -765,6 +1186,8 @@ def run_category_matches_scrape(app, db, SeriesCategory, Series, Match, ScrapeLo
             db.session.add(log)
             db.session.commit()
             
+            refresh_sitemaps(['matches'])
+            
             print(f"[SCHEDULER] Auto {category_slug} matches scrape completed: {total_matches} matches")
             
         except Exception as e:
@@ -989,6 +1412,8 @@ def run_auto_post_job(app, db, Match, Post, PostCategory, AutoPostSetting, AutoP
             setting.posts_created_last_run = posts_created
             
             db.session.commit()
+            refresh_sitemaps(['posts'])
+            
             print(f"[SCHEDULER] Auto Post: {posts_created} posts created for {target_date}")
             return posts_created
             
@@ -1,14 +1,25 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 import time
 import json
+import os
+import gzip
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from page_state import PageState, UNSTARTED_STATES, match_header, series_schedule, series_match_rows
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-BASE_URL = "https://www.cricbuzz.com"
+# Public Cricbuzz origin; stored and displayed links always use it
+CRICBUZZ_URL = "https://www.cricbuzz.com"
+# Where requests for CRICBUZZ_URL pages are actually sent. Point it at a
+# stand-in server (cricbuzz_standin.py) to run scrapes offline.
+BASE_URL = os.environ.get('CRICBUZZ_BASE_URL', CRICBUZZ_URL).rstrip('/')
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -56,17 +67,312 @@ SERIES_CATEGORIES = {
 }
 
 
-def fetch_page(url, retries=3):
-    """Fetch a page with retries"""
-    for attempt in range(retries):
+# ============== HTML PARSING ==============
+# Pages are parsed with lxml when it is installed (several times faster than
+# html.parser on Cricbuzz's large pages). Scrapers that only read a known
+# part of a page pass a SoupStrainer so the rest is never built into a tree.
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+HTML_PARSER = os.environ.get('HTML_PARSER', HTML_PARSER)
+
+# The live/recent match list container: div.flex.flex-col.gap-3
+MATCH_CONTAINER_ONLY = SoupStrainer('div', class_=lambda c: bool(c) and {'flex', 'flex-col', 'gap-3'} <= set(c.split()))
+LINKS_ONLY = SoupStrainer('a')
+TITLE_AND_LINKS_ONLY = SoupStrainer(['title', 'a'])
+BODY_ONLY = SoupStrainer('body')
+
+
+def parse_html(html, parse_only=None):
+    """BeautifulSoup tree for html, limited to the elements parse_only matches"""
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+
+# ============== HTTP CLIENT ==============
+# Every upstream request goes through one shared, pooled session so
+# connections to Cricbuzz are kept alive and reused across scrapes.
+
+HTTP_CONNECT_TIMEOUT = float(os.environ.get('HTTP_CONNECT_TIMEOUT', 5))
+HTTP_READ_TIMEOUT = float(os.environ.get('HTTP_READ_TIMEOUT', 15))
+HTTP_RETRIES = int(os.environ.get('HTTP_RETRIES', 3))
+
+# Connection pool size per host; anything else uses the default adapter
+HOST_POOL_SIZES = {
+    BASE_URL: int(os.environ.get('CRICBUZZ_POOL_SIZE', 16)),
+    'https://static.cricbuzz.com': 8,
+}
+DEFAULT_POOL_SIZE = 4
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode br responses)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _build_http_session():
+    """Create the shared session with per-host pools and retry policy"""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=HTTP_RETRIES,
+        connect=HTTP_RETRIES,
+        read=HTTP_RETRIES,
+        status=HTTP_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+    default_adapter = HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE, max_retries=retry)
+    session.mount('https://', default_adapter)
+    session.mount('http://', default_adapter)
+    for prefix, size in HOST_POOL_SIZES.items():
+        session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=retry))
+    return session
+
+
+def get_http_session():
+    """Return the process-wide HTTP session, creating it on first use"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = _build_http_session()
+    return _http_session
+
+
+def upstream_url(url):
+    """url with the public Cricbuzz origin swapped for BASE_URL"""
+    if BASE_URL != CRICBUZZ_URL and url.startswith(CRICBUZZ_URL):
+        return BASE_URL + url[len(CRICBUZZ_URL):]
+    return url
+
+
+def http_get(url, headers=None, timeout=None, **kwargs):
+    """GET through the shared session with the unified timeout/retry policy"""
+    return get_http_session().get(
+        upstream_url(url),
+        headers=headers,
+        timeout=timeout or (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+        **kwargs
+    )
+
+
+# ============== CONCURRENT SCRAPING ==============
+# Bulk scrapes fan page fetches (and their parsing) out over a thread pool.
+# All pools share one politeness limiter so Cricbuzz sees at most
+# SCRAPE_RATE_PER_SEC requests per second from this process.
+
+SCRAPE_MAX_WORKERS = int(os.environ.get('SCRAPE_MAX_WORKERS', 8))
+SCRAPE_RATE_PER_SEC = float(os.environ.get('SCRAPE_RATE_PER_SEC', 4))
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least 1/rate seconds apart"""
+
+    def __init__(self, rate_per_sec):
+        self.interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+politeness_limiter = RateLimiter(SCRAPE_RATE_PER_SEC)
+
+
+def scrape_concurrently(items, func, max_workers=None):
+    """
+    Run func(item) for every item on a bounded thread pool.
+    Yields (item, result, error) in completion order so the caller can
+    write results to the DB from its own thread as they arrive.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    def run(item):
+        politeness_limiter.wait()
+        return func(item)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or SCRAPE_MAX_WORKERS)
+    try:
+        futures = {executor.submit(run, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                logger.error(f"Concurrent scrape failed for {item}: {e}")
+                yield item, None, e
+    finally:
+        # A caller that stops early (error, cancelled job) must not wait for the queued fetches
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ============== CONDITIONAL GET CACHE ==============
+# Bodies and validators (ETag / Last-Modified) are stored gzipped on disk so
+# repeat fetches can send If-None-Match / If-Modified-Since and reuse the
+# stored body when Cricbuzz answers 304 Not Modified.
+
+HTTP_CACHE_DIR = os.environ.get('HTTP_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.http_cache'))
+HTTP_CACHE_ENABLED = os.environ.get('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+
+http_cache_stats = {'requests': 0, 'not_modified': 0, 'bytes_downloaded': 0, 'bytes_saved': 0}
+_http_cache_stats_lock = threading.Lock()
+
+
+def _http_cache_paths(url):
+    """Return (meta_path, body_path) for a URL"""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    subdir = os.path.join(HTTP_CACHE_DIR, key[:2])
+    return os.path.join(subdir, key + '.json'), os.path.join(subdir, key + '.html.gz')
+
+
+def _load_cached_response(url):
+    """Load stored validators for a URL, or None"""
+    meta_path, body_path = _http_cache_paths(url)
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        if os.path.exists(body_path):
+            return meta
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _read_cached_body(url):
+    """Read the stored body for a URL"""
+    _, body_path = _http_cache_paths(url)
+    with gzip.open(body_path, 'rt', encoding='utf-8') as f:
+        return f.read()
+
+
+def _store_cached_response(url, response):
+    """Persist body and validators when the response carries any"""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    meta_path, body_path = _http_cache_paths(url)
+    try:
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        tmp_body = body_path + '.tmp'
+        with gzip.open(tmp_body, 'wt', encoding='utf-8') as f:
+            f.write(response.text)
+        os.replace(tmp_body, body_path)
+        tmp_meta = meta_path + '.tmp'
+        with open(tmp_meta, 'w') as f:
+            json.dump({
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'size': len(response.content),
+                'stored_at': time.time()
+            }, f)
+        os.replace(tmp_meta, meta_path)
+    except OSError as e:
+        logger.warning(f"Could not write HTTP cache for {url}: {e}")
+
+
+def _record_http_cache_stats(not_modified, size):
+    """Count one response towards the conditional GET stats"""
+    with _http_cache_stats_lock:
+        http_cache_stats['requests'] += 1
+        if not_modified:
+            http_cache_stats['not_modified'] += 1
+            http_cache_stats['bytes_saved'] += size
+        else:
+            http_cache_stats['bytes_downloaded'] += size
+
+
+def get_http_cache_stats():
+    """Snapshot of the process-wide conditional GET counters"""
+    with _http_cache_stats_lock:
+        return dict(http_cache_stats)
+
+
+def http_cache_stats_since(snapshot):
+    """Counters accumulated since an earlier get_http_cache_stats() snapshot"""
+    current = get_http_cache_stats()
+    return {key: current[key] - snapshot.get(key, 0) for key in current}
+
+
+def conditional_get(url, timeout=None):
+    """
+    Fetch url with If-None-Match / If-Modified-Since from the disk cache.
+    Returns (text, not_modified). Raises requests.HTTPError on other statuses.
+    """
+    url = upstream_url(url)
+    cached = _load_cached_response(url) if HTTP_CACHE_ENABLED else None
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = http_get(url, headers=headers or None, timeout=timeout)
+
+    if response.status_code == 304 and cached:
         try:
-            response = requests.get(url, headers=HEADERS, timeout=10)
-            if response.status_code == 200:
-                return response.text
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
-            if attempt < retries - 1:
-                time.sleep(1)
+            text = _read_cached_body(url)
+            _record_http_cache_stats(True, cached.get('size', 0))
+            return text, True
+        except OSError:
+            # Cached body vanished; fetch again without validators
+            response = http_get(url, timeout=timeout)
+
+    response.raise_for_status()
+    _record_http_cache_stats(False, len(response.content))
+    if HTTP_CACHE_ENABLED:
+        _store_cached_response(url, response)
+    return response.text, False
+
+
+def unchanged_since(url, saved_at):
+    """
+    Whether a 304 for url may skip parsing because the DB already holds the
+    cached body: saved_at is True, or the UTC time the page's rows were last
+    ingested and the body was cached no later. Falsy saved_at never skips.
+    """
+    if not saved_at:
+        return False
+    if saved_at is True:
+        return True
+    cached = _load_cached_response(upstream_url(url))
+    return bool(cached) and datetime.utcfromtimestamp(cached.get('stored_at', 0)) <= saved_at
+
+
+def fetch_page(url):
+    """Fetch a page; retries are handled by the session's retry policy"""
+    try:
+        text, _ = conditional_get(url)
+        return text
+    except Exception as e:
+        logger.error(f"Error fetching {url}: {e}")
     return None
 
 
@@ -82,8 +388,7 @@ def scrape_live_scores():
     if not html:
         return {'success': False, 'matches': [], 'message': 'Failed to fetch page'}
     
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html, MATCH_CONTAINER_ONLY)
     
     # Find the FIRST main container with match links
     main_container = None
@@ -287,8 +592,7 @@ def scrape_recent_matches():
     if not html:
         return {'success': False, 'matches': [], 'message': 'Failed to fetch page'}
     
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html, MATCH_CONTAINER_ONLY)
     
     # Find the main container with match links
     main_container = None
@@ -528,6 +832,171 @@ def scrape_recent_matches():
     return {'success': True, 'matches': matches, 'count': len(matches), 'message': f'Found {len(matches)} recent matches'}
 
 
+# ============== SHARED RESULT CACHE ==============
+# Page handlers read live/recent matches through these wrappers so that a
+# burst of page views results in a single upstream fetch per TTL window.
+
+LIVE_SCORES_CACHE_TTL = int(os.environ.get('LIVE_SCORES_CACHE_TTL', 30))
+RECENT_MATCHES_CACHE_TTL = int(os.environ.get('RECENT_MATCHES_CACHE_TTL', 120))
+# Failed scrapes are kept only briefly so a recovered upstream is picked up quickly
+FAILED_RESULT_CACHE_TTL = 5
+# Least recently read entries beyond this are evicted (one per scorecard viewed)
+RESULT_CACHE_MAX_ENTRIES = int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', 1000))
+
+_result_cache = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _refresh_cached_result(key, func):
+    """Run func and store its result; only one caller per key gets here at a time"""
+    entry = _result_cache[key]
+    try:
+        result = func()
+    except Exception as e:
+        logger.error(f"Cache refresh for {key} failed: {e}")
+        result = {'success': False, 'matches': [], 'message': str(e)}
+
+    with _result_cache_lock:
+        # Keep serving the last good result if the refresh failed
+        if result.get('success') or entry['value'] is None:
+            entry['value'] = result
+            entry['ttl'] = entry['base_ttl'] if result.get('success') else FAILED_RESULT_CACHE_TTL
+            entry['fetched_at'] = time.time()
+        else:
+            entry['ttl'] = FAILED_RESULT_CACHE_TTL
+            entry['fetched_at'] = time.time()
+        entry['refreshing'] = False
+        entry['event'].set()
+    return entry['value']
+
+
+def _evict_cached_results():
+    """Make room for one more entry by dropping the least recently read; call with the lock held"""
+    excess = len(_result_cache) + 1 - RESULT_CACHE_MAX_ENTRIES
+    for key in list(_result_cache):
+        if excess <= 0:
+            break
+        # An entry being fetched still has callers waiting on it
+        if not _result_cache[key]['refreshing']:
+            del _result_cache[key]
+            excess -= 1
+
+
+def get_cached_result(key, func, ttl):
+    """
+    Return func() through a process-wide TTL cache.
+    - Fresh entry: returned immediately.
+    - Stale entry: returned immediately while one background thread refreshes it.
+    - No entry: the first caller fetches, concurrent callers wait for that fetch.
+    """
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            entry = {'value': None, 'fetched_at': 0, 'ttl': ttl, 'base_ttl': ttl,
+                     'refreshing': False, 'event': threading.Event()}
+            _evict_cached_results()
+            _result_cache[key] = entry
+        _result_cache.move_to_end(key)
+        entry['base_ttl'] = ttl
+        # A shorter ttl applies at once, e.g. an upcoming match's scorecard once it goes live
+        if ttl < entry['ttl']:
+            entry['ttl'] = ttl
+
+        age = time.time() - entry['fetched_at']
+        if entry['value'] is not None and age < entry['ttl']:
+            return entry['value']
+
+        start_refresh = not entry['refreshing']
+        if start_refresh:
+            entry['refreshing'] = True
+            entry['event'] = threading.Event()
+        event = entry['event']
+        stale_value = entry['value']
+
+    if stale_value is not None:
+        # Stale-while-revalidate: never block a page render on upstream
+        if start_refresh:
+            threading.Thread(target=_refresh_cached_result, args=(key, func), daemon=True).start()
+        return stale_value
+
+    if start_refresh:
+        return _refresh_cached_result(key, func)
+
+    # Single-flight: wait for the in-progress fetch instead of starting another
+    event.wait(timeout=30)
+    return entry['value'] or {'success': False, 'matches': [], 'message': 'Timed out waiting for scrape'}
+
+
+def invalidate_cached_result(key=None):
+    """Drop one cached result (or all of them) so the next read refetches"""
+    with _result_cache_lock:
+        if key is None:
+            for entry in _result_cache.values():
+                entry['fetched_at'] = 0
+        elif key in _result_cache:
+            _result_cache[key]['fetched_at'] = 0
+
+
+def get_live_scores_cached():
+    """Cached scrape_live_scores() for page handlers"""
+    return get_cached_result('live_scores', scrape_live_scores, LIVE_SCORES_CACHE_TTL)
+
+
+def get_recent_matches_cached():
+    """Cached scrape_recent_matches() for page handlers"""
+    return get_cached_result('recent_matches', scrape_recent_matches, RECENT_MATCHES_CACHE_TTL)
+
+
+# Scorecard TTLs follow Match.state. Completed scorecards only stay here until
+# the app saves them to Match.innings_data, after which they are read from the DB.
+SCORECARD_LIVE_TTL = int(os.environ.get('SCORECARD_LIVE_TTL', 15))
+SCORECARD_UPCOMING_TTL = int(os.environ.get('SCORECARD_UPCOMING_TTL', 3 * 3600))
+SCORECARD_COMPLETE_TTL = int(os.environ.get('SCORECARD_COMPLETE_TTL', 24 * 3600))
+SCORECARD_UPCOMING_STATES = ('Upcoming', 'upcoming', 'UPCOMING', 'Preview')
+SCORECARD_COMPLETE_STATES = ('Complete', 'complete', 'COMPLETE', 'Result', 'Abandon')
+
+
+def scorecard_cache_ttl(state):
+    """Seconds a scorecard stays fresh for a match in this state; unknown states count as live"""
+    if state in SCORECARD_COMPLETE_STATES:
+        return SCORECARD_COMPLETE_TTL
+    if state in SCORECARD_UPCOMING_STATES:
+        return SCORECARD_UPCOMING_TTL
+    return SCORECARD_LIVE_TTL
+
+
+def get_scorecard_cached(match_id, state=None):
+    """
+    Cached scrape_scorecard(match_id) for page handlers, fresh for scorecard_cache_ttl(state).
+    The cached result has no 'timing'; it is only added to the copy returned to
+    the caller whose request ran the scrape.
+    """
+    if not str(match_id).isdigit():
+        return {'success': False, 'message': 'Invalid match id'}
+    caller = threading.get_ident()
+    scraped = {}
+
+    def scrape():
+        result = scrape_scorecard(match_id)
+        timing = result.pop('timing', None)
+        if threading.get_ident() == caller:
+            scraped['timing'] = timing
+        return result
+
+    scorecard = get_cached_result(f'scorecard:{match_id}', scrape, scorecard_cache_ttl(state))
+    if scraped.get('timing'):
+        return {**scorecard, 'timing': scraped['timing']}
+    return scorecard
+
+
+def drop_cached_result(key):
+    """Forget a cached result entirely, e.g. once it has been saved to the DB"""
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is not None and not entry['refreshing']:
+            del _result_cache[key]
+
+
 def scrape_series_from_live_page():
     """
     Scrape unique series from Cricbuzz live-scores page.
@@ -541,8 +1010,7 @@ def scrape_series_from_live_page():
     if not html:
         return {'success': False, 'series': [], 'message': 'Failed to fetch page'}
     
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html, MATCH_CONTAINER_ONLY)
     
     # Find the main match container (flex flex-col gap-3 with match links)
     main_container = None
@@ -552,8 +1020,8 @@ def scrape_series_from_live_page():
             main_container = container
             break
     
-    # If no container found, use full soup
-    search_scope = main_container if main_container else soup
+    # If no container found, use the full page
+    search_scope = main_container if main_container else parse_html(html)
     
     # Build status map from CSS classes (text-cbLive, text-cbComplete)
     status_map = {}
@@ -764,7 +1232,7 @@ def scrape_series_from_live_page():
                 'series_id': series_id,
                 'series_name': series_name,
                 'series_slug': series_slug,
-                'series_url': BASE_URL + href,
+                'series_url': CRICBUZZ_URL + href,
                 'matches': matches,
                 'match_ids': [m['match_id'] for m in matches],
                 'match_count': len(matches)
@@ -787,7 +1255,7 @@ def scrape_match_squads(match_id):
     if not html:
         return {'success': False, 'match_id': match_id, 'message': 'Failed to fetch squads page'}
     
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html, TITLE_AND_LINKS_ONLY)
     
     result = {
         'match_id': match_id,
@@ -854,21 +1322,73 @@ def scrape_match_squads(match_id):
     return {'success': True, **result}
 
 
+# By default the live-scores page is only fetched when the scorecard page does
+# not carry the status or scores. With this on it is fetched alongside the
+# scorecard page, trading an extra upstream request per scrape for latency
+# when it is needed; the prefetch is cancelled if it has not started by then.
+SCORECARD_PREFETCH_LIVE_PAGE = os.environ.get('SCORECARD_PREFETCH_LIVE_PAGE', 'false').lower() == 'true'
+# matchHeader states mapped to the match_status the live-scores page parse reports
+HEADER_MATCH_STATUS = {
+    'In Progress': 'Live',
+    'Drinks': 'Live',
+    'Innings Break': 'Break',
+    'Stumps': 'Stumps',
+    'Lunch': 'Lunch',
+    'Tea': 'Tea',
+    'Abandon': 'No Result'
+}
+
+_scorecard_fetch_pool = None
+_scorecard_fetch_pool_lock = threading.Lock()
+
+
+def submit_scorecard_fetch(url):
+    """fetch_page(url) on a small shared pool; returns a Future"""
+    global _scorecard_fetch_pool
+    if _scorecard_fetch_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        with _scorecard_fetch_pool_lock:
+            if _scorecard_fetch_pool is None:
+                _scorecard_fetch_pool = ThreadPoolExecutor(max_workers=SCRAPE_MAX_WORKERS, thread_name_prefix='scorecard-fetch')
+    return _scorecard_fetch_pool.submit(fetch_page, url)
+
+
+def status_from_header(header, has_innings):
+    """(match_status, result) from the scorecard page's matchHeader, or (None, None) if it does not say"""
+    state = header.get('state')
+    status = header.get('status', '')
+    if state == 'Complete':
+        if re.search(r'won by|match drawn|match tied', status, re.IGNORECASE):
+            return status, status
+        return ('No Result' if 'no result' in status.lower() else 'Completed'), None
+    if state in UNSTARTED_STATES or state == 'Toss':
+        return ('Upcoming' if not has_innings else None), None
+    return HEADER_MATCH_STATUS.get(state), None
+
+
 def scrape_scorecard(match_id):
     """
     Scrape scorecard/match info for a match.
     Returns basic match info available in HTML.
+    The live-scores page is only parsed when the scorecard page lacks the
+    status or scores; result['timing'] records where the time went.
     """
+    started = time.perf_counter()
     url = f"{BASE_URL}/live-cricket-scorecard/{match_id}"
+    live_url = f"{BASE_URL}/live-cricket-scores/{match_id}"
+    live_future = submit_scorecard_fetch(live_url) if SCORECARD_PREFETCH_LIVE_PAGE else None
     html = fetch_page(url)
+    fetched = time.perf_counter()
     
     if not html:
+        if live_future:
+            live_future.cancel()
         return {'success': False, 'match_id': match_id, 'message': 'Failed to fetch page'}
     
-    from bs4 import BeautifulSoup
     import json
     
-    soup = BeautifulSoup(html, 'html.parser')
+    # Reads the title, JSON-LD and innings blocks from all over the page, so it needs the full tree
+    soup = parse_html(html)
     
     result = {
         'match_id': match_id,
@@ -1209,11 +1729,31 @@ def scrape_scorecard(match_id):
                         if not result['team2']:
                             result['team2'] = team_name
     
+    # The embedded matchHeader usually has the status, so the live-scores page is often not needed
+    result['match_status'], header_result = status_from_header(match_header(PageState(html), match_id), bool(result['innings']))
+    if header_result:
+        result['result'] = header_result
+    parsed = time.perf_counter()
+    
+    needs_live_page = (
+        not result['match_status']
+        or (result['innings'] and not (result['team1_score'] or result['team2_score']))
+        or (result['match_status'] == 'Upcoming' and not result['match_time'])
+    )
+    live_html = None
+    if needs_live_page:
+        live_html = live_future.result() if live_future else fetch_page(live_url)
+        if live_html:
+            # The live-scores page has the final say on status when it is parsed
+            result['match_status'] = None
+            result['result'] = None
+    elif live_future:
+        live_future.cancel()
+    waited = time.perf_counter()
+    
     # Try to get match status and scores from live-cricket-scores page
-    live_url = f"{BASE_URL}/live-cricket-scores/{match_id}"
-    live_html = fetch_page(live_url)
     if live_html:
-        live_soup = BeautifulSoup(live_html, 'html.parser')
+        live_soup = parse_html(live_html)
         page_text = live_soup.get_text()
         
         # Extract scores - look for patterns like "NZ14-0(1)" or "IND180/5(18.2)"
@@ -1328,12 +1868,24 @@ def scrape_scorecard(match_id):
             elif not result['match_status']:
                 result['match_status'] = 'Upcoming'
     
-    logger.info(f"Scraped match {match_id}: {result['match_title']} - Status: {result['match_status']}")
+    finished = time.perf_counter()
+    result['timing'] = {
+        'fetch_ms': round((fetched - started) * 1000, 1),
+        'parse_ms': round((parsed - fetched) * 1000, 1),
+        'live_page': ('parsed' if live_html else 'failed') if needs_live_page else 'skipped',
+        'live_page_wait_ms': round((waited - parsed) * 1000, 1),
+        'live_page_parse_ms': round((finished - waited) * 1000, 1),
+        'total_ms': round((finished - started) * 1000, 1)
+    }
+    logger.info(f"Scraped match {match_id}: {result['match_title']} - Status: {result['match_status']} "
+                f"({result['timing']['total_ms']}ms, live page {result['timing']['live_page']})")
     return {'success': True, **result}
 
 
-def scrape_category(category_slug):
-    """Scrape teams from a category (international, domestic, league, women)."""
+def scrape_category(category_slug, skip_unchanged=False):
+    """Scrape teams from a category (international, domestic, league, women).
+    skip_unchanged is True or when the category's teams were last ingested (see
+    unchanged_since); a 304 then returns no teams and not_modified=True."""
     category_urls = {
         'international': 'https://www.cricbuzz.com/cricket-team',
         'domestic': 'https://www.cricbuzz.com/cricket-team/domestic',
@@ -1346,9 +1898,10 @@ def scrape_category(category_slug):
         return {'success': False, 'teams': [], 'message': f'Unknown category: {category_slug}'}
     
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html, not_modified = conditional_get(url)
+        if not_modified and unchanged_since(url, skip_unchanged):
+            return {'success': True, 'teams': [], 'not_modified': True, 'message': 'Category page unchanged'}
+        soup = parse_html(html, LINKS_ONLY)
         
         teams = []
         
@@ -1403,8 +1956,9 @@ def scrape_category(category_slug):
         return {'success': False, 'teams': [], 'message': str(e)}
 
 
-def scrape_players_from_team(team_url):
-    """Scrape players from a team page."""
+def scrape_players_from_team(team_url, skip_unchanged=False):
+    """Scrape players from a team page. skip_unchanged is True or when the
+    team's roster was last ingested (see unchanged_since); a 304 then returns []."""
     try:
         if not team_url:
             return []
@@ -1414,9 +1968,11 @@ def scrape_players_from_team(team_url):
         
         players_url = team_url.rstrip('/') + '/players'
         
-        response = requests.get(players_url, headers=HEADERS, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html, not_modified = conditional_get(players_url)
+        if not_modified and unchanged_since(players_url, skip_unchanged):
+            return []
+        # Role labels sit in divs after each link, so the whole page is needed
+        soup = parse_html(html)
         
         players = []
         
@@ -1472,6 +2028,12 @@ def scrape_players_from_team(team_url):
         return []
 
 
+def series_matches_url(series_id, name):
+    """Cricbuzz matches page for a series"""
+    slug = name.lower().replace(' ', '-').replace(',', '').replace("'", '').replace('/', '-')
+    return f"{CRICBUZZ_URL}/cricket-series/{series_id}/{slug}/matches"
+
+
 def scrape_series_from_category(category_url):
     """Scrape series from a category URL like /cricket-schedule/series/international."""
     try:
@@ -1481,58 +2043,16 @@ def scrape_series_from_category(category_url):
         if not category_url.startswith('http'):
             category_url = 'https://www.cricbuzz.com' + category_url
         
-        response = requests.get(category_url, headers=HEADERS, timeout=30)
+        response = http_get(category_url, timeout=(HTTP_CONNECT_TIMEOUT, 30))
         if response.status_code != 200:
             return {'success': False, 'series': []}
         
-        html = response.text.replace('\\"', '"')
-        series_data = []
-        seen = set()
-        
-        schedule_match = re.search(r'"seriesScheduleData"\s*:\s*(\[.*?\])\s*,\s*"', html, re.DOTALL)
-        
-        if schedule_match:
-            try:
-                import json
-                schedule_json = schedule_match.group(1)
-                schedule_json = schedule_json.replace('\\"', '"')
-                schedule = json.loads(schedule_json)
-                
-                for month_group in schedule:
-                    month_year = month_group.get('date', '')
-                    for series in month_group.get('series', []):
-                        sid = str(series.get('id', ''))
-                        name = series.get('name', '')
-                        
-                        if sid and sid not in seen:
-                            seen.add(sid)
-                            slug = name.lower().replace(' ', '-').replace(',', '').replace("'", '').replace('/', '-')
-                            series_url = f"https://www.cricbuzz.com/cricket-series/{sid}/{slug}/matches"
-                            series_data.append({
-                                'id': sid,
-                                'name': name,
-                                'url': series_url,
-                                'date_range': month_year.title() if month_year else ''
-                            })
-            except Exception as e:
-                logger.error(f"Error parsing series schedule: {e}")
-        
-        if not series_data:
-            match_positions = [(m.start(), m.group(1)) for m in re.finditer(r'"matchInfo"\s*:\s*\{[^}]*"seriesId"\s*:\s*(\d+)', html)]
-            
-            for pos, sid in match_positions:
-                if sid in seen:
-                    continue
-                
-                context = html[pos:pos+2000]
-                series_name_match = re.search(r'"seriesName"\s*:\s*"([^"]+)"', context)
-                
-                if series_name_match:
-                    name = series_name_match.group(1)
-                    seen.add(sid)
-                    slug = name.lower().replace(' ', '-').replace(',', '').replace("'", '')
-                    series_url = f"https://www.cricbuzz.com/cricket-series/{sid}/{slug}/matches"
-                    series_data.append({'id': sid, 'name': name, 'url': series_url, 'date_range': ''})
+        series_data = [{
+            'id': series['id'],
+            'name': series['name'],
+            'url': series_matches_url(series['id'], series['name']),
+            'date_range': series['month_year']
+        } for series in series_schedule(PageState(response.text))]
         
         logger.info(f"Scraped {len(series_data)} series from {category_url}")
         return {'success': True, 'series': series_data}
@@ -1554,100 +2074,16 @@ def scrape_matches_from_series(series_url):
         if '/matches' not in series_url:
             series_url = series_url.rstrip('/') + '/matches'
         
-        response = requests.get(series_url, headers=HEADERS, timeout=30)
+        response = http_get(series_url, timeout=(HTTP_CONNECT_TIMEOUT, 30))
         if response.status_code != 200:
             return []
         
-        html = response.text.replace('\\"', '"')
-        matches_data = []
-        seen_ids = set()
-        
         series_id_from_url = None
         url_match = re.search(r'/cricket-series/(\d+)/', series_url)
         if url_match:
             series_id_from_url = url_match.group(1)
         
-        match_positions = [(m.start(), m.group(1)) for m in re.finditer(r'"matchInfo"\s*:\s*\{[^}]*"matchId"\s*:\s*(\d+)', html)]
-        
-        for pos, mid in match_positions:
-            if mid in seen_ids:
-                continue
-            seen_ids.add(mid)
-            
-            next_match = html.find('"matchInfo"', pos + 50)
-            if next_match == -1 or next_match > pos + 2000:
-                context_end = pos + 1500
-            else:
-                context_end = next_match
-            context = html[pos:context_end]
-            
-            match_sid = re.search(r'"seriesId"\s*:\s*(\d+)', context)
-            if series_id_from_url and match_sid:
-                if match_sid.group(1) != series_id_from_url:
-                    continue
-            
-            series_name = re.search(r'"seriesName"\s*:\s*"([^"]*)"', context)
-            match_desc = re.search(r'"matchDesc"\s*:\s*"([^"]*)"', context)
-            match_format = re.search(r'"matchFormat"\s*:\s*"([^"]*)"', context)
-            status = re.search(r'"status"\s*:\s*"([^"]*)"', context)
-            state = re.search(r'"state"\s*:\s*"([^"]*)"', context)
-            start_date = re.search(r'"startDate"\s*:\s*"?(\d+)"?', context)
-            
-            team1_name = re.search(r'"team1"\s*:\s*\{[^}]*"teamName"\s*:\s*"([^"]*)"', context)
-            team2_name = re.search(r'"team2"\s*:\s*\{[^}]*"teamName"\s*:\s*"([^"]*)"', context)
-            team1_id = re.search(r'"team1"\s*:\s*\{[^}]*"teamId"\s*:\s*(\d+)', context)
-            team2_id = re.search(r'"team2"\s*:\s*\{[^}]*"teamId"\s*:\s*(\d+)', context)
-            
-            team1_score_match = re.search(r'"team1Score"\s*:\s*\{[^}]*"inngs1"\s*:\s*\{[^}]*"runs"\s*:\s*(\d+)[^}]*"wickets"\s*:\s*(\d+)[^}]*"overs"\s*:\s*([\d.]+)', context)
-            team2_score_match = re.search(r'"team2Score"\s*:\s*\{[^}]*"inngs1"\s*:\s*\{[^}]*"runs"\s*:\s*(\d+)[^}]*"wickets"\s*:\s*(\d+)[^}]*"overs"\s*:\s*([\d.]+)', context)
-            
-            team1_score = ''
-            team2_score = ''
-            if team1_score_match:
-                runs, wickets, overs = team1_score_match.groups()
-                team1_score = f"{runs}/{wickets} ({overs})"
-            if team2_score_match:
-                runs, wickets, overs = team2_score_match.groups()
-                team2_score = f"{runs}/{wickets} ({overs})"
-            
-            venue_ground = re.search(r'"venueInfo"\s*:\s*\{[^}]*"ground"\s*:\s*"([^"]*)"', context)
-            venue_city = re.search(r'"venueInfo"\s*:\s*\{[^}]*"city"\s*:\s*"([^"]*)"', context)
-            
-            match_date = ''
-            if start_date:
-                try:
-                    from datetime import datetime as dt
-                    ts = int(start_date.group(1)) / 1000
-                    match_date = dt.fromtimestamp(ts).strftime('%a, %d %b %Y')
-                except:
-                    pass
-            
-            venue = ''
-            if venue_ground and venue_city:
-                venue = f"{venue_ground.group(1)}, {venue_city.group(1)}"
-            elif venue_ground:
-                venue = venue_ground.group(1)
-            
-            team1_short = team1_name.group(1) if team1_name else ''
-            team2_short = team2_name.group(1) if team2_name else ''
-            
-            matches_data.append({
-                'match_id': mid,
-                'series_id': match_sid.group(1) if match_sid else series_id_from_url or '',
-                'team1_id': team1_id.group(1) if team1_id else '',
-                'team2_id': team2_id.group(1) if team2_id else '',
-                'match_format': match_desc.group(1) if match_desc else '',
-                'format_type': match_format.group(1) if match_format else '',
-                'series_name': series_name.group(1) if series_name else '',
-                'match_date': match_date,
-                'state': state.group(1) if state else '',
-                'team1': team1_short,
-                'team2': team2_short,
-                'team1_score': team1_score,
-                'team2_score': team2_score,
-                'venue': venue,
-                'result': status.group(1) if status else ''
-            })
+        matches_data = series_match_rows(PageState(response.text), series_id_from_url)
         
         logger.info(f"Scraped {len(matches_data)} matches from {series_url}")
         return matches_data
@@ -1657,8 +2093,9 @@ def scrape_matches_from_series(series_url):
         return []
 
 
-def scrape_player_profile(player_url):
-    """Scrape player profile details from Cricbuzz."""
+def scrape_player_profile(player_url, skip_unchanged=False):
+    """Scrape player profile details from Cricbuzz.
+    With skip_unchanged, a 304 returns {'not_modified': True} without parsing."""
     try:
         if not player_url:
             return None
@@ -1666,9 +2103,11 @@ def scrape_player_profile(player_url):
         if not player_url.startswith('http'):
             player_url = 'https://www.cricbuzz.com' + player_url
         
-        response = requests.get(player_url, headers=HEADERS, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html, not_modified = conditional_get(player_url)
+        if not_modified and skip_unchanged:
+            return {'not_modified': True}
+        # Everything read below is inside <body>
+        soup = parse_html(html, BODY_ONLY)
         
         profile = {
             'born': None,
@@ -0,0 +1,188 @@
+"""
+Record Cricbuzz pages once and replay them to the scraper without network:
+`python scraper_fixtures.py [fixture_dir] [--matches N]`.
+
+Recording runs the real scrapers (live scores, recent matches, scorecard,
+squads, series, team players, player profile) with a recording adapter on
+the shared HTTP session, so exactly the pages those functions fetch are
+saved. replaying() mounts an adapter that answers every request from the
+saved pages, which is what benchmark_scrapers.py uses.
+
+Each page is stored as <sha1 of url>.html.gz plus a .json with its URL, the
+same layout benchmark_parser.py reads.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+import scraper
+
+FIXTURE_DIR = os.environ.get('SCRAPER_FIXTURE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.scraper_fixtures'))
+
+
+def canonical_url(url):
+    """Fixtures are keyed by the public Cricbuzz URL even when BASE_URL points elsewhere"""
+    if url.startswith(scraper.BASE_URL):
+        return scraper.CRICBUZZ_URL + url[len(scraper.BASE_URL):]
+    return url
+
+
+def fixture_paths(fixture_dir, url):
+    """(meta_path, body_path) for a URL"""
+    key = hashlib.sha1(canonical_url(url).encode('utf-8')).hexdigest()
+    return os.path.join(fixture_dir, key + '.json'), os.path.join(fixture_dir, key + '.html.gz')
+
+
+def save_fixture(fixture_dir, url, response):
+    os.makedirs(fixture_dir, exist_ok=True)
+    meta_path, body_path = fixture_paths(fixture_dir, url)
+    with gzip.open(body_path, 'wb') as f:
+        f.write(response.content)
+    with open(meta_path, 'w') as f:
+        json.dump({
+            'url': canonical_url(url),
+            'status': response.status_code,
+            'content_type': response.headers.get('Content-Type', 'text/html; charset=utf-8'),
+            'size': len(response.content),
+            'recorded_at': time.time()
+        }, f)
+
+
+def load_fixture(fixture_dir, url):
+    """(meta, body bytes) for a recorded URL, or None"""
+    meta_path, body_path = fixture_paths(fixture_dir, url)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        with gzip.open(body_path, 'rb') as f:
+            return meta, f.read()
+    except (OSError, ValueError):
+        return None
+
+
+def recorded_urls(fixture_dir):
+    """URLs of every recorded page"""
+    urls = []
+    for name in sorted(os.listdir(fixture_dir)) if os.path.isdir(fixture_dir) else []:
+        if name.endswith('.json'):
+            try:
+                with open(os.path.join(fixture_dir, name)) as f:
+                    urls.append(json.load(f)['url'])
+            except (OSError, ValueError, KeyError):
+                continue
+    return urls
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Fetch normally and save every successful response"""
+
+    def __init__(self, fixture_dir, **kwargs):
+        self.fixture_dir = fixture_dir
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if response.status_code == 200:
+            save_fixture(self.fixture_dir, request.url, response)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answer requests from recorded pages; anything not recorded is a 404"""
+
+    def __init__(self, fixture_dir):
+        super().__init__()
+        self.fixture_dir = fixture_dir
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        self.requests += 1
+        fixture = load_fixture(self.fixture_dir, request.url)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if fixture:
+            meta, body = fixture
+            response.status_code = meta.get('status', 200)
+            response.headers['Content-Type'] = meta.get('content_type', 'text/html; charset=utf-8')
+            response._content = body
+        else:
+            response.status_code = 404
+            response._content = b''
+        response.encoding = 'utf-8'
+        return response
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def mounted(adapter):
+    """Route every scraper request through adapter; the disk cache and rate limit are off meanwhile"""
+    session = scraper.get_http_session()
+    saved_adapters = session.adapters.copy()
+    saved_cache = scraper.HTTP_CACHE_ENABLED
+    saved_interval = scraper.politeness_limiter.interval
+    for prefix in ['https://', 'http://'] + list(scraper.HOST_POOL_SIZES):
+        session.mount(prefix, adapter)
+    scraper.HTTP_CACHE_ENABLED = False
+    if isinstance(adapter, ReplayAdapter):
+        scraper.politeness_limiter.interval = 0
+    try:
+        yield adapter
+    finally:
+        session.adapters = saved_adapters
+        scraper.HTTP_CACHE_ENABLED = saved_cache
+        scraper.politeness_limiter.interval = saved_interval
+
+
+def recording(fixture_dir=FIXTURE_DIR):
+    return mounted(RecordingAdapter(fixture_dir, max_retries=scraper.HTTP_RETRIES))
+
+
+def replaying(fixture_dir=FIXTURE_DIR):
+    return mounted(ReplayAdapter(fixture_dir))
+
+
+def record_fixtures(fixture_dir=FIXTURE_DIR, match_count=3):
+    """Run each scraper once against the live site, saving the pages it fetches"""
+    with recording(fixture_dir):
+        live = scraper.scrape_live_scores()
+        scraper.scrape_recent_matches()
+        for match in live.get('matches', [])[:match_count]:
+            scraper.scrape_scorecard(match['match_id'])
+            scraper.scrape_match_squads(match['match_id'])
+
+        series = scraper.scrape_series_from_category(scraper.SERIES_CATEGORIES['international']['url'])
+        if series.get('series'):
+            scraper.scrape_matches_from_series(series['series'][0]['url'])
+
+        teams = scraper.scrape_category('international')
+        if teams.get('teams'):
+            players = scraper.scrape_players_from_team(teams['teams'][0]['team_url'])
+            if players:
+                scraper.scrape_player_profile(players[0]['player_url'])
+    return recorded_urls(fixture_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record Cricbuzz pages for offline scraper benchmarks')
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURE_DIR)
+    parser.add_argument('--matches', type=int, default=3, help='live matches to record scorecards and squads for')
+    args = parser.parse_args()
+
+    urls = record_fixtures(args.fixture_dir, args.matches)
+    print(f"{len(urls)} pages recorded in {args.fixture_dir}")
+    for url in urls:
+        print(f"  {url}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger(__name__)
+
+SITEMAP_BASE_URL = os.environ.get('SITEMAP_BASE_URL', 'https://cricbuzz-score.com')
+SITEMAP_CACHE_DIR = os.environ.get('SITEMAP_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.sitemap_cache'))
+SITEMAP_SHARD_SIZE = 50000
+SITEMAP_FETCH_SIZE = 2000
+
+# section -> (model name, url prefix, changefreq, priority, fall back to id when slug is empty)
+SITEMAP_SECTIONS = {
+    'main': ('PostCategory', '/category/', 'daily', '0.8', False),
+    'teams': ('Team', '/team/', 'weekly', '0.7', True),
+    'players': ('Player', '/player/', 'weekly', '0.6', True),
+    'series': ('Series', '/series/', 'daily', '0.8', True),
+    'matches': ('Match', '/cricket-match/', 'daily', '0.8', False),
+    'posts': ('Post', '/post/', 'daily', '0.7', False),
+    'pages': ('Page', '/page/', 'monthly', '0.5', False),
+}
+
+# Static pages listed at the top of a section's first shard, ahead of its rows
+SECTION_PAGES = {
+    'main': [
+        ('', 'hourly', '1.0'),
+        ('/live-scores', 'always', '1.0'),
+        ('/recent-matches', 'hourly', '0.9'),
+        ('/teams', 'weekly', '0.9'),
+        ('/series', 'daily', '0.9'),
+    ],
+    'matches': [
+        ('/recent-matches', 'hourly', '0.9'),
+    ],
+}
+
+sitemap_models = {}
+sitemap_lock = threading.Lock()
+
+def init_sitemaps(db, PostCategory, Team, Player, Series, Match, Post, Page):
+    """Bind the sitemap builder to the app's db and models"""
+    sitemap_models.update({
+        'db': db, 'PostCategory': PostCategory, 'Team': Team, 'Player': Player,
+        'Series': Series, 'Match': Match, 'Post': Post, 'Page': Page,
+    })
+
+def sitemap_filename(section, shard):
+    """Public file name: shard 1 keeps the original unnumbered URL"""
+    return f'sitemap-{section}.xml' if shard == 1 else f'sitemap-{section}-{shard}.xml'
+
+def sitemap_cache_path(name):
+    return os.path.join(SITEMAP_CACHE_DIR, name)
+
+def section_filters(section, Model):
+    if section == 'matches':
+        return [Model.slug.isnot(None)]
+    if section in ('posts', 'pages'):
+        return [Model.is_published == True]
+    return []
+
+def section_shard_stamps(section):
+    """One row per SITEMAP_SHARD_SIZE block of ids: (count, last updated_at, first id, last id)"""
+    db = sitemap_models['db']
+    Model = sitemap_models[SITEMAP_SECTIONS[section][0]]
+    row_number = db.func.row_number().over(order_by=Model.id)
+    numbered = db.session.query(
+        Model.id.label('id'),
+        Model.updated_at.label('updated_at'),
+        ((row_number - 1) // SITEMAP_SHARD_SIZE).label('shard')
+    ).filter(*section_filters(section, Model)).subquery()
+    rows = db.session.query(
+        db.func.count(numbered.c.id),
+        db.func.max(numbered.c.updated_at),
+        db.func.min(numbered.c.id),
+        db.func.max(numbered.c.id)
+    ).group_by(numbered.c.shard).order_by(numbered.c.shard).all()
+    return [[count, updated.isoformat() if updated else None, first_id, last_id] for count, updated, first_id, last_id in rows]
+
+def iter_shard_entries(section, shard, first_id, last_id):
+    """(loc, lastmod, changefreq, priority) for one shard, read in id order without loading ORM objects"""
+    db = sitemap_models['db']
+    model_name, prefix, changefreq, priority, id_fallback = SITEMAP_SECTIONS[section]
+    Model = sitemap_models[model_name]
+    if shard == 1:
+        for path, page_changefreq, page_priority in SECTION_PAGES.get(section, []):
+            yield f'{SITEMAP_BASE_URL}{path}', None, page_changefreq, page_priority
+    if first_id is None:
+        return
+    query = db.session.query(Model.id, Model.slug, Model.updated_at).filter(
+        *section_filters(section, Model)
+    ).filter(Model.id.between(first_id, last_id)).order_by(Model.id).yield_per(SITEMAP_FETCH_SIZE)
+    for row_id, slug, updated_at in query:
+        slug = slug or (str(row_id) if id_fallback else None)
+        if not slug:
+            continue
+        lastmod = updated_at.strftime('%Y-%m-%d') if updated_at else None
+        yield f'{SITEMAP_BASE_URL}{prefix}{slug}', lastmod, changefreq, priority
+
+def iter_urlset_xml(entries):
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for loc, lastmod, changefreq, priority in entries:
+        parts = [f'  <url>\n    <loc>{escape(loc)}</loc>\n']
+        if lastmod:
+            parts.append(f'    <lastmod>{lastmod}</lastmod>\n')
+        parts.append(f'    <changefreq>{changefreq}</changefreq>\n    <priority>{priority}</priority>\n  </url>\n')
+        yield ''.join(parts)
+    yield '</urlset>'
+
+def iter_index_xml(sitemaps):
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for name, lastmod in sitemaps:
+        yield f'  <sitemap>\n    <loc>{SITEMAP_BASE_URL}/{name}</loc>\n    <lastmod>{lastmod}</lastmod>\n  </sitemap>\n'
+    yield '</sitemapindex>'
+
+def write_gzip_file(name, chunks):
+    """Stream text chunks into a gzip file, replacing it atomically"""
+    os.makedirs(SITEMAP_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=SITEMAP_CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as gz:
+            for chunk in chunks:
+                gz.write(chunk.encode('utf-8'))
+        os.replace(tmp_path, sitemap_cache_path(name + '.gz'))
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def load_section_manifest(section):
+    try:
+        with open(sitemap_cache_path(f'sitemap-{section}.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_section_manifest(section, manifest):
+    os.makedirs(SITEMAP_CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=SITEMAP_CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, sitemap_cache_path(f'sitemap-{section}.json'))
+
+def refresh_section(section):
+    """Rewrite only the shards of one section whose stamp changed; returns True if anything was written"""
+    stamps = section_shard_stamps(section) or [[0, None, None, None]]
+    # Shard 1 also lists the section's static pages, so a change to them rewrites it
+    stamps[0] = stamps[0] + [[list(page) for page in SECTION_PAGES.get(section, [])]]
+    previous = load_section_manifest(section) or []
+    today = datetime.utcnow().strftime('%Y-%m-%d')
+    manifest = []
+    changed = len(previous) != len(stamps)
+
+    for position, stamp in enumerate(stamps, start=1):
+        name = sitemap_filename(section, position)
+        old = previous[position - 1] if position <= len(previous) else None
+        if old and old['stamp'] == stamp and os.path.exists(sitemap_cache_path(name + '.gz')):
+            manifest.append(old)
+            continue
+        write_gzip_file(name, iter_urlset_xml(iter_shard_entries(section, position, stamp[2], stamp[3])))
+        lastmod = stamp[1][:10] if stamp[1] else today
+        manifest.append({'name': name, 'stamp': stamp, 'lastmod': lastmod})
+        changed = True
+
+    # Drop shards left over from a section that shrank
+    for position in range(len(stamps) + 1, len(previous) + 1):
+        stale_path = sitemap_cache_path(sitemap_filename(section, position) + '.gz')
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+    if changed:
+        save_section_manifest(section, manifest)
+    return changed
+
+def write_sitemap_index():
+    sitemaps = []
+    for section in SITEMAP_SECTIONS:
+        if load_section_manifest(section) is None:
+            refresh_section(section)
+        for shard in load_section_manifest(section) or []:
+            sitemaps.append((shard['name'], shard['lastmod']))
+    write_gzip_file('sitemap.xml', iter_index_xml(sitemaps))
+
+def refresh_sitemaps(sections=None):
+    """
+    Bring cached sitemaps up to date after a scrape. Only shards whose row count,
+    id range or last updated_at changed are regenerated; the index is rewritten
+    when any shard was. Safe to call from scheduler jobs: errors are logged.
+    """
+    if not sitemap_models:
+        return
+    with sitemap_lock:
+        try:
+            changed = False
+            for section in sections or SITEMAP_SECTIONS:
+                changed = refresh_section(section) or changed
+            if changed or not os.path.exists(sitemap_cache_path('sitemap.xml.gz')):
+                write_sitemap_index()
+        except Exception as e:
+            logger.error(f"Sitemap refresh failed: {e}")
+
+def get_sitemap_file(name):
+    """
+    Path of the cached gzip file for a public sitemap name ('sitemap.xml',
+    'sitemap-players.xml', 'sitemap-players-2.xml'), building it on first
+    request. Returns None for unknown sections or shards.
+    """
+    if name == 'sitemap.xml':
+        section = None
+    else:
+        section = name[len('sitemap-'):-len('.xml')]
+        head, _, tail = section.rpartition('-')
+        if head and tail.isdigit():
+            section = head
+        if section not in SITEMAP_SECTIONS:
+            return None
+
+    path = sitemap_cache_path(name + '.gz')
+    if not os.path.exists(path):
+        refresh_sitemaps([section] if section else None)
+    return path if os.path.exists(path) else None
@@ -49,3 +49,46 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     });
 });
+
+// Throughput suffix for a scrape progress detail line, e.g. " (2.5/s, ~1m 20s left, 3 errors)"
+function formatProgressRate(prog) {
+    const parts = [];
+    if (prog.items_per_sec) parts.push(prog.items_per_sec + '/s');
+    if (prog.eta_seconds) {
+        const minutes = Math.floor(prog.eta_seconds / 60);
+        parts.push('~' + (minutes ? minutes + 'm ' : '') + (prog.eta_seconds % 60) + 's left');
+    }
+    if (prog.errors) parts.push(prog.errors + (prog.errors === 1 ? ' error' : ' errors'));
+    return parts.length ? ' (' + parts.join(', ') + ')' : '';
+}
+
+// Poll a queued scrape job until it finishes. Resolves with the job result
+// merged into {success, message} so callers can treat it like the old
+// synchronous API response.
+function waitForJob(jobId, onProgress) {
+    return new Promise(function(resolve, reject) {
+        function poll() {
+            fetch('/api/jobs/' + jobId)
+                .then(res => res.json())
+                .then(data => {
+                    if (!data.success) {
+                        reject(new Error(data.message || 'Job not found'));
+                        return;
+                    }
+                    const job = data.job;
+                    if (onProgress) onProgress(job);
+                    if (job.status === 'queued' || job.status === 'running') {
+                        setTimeout(poll, 2000);
+                        return;
+                    }
+                    resolve(Object.assign({}, job.result || {}, {
+                        success: job.status === 'complete',
+                        message: job.message || job.error || job.status,
+                        job: job
+                    }));
+                })
+                .catch(reject);
+        }
+        poll();
+    });
+}
@@ -0,0 +1,167 @@
+import os
+import threading
+import time
+
+# Team flag URLs mapping using FlagCDN
+TEAM_FLAGS = {
+    'india': 'https://flagcdn.com/48x36/in.png',
+    'new zealand': 'https://flagcdn.com/48x36/nz.png',
+    'australia': 'https://flagcdn.com/48x36/au.png',
+    'england': 'https://flagcdn.com/48x36/gb-eng.png',
+    'pakistan': 'https://flagcdn.com/48x36/pk.png',
+    'south africa': 'https://flagcdn.com/48x36/za.png',
+    'west indies': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/WestIndiesCricketFlagPre1999.svg/48px-WestIndiesCricketFlagPre1999.svg.png',
+    'sri lanka': 'https://flagcdn.com/48x36/lk.png',
+    'bangladesh': 'https://flagcdn.com/48x36/bd.png',
+    'afghanistan': 'https://flagcdn.com/48x36/af.png',
+    'zimbabwe': 'https://flagcdn.com/48x36/zw.png',
+    'ireland': 'https://flagcdn.com/48x36/ie.png',
+    'scotland': 'https://flagcdn.com/48x36/gb-sct.png',
+    'netherlands': 'https://flagcdn.com/48x36/nl.png',
+    'nepal': 'https://flagcdn.com/48x36/np.png',
+    'uae': 'https://flagcdn.com/48x36/ae.png',
+    'usa': 'https://flagcdn.com/48x36/us.png',
+    'oman': 'https://flagcdn.com/48x36/om.png',
+    'ind': 'https://flagcdn.com/48x36/in.png',
+    'nz': 'https://flagcdn.com/48x36/nz.png',
+    'aus': 'https://flagcdn.com/48x36/au.png',
+    'eng': 'https://flagcdn.com/48x36/gb-eng.png',
+    'pak': 'https://flagcdn.com/48x36/pk.png',
+    'sa': 'https://flagcdn.com/48x36/za.png',
+    'wi': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/18/WestIndiesCricketFlagPre1999.svg/48px-WestIndiesCricketFlagPre1999.svg.png',
+    'sl': 'https://flagcdn.com/48x36/lk.png',
+    'ban': 'https://flagcdn.com/48x36/bd.png',
+    'afg': 'https://flagcdn.com/48x36/af.png',
+    'zim': 'https://flagcdn.com/48x36/zw.png',
+    'ire': 'https://flagcdn.com/48x36/ie.png',
+    'italy': 'https://flagcdn.com/48x36/it.png',
+    'ita': 'https://flagcdn.com/48x36/it.png',
+}
+
+TEAM_ABBREVIATIONS = {
+    'in': 'india', 'ind-w': 'india', 'india women': 'india',
+    'au': 'australia', 'aus-w': 'australia', 'australia women': 'australia',
+    'en': 'england', 'eng-w': 'england', 'england women': 'england',
+    'pk': 'pakistan', 'pak-w': 'pakistan', 'pakistan women': 'pakistan',
+    'nz-w': 'new zealand', 'new zealand women': 'new zealand',
+    'sa-w': 'south africa', 'south africa women': 'south africa',
+    'wi-w': 'west indies', 'west indies women': 'west indies',
+    'sl-w': 'sri lanka', 'sri lanka women': 'sri lanka',
+    'ban-w': 'bangladesh', 'bangladesh women': 'bangladesh',
+    'afg-w': 'afghanistan', 'afghanistan women': 'afghanistan',
+}
+
+def get_team_flag(team_name):
+    """Flag URL from the built-in TEAM_FLAGS table ("" when unknown)"""
+    if not team_name:
+        return ''
+    team_lower = team_name.lower().strip()
+    # Direct match
+    if team_lower in TEAM_FLAGS:
+        return TEAM_FLAGS[team_lower]
+    # Partial match - check if any key is in the team name
+    for key in TEAM_FLAGS:
+        if key in team_lower or team_lower in key:
+            return TEAM_FLAGS[key]
+    # Try common abbreviations
+    if team_lower in TEAM_ABBREVIATIONS:
+        return TEAM_FLAGS.get(TEAM_ABBREVIATIONS[team_lower], '')
+    return ''
+
+
+TEAM_FLAG_INDEX_TTL = int(os.environ.get('TEAM_FLAG_INDEX_TTL', 300))
+
+class TeamFlagIndex:
+    """
+    Flag lookup over all scraped teams, built once from (name, short_name, flag_url).
+    Resolution order: exact name, short name, longest team name contained
+    token-by-token in the query, same first token, then get_team_flag().
+    The last two are guesses ("Mumbai Indians" gets India's flag) and are
+    only returned when lookup() is called with guess=True.
+    """
+    
+    def __init__(self, teams):
+        self.exact = {}
+        self.abbreviations = {}
+        self.first_token = {}
+        self.names_by_first_token = {}
+        self.resolved = {}
+        for name, short_name, flag_url in teams:
+            if not flag_url:
+                continue
+            name_lower = (name or '').lower().strip()
+            tokens = tuple(name_lower.split())
+            if short_name:
+                self.abbreviations.setdefault(short_name.lower().strip(), flag_url)
+            if not tokens:
+                continue
+            self.exact.setdefault(name_lower, flag_url)
+            self.first_token.setdefault(tokens[0], flag_url)
+            self.names_by_first_token.setdefault(tokens[0], []).append((tokens, flag_url))
+    
+    def lookup(self, team_name, guess=True):
+        """Resolve a flag URL for team_name, or None; guess=False skips the guessing fallbacks"""
+        if not team_name:
+            return None
+        name_lower = team_name.lower().strip()
+        if name_lower not in self.resolved:
+            self.resolved[name_lower] = self.match(team_name, name_lower)
+        flag, guessed = self.resolved[name_lower]
+        return flag if guess or not guessed else None
+    
+    def match(self, team_name, name_lower):
+        """(flag URL or None, whether it is a guess)"""
+        flag = self.exact.get(name_lower) or self.abbreviations.get(name_lower)
+        tokens = name_lower.split()
+        if not flag and tokens:
+            best_length = 0
+            for i, token in enumerate(tokens):
+                for candidate, candidate_flag in self.names_by_first_token.get(token, []):
+                    if len(candidate) > best_length and tuple(tokens[i:i + len(candidate)]) == candidate:
+                        flag, best_length = candidate_flag, len(candidate)
+        if flag:
+            return flag, False
+        if tokens and self.first_token.get(tokens[0]):
+            return self.first_token[tokens[0]], True
+        return get_team_flag(team_name) or None, True
+
+# One index per worker, rebuilt when a team scrape in this worker marks it
+# stale or when the teams table stamp changes (checked every TEAM_FLAG_INDEX_TTL).
+team_flag_index = {'db': None, 'Team': None, 'index': None, 'version': 0, 'loaded_version': -1, 'stamp': None, 'checked_at': 0}
+team_flag_index_lock = threading.Lock()
+
+def init_team_flag_index(db, Team):
+    """Bind the index to the app's db and Team model"""
+    team_flag_index.update({'db': db, 'Team': Team})
+
+def refresh_team_flag_index():
+    """Rebuild the index on next use; call after team scrapes commit"""
+    with team_flag_index_lock:
+        team_flag_index['version'] += 1
+
+def load_team_flag_index():
+    """Return the current TeamFlagIndex, rebuilding it when stale"""
+    db, Team = team_flag_index['db'], team_flag_index['Team']
+    if db is None:
+        return TeamFlagIndex([])
+    now = time.time()
+    with team_flag_index_lock:
+        stale = team_flag_index['loaded_version'] != team_flag_index['version']
+        due_check = now - team_flag_index['checked_at'] >= TEAM_FLAG_INDEX_TTL
+        if team_flag_index['index'] is not None and not stale and not due_check:
+            return team_flag_index['index']
+        team_flag_index['checked_at'] = now
+        version = team_flag_index['version']
+    
+    stamp = tuple(db.session.query(db.func.count(Team.id), db.func.max(Team.updated_at)).one())
+    if stale or stamp != team_flag_index['stamp'] or team_flag_index['index'] is None:
+        rows = db.session.query(Team.name, Team.short_name, Team.flag_url).filter(Team.flag_url.isnot(None)).order_by(Team.id).all()
+        with team_flag_index_lock:
+            team_flag_index.update({'index': TeamFlagIndex(rows), 'stamp': stamp, 'loaded_version': version})
+    return team_flag_index['index']
+
+def resolve_team_flag(team_name, guess=True):
+    """Flag URL for a team name from scraped teams, falling back to TEAM_FLAGS unless guess=False"""
+    if not team_name:
+        return None
+    return load_team_flag_index().lookup(team_name, guess)
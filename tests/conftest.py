@@ -0,0 +1,64 @@
+"""
+Shared fixtures. Tests run against an in-memory SQLite database; set
+TEST_DATABASE_URL to a scratch PostgreSQL database (its tables are dropped)
+to run them against PostgreSQL too, along with the PostgreSQL-only tests.
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import models  # noqa: E402
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+
+# Names for the tuple init_models() returns, in order
+MODEL_NAMES = [
+    'TeamCategory', 'Team', 'Player', 'ScrapeLog', 'ScrapeSetting', 'ProfileScrapeSetting', 'SeriesCategory',
+    'Series', 'SeriesScrapeSetting', 'Match', 'MatchScrapeSetting', 'LiveScoreScrapeSetting', 'PostCategory',
+    'Post', 'AdminUser', 'Page', 'Redirect', 'SiteSettings', 'PushSubscription', 'NotificationLog',
+    'AutoPostSetting', 'AutoPostLog', 'ScrapeJob', 'ScrapeProgress', 'ChangeCounter',
+]
+
+
+def make_database(url):
+    """Flask app, db and models on url, with freshly created tables"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = url
+    db = SQLAlchemy(app)
+    return SimpleNamespace(app=app, db=db, **dict(zip(MODEL_NAMES, models.init_models(db))))
+
+
+def drop_tables(database):
+    database.db.session.remove()
+    database.db.drop_all()
+    with database.db.engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+
+
+@pytest.fixture(params=['sqlite'] + (['postgresql'] if TEST_DATABASE_URL else []))
+def database(request):
+    database = make_database('sqlite://' if request.param == 'sqlite' else TEST_DATABASE_URL)
+    with database.app.app_context():
+        drop_tables(database)
+        database.db.create_all()
+        yield database
+        drop_tables(database)
+
+
+@pytest.fixture
+def pg_database():
+    if not TEST_DATABASE_URL:
+        pytest.skip('TEST_DATABASE_URL is not set')
+    database = make_database(TEST_DATABASE_URL)
+    with database.app.app_context():
+        drop_tables(database)
+        database.db.create_all()
+        yield database
+        drop_tables(database)
@@ -0,0 +1,43 @@
+from scheduler import bulk_upsert_players
+
+
+def add_team(database, name):
+    category = database.TeamCategory(name=f'{name} category', slug=f'{name.lower().replace(" ", "-")}-category', url='/')
+    database.db.session.add(category)
+    database.db.session.flush()
+    team = database.Team(name=name, category_id=category.id)
+    database.db.session.add(team)
+    database.db.session.flush()
+    return team
+
+
+def test_player_on_two_squads_keeps_a_row_per_team(database):
+    db, Player = database.db, database.Player
+    india, kkr = add_team(database, 'India'), add_team(database, 'Kolkata Knight Riders')
+    bulk_upsert_players(db, Player, india.id, [{'player_id': '576', 'name': 'Rohit Sharma', 'role': 'Batsman'}])
+    db.session.commit()
+    bulk_upsert_players(db, Player, kkr.id, [{'player_id': '576', 'name': 'Rohit Sharma'}])
+    db.session.commit()
+
+    # Re-scraping the first squad finds its own row and leaves the other one alone
+    rows, inserted = bulk_upsert_players(db, Player, india.id, [{'player_id': '576', 'name': 'Rohit Sharma'}])
+    db.session.commit()
+
+    assert inserted == 0
+    assert rows[0].team_id == india.id
+    assert sorted(p.team_id for p in Player.query.filter_by(player_id='576')) == sorted([india.id, kkr.id])
+
+
+def test_player_without_id_matches_by_name_within_team(database):
+    db, Player = database.db, database.Player
+    india = add_team(database, 'India')
+    db.session.add(Player(name='Virat Kohli', team_id=india.id))
+    db.session.commit()
+
+    rows, inserted = bulk_upsert_players(db, Player, india.id, [{'player_id': '1413', 'name': 'Virat Kohli'}])
+    db.session.commit()
+
+    assert inserted == 0
+    assert Player.query.count() == 1
+    assert rows[0].player_id == '1413'
+    assert rows[0].slug
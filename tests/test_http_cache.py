@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import scraper
+
+URL = 'https://www.cricbuzz.com/cricket-team/india/2/players'
+
+
+@pytest.fixture
+def cached_page(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, 'HTTP_CACHE_DIR', str(tmp_path))
+    response = SimpleNamespace(headers={'ETag': '"v1"'}, text='<html></html>', content=b'<html></html>')
+    scraper._store_cached_response(scraper.upstream_url(URL), response)
+    return datetime.utcnow()
+
+
+def test_304_is_skipped_when_rows_were_saved_after_caching(cached_page):
+    assert scraper.unchanged_since(URL, cached_page + timedelta(seconds=5))
+
+
+def test_304_is_parsed_when_rows_predate_the_cached_page(cached_page):
+    # The page was fetched but its rows were never committed
+    assert not scraper.unchanged_since(URL, cached_page - timedelta(hours=1))
+
+
+def test_304_is_parsed_when_there_are_no_rows(cached_page):
+    assert not scraper.unchanged_since(URL, None)
+
+
+def test_scraped_roster_is_returned_on_304_without_saved_rows(cached_page, monkeypatch):
+    html = '<a href="/profiles/576/rohit-sharma">Rohit Sharma</a>'
+    monkeypatch.setattr(scraper, 'conditional_get', lambda url, timeout=None: (html, True))
+
+    assert scraper.scrape_players_from_team('https://www.cricbuzz.com/cricket-team/india/2', skip_unchanged=None)
+    assert scraper.scrape_players_from_team('https://www.cricbuzz.com/cricket-team/india/2',
+                                            skip_unchanged=cached_page + timedelta(seconds=5)) == []
@@ -0,0 +1,74 @@
+from scheduler import ingest_matches
+
+INNINGS = [{'innings_num': 1, 'team_name': 'India', 'total_score': '201/5', 'overs': '20', 'batting': [], 'bowling': []}]
+BATTING = [{'player_id': '1', 'name': 'Batter', 'runs': '88'}]
+
+
+def stored_match(database, match_id):
+    database.db.session.expire_all()
+    return database.Match.query.filter_by(match_id=match_id).one()
+
+
+def test_reingest_without_scorecard_keeps_stored_scorecard(database):
+    db, Match = database.db, database.Match
+    ingest_matches(db, Match, [{
+        'match_id': '101', 'team1': 'India', 'team2': 'Australia', 'state': 'Complete',
+        'innings': INNINGS, 'batting': BATTING, 'bowling': [{'player_id': '2', 'name': 'Bowler'}],
+    }])
+    db.session.commit()
+
+    # A live or series scrape carries no scorecard
+    ingest_matches(db, Match, [{
+        'match_id': '101', 'team1': 'India', 'team2': 'Australia', 'state': 'Complete',
+        'result': 'India won by 20 runs',
+    }])
+    db.session.commit()
+
+    match = stored_match(database, '101')
+    assert match.innings_data == INNINGS
+    assert match.batting_data == BATTING
+    assert match.bowling_data == [{'player_id': '2', 'name': 'Bowler'}]
+    assert match.result == 'India won by 20 runs'
+
+
+def test_reingest_with_scorecard_replaces_it(database):
+    db, Match = database.db, database.Match
+    ingest_matches(db, Match, [{'match_id': '102', 'team1': 'India', 'team2': 'Australia', 'innings': INNINGS}])
+    db.session.commit()
+    newer = INNINGS + [{'innings_num': 2, 'team_name': 'Australia', 'total_score': '150/9'}]
+    ingest_matches(db, Match, [{'match_id': '102', 'innings': newer}])
+    db.session.commit()
+
+    assert stored_match(database, '102').innings_data == newer
+
+
+def test_existing_match_without_slug_gets_one(database):
+    db, Match = database.db, database.Match
+    db.session.add(Match(match_id='103'))
+    db.session.commit()
+
+    ingest_matches(db, Match, [{'match_id': '103', 'team1': 'India', 'team2': 'Australia', 'series_name': 'Border Gavaskar Trophy'}])
+    db.session.commit()
+
+    assert stored_match(database, '103').slug == 'india-vs-australia-border-gavaskar-trophy-103'
+
+
+def test_existing_slug_is_kept(database):
+    db, Match = database.db, database.Match
+    db.session.add(Match(match_id='104', slug='custom-slug'))
+    db.session.commit()
+
+    ingest_matches(db, Match, [{'match_id': '104', 'team1': 'India', 'team2': 'Australia'}])
+    db.session.commit()
+
+    assert stored_match(database, '104').slug == 'custom-slug'
+
+
+def test_guessed_flags_are_not_persisted(database):
+    db, Match = database.db, database.Match
+    # 'eng' is a substring of "Bengal" and 'india' of "Mumbai Indians"
+    ingest_matches(db, Match, [{'match_id': '105', 'team1': 'Bengal', 'team2': 'Mumbai Indians'}])
+    db.session.commit()
+
+    match = stored_match(database, '105')
+    assert (match.team1_flag, match.team2_flag) == (None, None)
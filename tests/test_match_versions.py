@@ -0,0 +1,89 @@
+import pytest
+
+import scheduler
+from scheduler import ingest_matches, track_match_changes
+
+
+@pytest.fixture
+def tracked(database, monkeypatch):
+    notified = []
+    monkeypatch.setattr(scheduler, 'notify_match_changes', lambda db, match_ids: notified.append(set(match_ids)))
+    track_match_changes(database.db, database.Match)
+    database.notified = notified
+    return database
+
+
+def version_of(database, match_id):
+    database.db.session.expire_all()
+    return database.Match.query.filter_by(match_id=match_id).one().change_version
+
+
+def test_orm_score_change_is_stamped_and_notified(tracked):
+    db, Match = tracked.db, tracked.Match
+    db.session.add(Match(match_id='201', team1_score='10/0'))
+    db.session.commit()
+    first = version_of(tracked, '201')
+
+    match = Match.query.filter_by(match_id='201').one()
+    match.team1_score = '45/1'
+    db.session.commit()
+
+    assert first and version_of(tracked, '201') > first
+    assert tracked.notified == [{'201'}, {'201'}]
+
+
+def test_orm_write_without_score_change_keeps_version(tracked):
+    db, Match = tracked.db, tracked.Match
+    db.session.add(Match(match_id='202', team1_score='10/0'))
+    db.session.commit()
+    first = version_of(tracked, '202')
+
+    match = Match.query.filter_by(match_id='202').one()
+    match.team1_score = '10/0'
+    match.venue = 'Eden Gardens'
+    db.session.commit()
+
+    assert version_of(tracked, '202') == first
+    assert tracked.notified == [{'202'}]
+
+
+def test_ingest_stamps_only_changed_matches(tracked):
+    db, Match = tracked.db, tracked.Match
+    ingest_matches(db, Match, [
+        {'match_id': '203', 'team1': 'India', 'team2': 'Australia', 'state': 'In Progress', 'team1_score': '10/0'},
+        {'match_id': '204', 'team1': 'England', 'team2': 'Pakistan', 'state': 'In Progress', 'team1_score': '99/2'},
+    ])
+    db.session.commit()
+    unchanged = version_of(tracked, '204')
+
+    ingest_matches(db, Match, [
+        {'match_id': '203', 'team1_score': '45/1'},
+        {'match_id': '204', 'team1_score': '99/2'},
+    ])
+    db.session.commit()
+
+    assert version_of(tracked, '203') > unchanged
+    assert version_of(tracked, '204') == unchanged
+    assert tracked.notified == [{'203', '204'}, {'203'}]
+
+
+def test_rolled_back_changes_are_not_notified(tracked):
+    db, Match = tracked.db, tracked.Match
+    db.session.add(Match(match_id='205', team1_score='10/0'))
+    db.session.flush()
+    db.session.rollback()
+    db.session.commit()
+
+    assert tracked.notified == []
+
+
+def test_counter_is_not_touched_until_commit(tracked):
+    db, Match, ChangeCounter = tracked.db, tracked.Match, tracked.ChangeCounter
+    counter = lambda: db.session.query(ChangeCounter.value).filter_by(name=scheduler.MATCH_CHANGE_COUNTER).scalar() or 0
+    ingest_matches(db, Match, [{'match_id': '206', 'team1': 'India', 'team2': 'Australia', 'team1_score': '10/0'}])
+    db.session.flush()
+
+    # The counter row is only locked by the short stamping transaction after the data commits
+    assert counter() == 0
+    db.session.commit()
+    assert counter() == 1 and version_of(tracked, '206') == 1
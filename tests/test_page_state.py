@@ -0,0 +1,74 @@
+import json
+
+from page_state import PageState, iter_flight_values, series_match_rows
+
+
+def flight_page(*chunks):
+    """HTML that streams chunks through self.__next_f.push, as Next.js pages do"""
+    return ''.join(f'<script>self.__next_f.push([1,{json.dumps(chunk)}])</script>' for chunk in chunks)
+
+
+def text_row(row_id, body):
+    return f'{row_id}:T{len(body.encode("utf-8")):x},{body}'
+
+
+def test_rows_split_across_pushes_are_joined():
+    state = PageState(flight_page('0:{"matchHeader":{"matchId":1', '01}}\n1:["$","div",null,{"seriesDesc":"IPL"}]\n'))
+
+    assert state.first('matchHeader') == {'matchId': 101}
+    assert state.first('seriesDesc') == 'IPL'
+
+
+def test_text_rows_are_skipped_by_byte_length():
+    # The text holds multi-byte characters and JSON-looking content that must not be parsed
+    body = 'Dhoni’s {"fake":true} 🏏\nline two'
+    stream = '0:{"a":1}\n' + text_row('1', body) + '2:{"b":2}\n'
+
+    assert list(iter_flight_values(stream)) == [{'a': 1}, {'b': 2}]
+
+
+def test_truncated_text_row_ends_the_stream():
+    html = '<script>self.__next_f.push([1,"0:{\\"a\\":1}\\n1:T"])</script>'
+
+    assert PageState(html).dicts == [{'a': 1}]
+
+
+def test_malformed_rows_are_skipped():
+    stream = '0:{"a":1}\n1:Tzz,oops\n2:{"broken"\n3:{"b":2}\nnot a row\n4:{"c":3'
+
+    assert list(iter_flight_values(stream)) == [{'a': 1}, {'b': 2}]
+
+
+def test_truncated_html_push_is_ignored():
+    html = flight_page('0:{"a":1}\n') + '<script>self.__next_f.push([1,"1:{\\"b\\":'
+
+    assert PageState(html).dicts == [{'a': 1}]
+
+
+def test_next_data_script_is_read_without_a_flight_stream():
+    html = '<script id="__NEXT_DATA__" type="application/json">{"props":{"matchHeader":{"matchId":7}}}</script>'
+
+    assert PageState(html).first('matchHeader') == {'matchId': 7}
+    assert not PageState('<html></html>')
+
+
+def test_series_match_rows_attribute_scores_to_their_match():
+    page = {
+        'matchScoreMap': {'2': {'team1Score': {'inngs1': {'runs': 180, 'wickets': 4, 'overs': 20}}}},
+        'matches': [
+            {'matchInfo': {'matchId': 1, 'seriesId': 9, 'state': 'Complete', 'team1': {'teamName': 'India'}},
+             'matchScore': {'team1Score': {'inngs1': {'runs': 200, 'wickets': 5, 'overs': 20}},
+                            'team2Score': {'inngs1': {'runs': 150, 'wickets': 10, 'overs': 18.2}}}},
+            {'matchInfo': {'matchId': 2, 'seriesId': 9, 'state': 'In Progress'}},
+            {'matchInfo': {'matchId': 3, 'seriesId': 9, 'state': 'Upcoming'},
+             'matchScore': {'team1Score': {'inngs1': {'runs': 1}}}},
+            {'matchInfo': {'matchId': 4, 'seriesId': 8, 'state': 'Complete'}},
+        ],
+    }
+    rows = {row['match_id']: row for row in series_match_rows(PageState(flight_page('0:' + json.dumps(page) + '\n')), 9)}
+
+    assert list(rows) == ['1', '2', '3']
+    assert (rows['1']['team1_score'], rows['1']['team2_score']) == ('200/5 (20)', '150/10 (18.2)')
+    assert (rows['2']['team1_score'], rows['2']['team2_score']) == ('180/4 (20)', '')
+    assert rows['3']['team1_score'] == ''
+    assert rows['1']['team1'] == 'India'
@@ -0,0 +1,68 @@
+"""
+The hot lookups must be answered from the indexes migration 3 adds. Runs
+only against PostgreSQL (TEST_DATABASE_URL), on a few thousand seeded rows so
+the planner prefers an index over a sequential scan.
+"""
+import pytest
+from sqlalchemy import func, text
+from sqlalchemy.dialects import postgresql
+
+from migrations import run_migrations
+
+SEED = [
+    "INSERT INTO team_categories (name, slug, url) VALUES ('International', 'international', '/')",
+    "INSERT INTO teams (name, team_id, category_id) SELECT 'Team ' || n, n::text, 1 FROM generate_series(1, 2000) n",
+    "INSERT INTO players (name, player_id, team_id) SELECT 'Player ' || n, n::text, 1 + n % 2000 FROM generate_series(1, 20000) n",
+    "INSERT INTO series_categories (name, slug, url) VALUES ('International', 'international', '/')",
+    "INSERT INTO series (name, category_id) SELECT 'Series ' || n, 1 FROM generate_series(1, 500) n",
+    "INSERT INTO matches (match_id, state, series_id, updated_at) "
+    "SELECT n::text, CASE WHEN n % 1000 = 0 THEN 'In Progress' ELSE 'Complete' END, 1 + n % 500, now() - n * interval '1 minute' "
+    "FROM generate_series(1, 20000) n",
+    "INSERT INTO posts (title, slug, is_published, created_at) "
+    "SELECT 'Post ' || n, 'post-' || n, n % 10 <> 0, now() - n * interval '1 hour' FROM generate_series(1, 20000) n",
+    "INSERT INTO redirects (old_url, new_url, is_active) SELECT '/Old/' || n, '/new/' || n, true FROM generate_series(1, 20000) n",
+]
+
+
+@pytest.fixture
+def seeded(pg_database):
+    run_migrations(pg_database.db)
+    with pg_database.db.engine.begin() as conn:
+        for statement in SEED:
+            conn.execute(text(statement))
+        conn.execute(text("ANALYZE"))
+    return pg_database
+
+
+def plan_indexes(db, query):
+    """Names of the indexes the plan for query scans"""
+    sql = str(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True}))
+    plan = db.session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    names, nodes = set(), [plan[0]['Plan']]
+    while nodes:
+        node = nodes.pop()
+        if 'Index Name' in node:
+            names.add(node['Index Name'])
+        nodes.extend(node.get('Plans', []))
+    return names
+
+
+def hot_queries(m):
+    return {
+        'ix_players_player_id': m.Player.query.filter_by(player_id='1234'),
+        'ix_players_team_id': m.Player.query.filter_by(team_id=42),
+        'ix_teams_team_id': m.Team.query.filter_by(team_id='42'),
+        'ix_matches_state': m.Match.query.filter_by(state='In Progress'),
+        'ix_matches_updated_at': m.Match.query.order_by(m.Match.updated_at.desc()).limit(20),
+        'ix_matches_series_id': m.Match.query.filter_by(series_id=7),
+        'ix_posts_is_published_created_at': m.Post.query.filter_by(is_published=True).order_by(m.Post.created_at.desc()).limit(10),
+        'ix_redirects_lower_old_url': m.Redirect.query.filter(func.lower(m.Redirect.old_url) == '/old/1234'),
+    }
+
+
+@pytest.mark.parametrize('index_name', [
+    'ix_players_player_id', 'ix_players_team_id', 'ix_teams_team_id', 'ix_matches_state',
+    'ix_matches_updated_at', 'ix_matches_series_id', 'ix_posts_is_published_created_at', 'ix_redirects_lower_old_url',
+])
+def test_hot_query_uses_index(seeded, index_name):
+    assert index_name in plan_indexes(seeded.db, hot_queries(seeded)[index_name])
@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+import scraper
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    scraper._result_cache.clear()
+    yield
+    scraper._result_cache.clear()
+
+
+def fetcher(calls):
+    def fetch():
+        calls.append(time.time())
+        return {'success': True, 'value': len(calls)}
+    return fetch
+
+
+def test_shorter_ttl_applies_to_a_stored_entry():
+    calls = []
+    scraper.get_cached_result('scorecard:1', fetcher(calls), scraper.SCORECARD_UPCOMING_TTL)
+    scraper._result_cache['scorecard:1']['fetched_at'] -= scraper.SCORECARD_LIVE_TTL + 1
+
+    # The match went live: the entry is stale under the live ttl and gets refreshed
+    scraper.get_cached_result('scorecard:1', fetcher(calls), scraper.SCORECARD_LIVE_TTL)
+    scraper._result_cache['scorecard:1']['event'].wait(5)
+    assert len(calls) == 2
+    assert scraper._result_cache['scorecard:1']['ttl'] == scraper.SCORECARD_LIVE_TTL
+
+
+def test_cache_evicts_least_recently_read(monkeypatch):
+    monkeypatch.setattr(scraper, 'RESULT_CACHE_MAX_ENTRIES', 3)
+    calls = []
+    for key in ('a', 'b', 'c'):
+        scraper.get_cached_result(key, fetcher(calls), 60)
+    scraper.get_cached_result('a', fetcher(calls), 60)
+    scraper.get_cached_result('d', fetcher(calls), 60)
+
+    assert list(scraper._result_cache) == ['c', 'a', 'd']
+
+
+def test_non_numeric_scorecard_ids_are_not_scraped_or_cached(monkeypatch):
+    monkeypatch.setattr(scraper, 'scrape_scorecard', lambda match_id: pytest.fail('scraped'))
+
+    assert scraper.get_scorecard_cached('no-such-match')['success'] is False
+    assert not scraper._result_cache
+
+
+def test_scrape_timing_only_reaches_the_request_that_scraped(monkeypatch):
+    monkeypatch.setattr(scraper, 'scrape_scorecard',
+                        lambda match_id: {'success': True, 'match_id': match_id, 'timing': {'total_ms': 1.0}})
+
+    assert scraper.get_scorecard_cached('1')['timing'] == {'total_ms': 1.0}
+    assert 'timing' not in scraper.get_scorecard_cached('1')
+    assert 'timing' not in scraper._result_cache['scorecard:1']['value']
@@ -0,0 +1,52 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from scheduler import run_roster_scrape
+
+
+def fake_scraper(rosters, calls):
+    def scrape_players_from_team(team_url, skip_unchanged=False):
+        calls.append((team_url, skip_unchanged))
+        return rosters.get(team_url, [])
+
+    def scrape_concurrently(items, func):
+        for item in items:
+            yield item, func(item), None
+
+    return SimpleNamespace(scrape_players_from_team=scrape_players_from_team, scrape_concurrently=scrape_concurrently)
+
+
+def add_team(database):
+    category = database.TeamCategory(name='International', slug='international', url='/')
+    database.db.session.add(category)
+    database.db.session.flush()
+    team = database.Team(name='India', category_id=category.id, team_url='/cricket-team/india/2')
+    database.db.session.add(team)
+    database.db.session.commit()
+    return team
+
+
+def test_roster_ingest_time_is_recorded_and_passed_on(database):
+    db, Player = database.db, database.Player
+    team = add_team(database)
+    rosters = {team.team_url: [{'player_id': '576', 'name': 'Rohit Sharma'}]}
+    calls = []
+
+    run_roster_scrape(db, Player, fake_scraper(rosters, calls), [team], skip_unchanged=True)
+    scraped_at = team.players_scraped_at
+    # A profile scrape touches the players but not the roster ingest time
+    Player.query.filter_by(player_id='576').one().born = '1987'
+    db.session.commit()
+    run_roster_scrape(db, Player, fake_scraper(rosters, calls), [team], skip_unchanged=True)
+
+    assert calls[0] == (team.team_url, None)
+    assert calls[1][1] == scraped_at and isinstance(scraped_at, datetime)
+
+
+def test_failed_fetch_does_not_record_an_ingest(database):
+    db, Player = database.db, database.Player
+    team = add_team(database)
+
+    run_roster_scrape(db, Player, fake_scraper({}, []), [team], skip_unchanged=True)
+
+    assert team.players_scraped_at is None
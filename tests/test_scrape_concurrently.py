@@ -0,0 +1,27 @@
+import threading
+import time
+
+import scraper
+
+
+def test_closing_early_does_not_wait_for_queued_fetches(monkeypatch):
+    monkeypatch.setattr(scraper.politeness_limiter, 'wait', lambda: None)
+    release = threading.Event()
+    ran = []
+
+    def fetch(item):
+        ran.append(item)
+        if item:
+            release.wait(5)
+        return item
+
+    results = scraper.scrape_concurrently(range(20), fetch, max_workers=2)
+    assert next(results)[1] == 0
+    started = time.monotonic()
+    results.close()
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert elapsed < 1
+    # Queued fetches were cancelled rather than run
+    assert len(ran) < 20
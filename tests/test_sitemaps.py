@@ -0,0 +1,39 @@
+import gzip
+
+import pytest
+
+import sitemaps
+
+
+@pytest.fixture
+def sitemap_db(database, tmp_path, monkeypatch):
+    monkeypatch.setattr(sitemaps, 'SITEMAP_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(sitemaps, 'sitemap_models', {})
+    sitemaps.init_sitemaps(database.db, database.PostCategory, database.Team, database.Player,
+                           database.Series, database.Match, database.Post, database.Page)
+    return database
+
+
+def read_sitemap(name):
+    with gzip.open(sitemaps.get_sitemap_file(name), 'rt') as f:
+        return f.read()
+
+
+def test_matches_sitemap_lists_recent_matches_page(sitemap_db):
+    sitemap_db.db.session.add(sitemap_db.Match(match_id='101', slug='india-vs-australia-101'))
+    sitemap_db.db.session.commit()
+
+    xml = read_sitemap('sitemap-matches.xml')
+    assert f'<loc>{sitemaps.SITEMAP_BASE_URL}/recent-matches</loc>' in xml
+    assert f'<loc>{sitemaps.SITEMAP_BASE_URL}/cricket-match/india-vs-australia-101</loc>' in xml
+
+
+def test_static_pages_only_on_first_shard(sitemap_db, monkeypatch):
+    monkeypatch.setattr(sitemaps, 'SITEMAP_SHARD_SIZE', 1)
+    for match_id in ('101', '102'):
+        sitemap_db.db.session.add(sitemap_db.Match(match_id=match_id, slug=f'match-{match_id}'))
+    sitemap_db.db.session.commit()
+
+    assert '/recent-matches<' in read_sitemap('sitemap-matches.xml')
+    assert '/recent-matches<' not in read_sitemap('sitemap-matches-2.xml')
+
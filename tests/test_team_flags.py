@@ -0,0 +1,19 @@
+from team_flags import TeamFlagIndex, TEAM_FLAGS
+
+INDIA = 'https://static.cricbuzz.com/india.jpg'
+MUMBAI = 'https://static.cricbuzz.com/mumbai-indians.jpg'
+INDEX = TeamFlagIndex([('India', 'IND', INDIA), ('Mumbai Indians', 'MI', MUMBAI), ('England', 'ENG', None)])
+
+
+def test_exact_abbreviation_and_token_hits_are_not_guesses():
+    assert INDEX.lookup('India', guess=False) == INDIA
+    assert INDEX.lookup('MI', guess=False) == MUMBAI
+    assert INDEX.lookup('India Women', guess=False) == INDIA
+
+
+def test_guesses_are_only_returned_when_asked_for():
+    # A TEAM_FLAGS substring ('eng' in "Bengal") and a shared first word ("Mumbai")
+    assert INDEX.lookup('Bengal', guess=False) is None
+    assert INDEX.lookup('Bengal') == TEAM_FLAGS['eng']
+    assert INDEX.lookup('Mumbai', guess=False) is None
+    assert INDEX.lookup('Mumbai') == MUMBAI
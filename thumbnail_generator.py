@@ -1,5 +1,4 @@
 from PIL import Image, ImageDraw, ImageFont
-import requests
 from io import BytesIO
 import os
 
@@ -12,7 +11,8 @@ def download_image(url):
     try:
         if not url:
             return None
-        response = requests.get(url, timeout=5)
+        from scraper import http_get
+        response = http_get(url, timeout=5)
         if response.status_code == 200:
             return Image.open(BytesIO(response.content))
     except: